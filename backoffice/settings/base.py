@@ -26,6 +26,18 @@ environ.Env.read_env(os.path.join(BASE_DIR, ".env"))
 
 OPENAI_API_KEY = env("OPENAI_API_KEY", default="")
 
+# 주간 분석 배치의 Velog 게시물 본문 로컬 캐시 (scraping/velog/cache.py)
+# GitHub Actions 러너에서는 run-weekly-analysis.yaml 이 주 단위 actions/cache 로 cache 디렉터리를 보존
+VELOG_POST_CACHE_PATH = env(
+    "VELOG_POST_CACHE_PATH",
+    default=str(BASE_DIR / "cache" / "velog_posts.sqlite3"),
+)
+VELOG_POST_CACHE_MAX_MB = env.int("VELOG_POST_CACHE_MAX_MB", default=256)
+
+# 야간 배치의 모든 프로세스와 신규 사용자 우선 처리 레인이 함께 쓰는 velog 초당 요청 수 상한
+# (scraping/rate_limiter.py SharedRateBudget), 0 이면 프로세스별 rate limiter 만 사용
+VELOG_SHARED_RATE_LIMIT = env.float("VELOG_SHARED_RATE_LIMIT", default=100.0)
+
 AWS_ACCESS_KEY_ID = env("AWS_ACCESS_KEY_ID", default="")
 AWS_SECRET_ACCESS_KEY = env("AWS_SECRET_ACCESS_KEY", default="")
 AWS_REGION = env("AWS_REGION", default="ap-northeast-2")
@@ -77,6 +89,7 @@ INSTALLED_APPS = [
     "posts",
     "noti",  # 공지와 알림 관련 도메인
     "insight",  # 게시글, 트랜드 인사이트 관련 도메인
+    "scraping",  # 벨로그 스크래핑 배치와 작업 큐 관련 도메인
 ]
 
 MIDDLEWARE = [
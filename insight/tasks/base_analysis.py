@@ -5,7 +5,9 @@ from datetime import datetime
 from typing import Any, Generic, TypeVar
 
 import aiohttp
+from django.conf import settings
 
+from scraping.velog.cache import PostBodyCache
 from scraping.velog.client import VelogClient
 from utils.utils import get_previous_week_range
 
@@ -19,6 +21,7 @@ class AnalysisContext:
     week_start: datetime
     week_end: datetime
     velog_client: VelogClient
+    post_cache: PostBodyCache | None = None
 
 
 @dataclass
@@ -47,6 +50,14 @@ class BaseBatchAnalyzer(ABC, Generic[T]):
 
             # 2. 데이터 수집
             raw_data = await self._fetch_data(context)
+            if context.post_cache is not None:
+                self.logger.info(
+                    "Velog post cache (%s)", context.post_cache.summary()
+                )
+            self.logger.info(
+                "Velog requests (%s)",
+                context.velog_client.service.coalescer.summary(),
+            )
             if not raw_data:
                 self.logger.info("No data to process")
                 return AnalysisResult(
@@ -84,11 +95,18 @@ class BaseBatchAnalyzer(ABC, Generic[T]):
             access_token="dummy_access_token",
             refresh_token="dummy_refresh_token",
         )
+        # 재실행이나 다른 분석에서 이미 가져온 게시물 본문은 다시 요청하지 않음
+        post_cache = PostBodyCache(
+            settings.VELOG_POST_CACHE_PATH,
+            max_bytes=settings.VELOG_POST_CACHE_MAX_MB * 1024 * 1024,
+        )
+        velog_client.set_post_cache(post_cache)
 
         return AnalysisContext(
             week_start=week_start,
             week_end=week_end,
             velog_client=velog_client,
+            post_cache=post_cache,
         )
 
     @abstractmethod
@@ -92,7 +92,12 @@ class WeeklyNewsletterBatch:
                     is_active=True,
                     email__isnull=False,
                 )
-                .values("id", "email", "username")
+                .values(
+                    "id",
+                    "email",
+                    "username",
+                    "token_health__consecutive_failures",
+                )
                 .distinct("email")
             )
 
@@ -260,10 +265,16 @@ class WeeklyNewsletterBatch:
                 user_ids
             )
 
-            # insight_userweeklytrend가 없는 유저는 토큰 만료 유저로 간주
-            expired_token_user_ids = set(user_ids) - set(
-                users_weekly_trends_chunk.keys()
-            )
+            # 스크래핑 배치가 기록한 토큰 상태로 토큰 만료 유저 판단
+            # 토큰 상태 기록이 없으면 insight_userweeklytrend가 없는 유저를 토큰 만료 유저로 간주
+            expired_token_user_ids = set()
+            for user in user_chunk:
+                token_failures = user.get("token_health__consecutive_failures")
+                if token_failures is None:
+                    if user["id"] not in users_weekly_trends_chunk:
+                        expired_token_user_ids.add(user["id"])
+                elif token_failures > 0:
+                    expired_token_user_ids.add(user["id"])
 
             if expired_token_user_ids:
                 logger.info(
@@ -76,7 +76,9 @@ class WeeklyTrendAnalyzer(BaseBatchAnalyzer[WeeklyTrendInsight]):
             post_data_list = []
             for post in trending_posts:
                 try:
-                    detail = await context.velog_client.get_post(post.id)
+                    detail = await context.velog_client.get_post(
+                        post.id, post.updated_at
+                    )
                     body = detail.body if detail and detail.body else ""
 
                     if not body:
@@ -284,7 +284,7 @@ class UserWeeklyAnalyzer(BaseBatchAnalyzer[dict]):
                     is_active=True,
                 )
                 .exclude(email="")
-                .values("id", "username")
+                .values("id", "username", "token_health__consecutive_failures")
             )
 
             self.all_target_users = {user["id"] for user in users}
@@ -299,10 +299,19 @@ class UserWeeklyAnalyzer(BaseBatchAnalyzer[dict]):
                 username = user["username"]
 
                 try:
-                    # 토큰 유효성 확인
-                    if not await self._check_user_token_validity(
-                        user_id, context
-                    ):
+                    # 토큰 유효성 확인, 스크래핑 배치가 기록한 토큰 상태를 우선 사용
+                    token_failures = user.get(
+                        "token_health__consecutive_failures"
+                    )
+                    if token_failures is None:
+                        # 토큰 상태 기록이 없는 사용자는 오늘자 통계로 판단
+                        is_valid_token = await self._check_user_token_validity(
+                            user_id, context
+                        )
+                    else:
+                        is_valid_token = token_failures == 0
+
+                    if not is_valid_token:
                         self.expired_token_users.add(user_id)
                         continue
 
@@ -370,7 +379,7 @@ class UserWeeklyAnalyzer(BaseBatchAnalyzer[dict]):
                 user_id=user_id,
                 released_at__range=(context.week_start, context.week_end),
                 is_active=True,
-            ).values("post_uuid")
+            ).values("post_uuid", "updated_at")
         )
 
         if not posts:
@@ -379,9 +388,10 @@ class UserWeeklyAnalyzer(BaseBatchAnalyzer[dict]):
         velog_posts = []
         for post_data in posts:
             try:
-                # Velog 게시글 본문 조회
+                # Velog 게시글 본문 조회, 배치가 제목 등의 변경을 기록한 뒤에 캐시된 본문만 재사용
                 velog_post = await context.velog_client.get_post(
-                    str(post_data["post_uuid"])
+                    str(post_data["post_uuid"]),
+                    changed_at=post_data["updated_at"],
                 )
                 if velog_post:
                     velog_posts.append(velog_post)
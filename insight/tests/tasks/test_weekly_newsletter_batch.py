@@ -199,6 +199,45 @@ class TestWeeklyNewsletterBatch:
             # 제목 포맷 검증
             assert "벨로그 대시보드 주간 뉴스레터" in newsletters[0].email_message.subject
 
+    @patch("insight.tasks.weekly_newsletter_batch.logger")
+    def test_build_newsletters_uses_token_health(
+        self, mock_logger, newsletter_batch, user
+    ):
+        """토큰 상태 기록이 있으면 개인 트렌드 유무가 아닌 토큰 상태로 만료를 판단하는지 테스트"""
+        user_chunk = [
+            {
+                "id": user.id,
+                "email": user.email,
+                "username": user.username,
+                "token_health__consecutive_failures": 1,
+            }
+        ]
+
+        with (
+            patch.object(
+                newsletter_batch,
+                "_get_users_weekly_trend_chunk",
+                return_value={user.id: MagicMock()},
+            ),
+            patch.object(
+                newsletter_batch, "_get_user_weekly_trend_html"
+            ) as mock_get_html,
+            patch.object(
+                newsletter_batch,
+                "_get_newsletter_html",
+                return_value="<div>Final Newsletter HTML</div>",
+            ) as mock_get_newsletter_html,
+        ):
+            newsletter_batch._build_newsletters(
+                user_chunk, "<div>Weekly Trend HTML</div>"
+            )
+
+        mock_get_html.assert_not_called()
+        assert (
+            mock_get_newsletter_html.call_args.kwargs["is_expired_token_user"]
+            is True
+        )
+
     @patch("insight.tasks.weekly_newsletter_batch.logger")
     def test_send_newsletters_success(
         self, mock_logger, newsletter_batch, sample_newsletters
@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -80,3 +80,45 @@ class TestWeeklyUserTrendFetch:
             mock_logger.warning.assert_any_call(
                 "User %s token expired - no today stats", 1
             )
+
+    @patch("insight.tasks.weekly_user_trend_analysis.User.objects.filter")
+    async def test_fetch_data_uses_token_health(
+        self,
+        mock_users,
+        analyzer_user,
+        mock_context,
+    ):
+        """토큰 상태 기록이 있으면 오늘자 통계 확인 없이 만료 여부를 판단하는지 테스트"""
+        mock_users.return_value.exclude.return_value.values.return_value = [
+            {
+                "id": 1,
+                "username": "expired",
+                "token_health__consecutive_failures": 2,
+            },
+            {
+                "id": 2,
+                "username": "healthy",
+                "token_health__consecutive_failures": 0,
+            },
+        ]
+
+        with (
+            patch.object(
+                analyzer_user, "_check_user_token_validity"
+            ) as mock_check,
+            patch.object(
+                analyzer_user,
+                "_fetch_user_weekly_new_posts",
+                return_value=[],
+            ),
+            patch.object(
+                analyzer_user,
+                "_calculate_user_weekly_total_stats",
+                return_value=MagicMock(),
+            ),
+        ):
+            result = await analyzer_user._fetch_data(mock_context)
+
+        mock_check.assert_not_called()
+        assert analyzer_user.expired_token_users == {1}
+        assert [data.user_id for data in result] == [2]
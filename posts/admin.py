@@ -71,9 +71,10 @@ class PostDailyStatisticsAdmin(admin.ModelAdmin):
         "date",
         "daily_view_count",
         "daily_like_count",
+        "is_carried",
         "created_at",
     ]
-    list_filter = ["date"]
+    list_filter = ["date", "is_carried"]
     search_fields = ["post__title", "post__user__id", "post__user__email"]
 
     def get_queryset(self, request):
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.6 on 2026-10-17 13:28
+
+from django.db import migrations
+
+# unique 제약 추가 전, (post_id, date) 중복 통계 중 가장 최근 row 만 남김
+DELETE_DUPLICATED_DAILY_STATISTICS = """
+DELETE FROM posts_postdailystatistics AS older
+USING posts_postdailystatistics AS newer
+WHERE older.post_id = newer.post_id
+  AND older.date = newer.date
+  AND older.id < newer.id;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("posts", "0005_post_is_active"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            DELETE_DUPLICATED_DAILY_STATISTICS,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AlterUniqueTogether(
+            name="postdailystatistics",
+            unique_together={("post", "date")},
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("posts", "0006_alter_postdailystatistics_unique_together"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["user", "is_active"],
+                name="posts_post_user_id_39dedb_idx",
+            ),
+        ),
+    ]
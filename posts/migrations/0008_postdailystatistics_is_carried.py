@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-17 05:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("posts", "0007_post_posts_post_user_id_39dedb_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="postdailystatistics",
+            name="is_carried",
+            field=models.BooleanField(
+                default=False,
+                help_text="통계를 새로 가져오지 않고 마지막 조회수를 그대로 기록한 row 인지 여부, 일별 증가량 계산에서 제외합니다.",
+                verbose_name="이전 통계 유지 여부",
+            ),
+        ),
+    ]
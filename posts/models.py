@@ -45,6 +45,10 @@ class Post(TimeStampedModel):
     class Meta:
         verbose_name = "게시글"
         verbose_name_plural = "게시글 목록"
+        indexes = [
+            # 배치의 사용자별 게시글 활성/비활성 상태 동기화용
+            models.Index(fields=["user", "is_active"]),
+        ]
 
 
 class PostDailyStatistics(TimeStampedModel):
@@ -76,6 +80,13 @@ class PostDailyStatistics(TimeStampedModel):
         default=0,
         verbose_name="일별 좋아요 수",
     )
+    is_carried = models.BooleanField(
+        blank=False,
+        null=False,
+        default=False,
+        verbose_name="이전 통계 유지 여부",
+        help_text="통계를 새로 가져오지 않고 마지막 조회수를 그대로 기록한 row 인지 여부, 일별 증가량 계산에서 제외합니다.",
+    )
 
     objects = models.Manager()
     timescale = TimescaleManager()
@@ -86,3 +97,5 @@ class PostDailyStatistics(TimeStampedModel):
     class Meta:
         verbose_name = "게시글 일별 통계"
         verbose_name_plural = "게시글 일별 통계 목록"
+        # 배치의 INSERT ... ON CONFLICT (post_id, date) upsert 를 위한 제약
+        unique_together = ["post", "date"]
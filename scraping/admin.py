@@ -0,0 +1,124 @@
+import uuid
+from typing import Any
+
+from django.contrib import admin
+from django.db.models import Count, OuterRef, QuerySet, Subquery
+from django.http import HttpRequest, HttpResponse
+from django.urls import reverse
+from django.utils.html import format_html
+from django.utils.safestring import SafeString
+
+from scraping.models import ScrapeCheckpoint, ScrapeJob
+
+
+@admin.register(ScrapeJob)
+class ScrapeJobAdmin(admin.ModelAdmin):  # type: ignore
+    """
+    스크래핑 작업 상태 페이지
+    ?run_id=<실행 ID> 로 들어오면 해당 작업 묶음의 상태별 진행률을 보여주고,
+    대기 또는 진행 중인 작업이 남아 있는 동안 REFRESH_SECONDS 마다 자동으로 새로고침
+    """
+
+    # 진행 중인 작업 묶음 상태 페이지의 자동 새로고침 주기
+    REFRESH_SECONDS = 5
+
+    change_list_template = "admin/scraping/scrapejob/change_list.html"
+    list_display = [
+        "id",
+        "user_link",
+        "status",
+        "get_step",
+        "attempts",
+        "lease_owner",
+        "created_at",
+        "finished_at",
+        "last_error",
+        "run_id",
+    ]
+    list_filter = ["status"]
+    search_fields = ["run_id", "user__email"]
+    ordering = ["-id"]
+    readonly_fields = [
+        "run_id",
+        "user",
+        "attempts",
+        "lease_owner",
+        "lease_expires_at",
+        "finished_at",
+        "last_error",
+    ]
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[ScrapeJob]:
+        """쿼리셋 최적화: 사용자와 작업 묶음의 마지막 완료 단계를 함께 조회"""
+        step = ScrapeCheckpoint.objects.filter(
+            run_id=OuterRef("run_id"), user=OuterRef("user")
+        ).values("step")[:1]
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .annotate(checkpoint_step=Subquery(step))
+        )
+
+    @admin.display(description="사용자")  # type: ignore
+    def user_link(self, obj: ScrapeJob) -> SafeString:
+        url = reverse("admin:users_user_change", args=[obj.user.id])
+        return format_html(
+            '<a target="_blank" href="{}" style="min-width: 80px; display: block;">{}</a>',
+            url,
+            obj.user.email,
+        )
+
+    @admin.display(description="마지막 완료 단계")  # type: ignore
+    def get_step(self, obj: ScrapeJob) -> str | None:
+        if not obj.checkpoint_step:
+            return None
+        label: str = ScrapeCheckpoint.Step(obj.checkpoint_step).label
+        return label
+
+    def get_run_progress(self, run_id: uuid.UUID) -> dict[str, int] | None:
+        """작업 묶음의 상태별 작업 수, 작업이 없으면 None"""
+        counts = dict(
+            ScrapeJob.objects.filter(run_id=run_id)
+            .values_list("status")
+            .annotate(count=Count("id"))
+        )
+        total = sum(counts.values())
+        if not total:
+            return None
+
+        progress = {
+            status: counts.get(status, 0) for status in ScrapeJob.Status.values
+        }
+        finished = (
+            progress[ScrapeJob.Status.DONE] + progress[ScrapeJob.Status.FAILED]
+        )
+        return {
+            "total": total,
+            "pending": progress[ScrapeJob.Status.PENDING],
+            "running": progress[ScrapeJob.Status.RUNNING],
+            "done": progress[ScrapeJob.Status.DONE],
+            "failed": progress[ScrapeJob.Status.FAILED],
+            "percent": finished * 100 // total,
+        }
+
+    def changelist_view(
+        self,
+        request: HttpRequest,
+        extra_context: dict[str, Any] | None = None,
+    ) -> HttpResponse:
+        extra_context = extra_context or {}
+        try:
+            run_id = uuid.UUID(request.GET.get("run_id", ""))
+        except ValueError:
+            run_id = None
+
+        if run_id is not None:
+            progress = self.get_run_progress(run_id)
+            if progress is not None:
+                extra_context["run_id"] = run_id
+                extra_context["run_progress"] = progress
+                if progress["pending"] or progress["running"]:
+                    extra_context["refresh_seconds"] = self.REFRESH_SECONDS
+
+        return super().changelist_view(request, extra_context=extra_context)
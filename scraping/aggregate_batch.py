@@ -8,26 +8,45 @@
 - python ./scraping/aggregate_batch.py
 - python ./scraping/aggregate_batch.py --min-group 1 --max-group 1000
 - poetry run python ./scraping/aggregate_batch.py --min-group 10 --max-group 20
+- poetry run python ./scraping/aggregate_batch.py --user-concurrency 5
+- --user-concurrency 는 프로세스 당 동시에 처리할 사용자 수, 세션과 세마포어는 공유
+- --stats-batch-size 는 하나의 요청에 묶을 게시글 통계 수, 1 이면 단건 요청만 사용
+- 프로세스 분할은 group_id 범위가 아닌 사용자별 게시글 수 가중치 기준 (split_weighted)
+- 실행마다 run id 를 발급해 사용자별 진행 단계를 ScrapeCheckpoint 에 기록 (7일 보관)
+- 중간에 종료된 실행은 같은 인자에 --resume <run-id> 를 붙여 완료된 사용자를 건너뛰고 재실행
+- --incremental 은 저장된 게시글이 나올 때까지만 게시글 목록을 가져옴, 월요일은 전체 동기화
+- --tiered-refresh 는 조회수 변화가 적은 게시글의 통계를 며칠에 한 번만 갱신 (건너뛴 날은 마지막 조회수를 is_carried 로 기록), 월요일은 전체 갱신
 """
 
 import argparse
 import asyncio
+import logging
 import multiprocessing
+import uuid
 import warnings
+from datetime import timedelta
+from typing import Any
 
 import setup_django  # noqa
+from django.db.models import Count, Q
 
-from scraping.main import Scraper
-from utils.utils import split_range
+from scraping.main import ScraperTargetUser
+from scraping.models import ScrapeCheckpoint
+from users.models import User, UserTokenHealth
+from utils.utils import get_local_now, split_weighted
 
+logger = logging.getLogger("scraping")
 
-def run_scraper(group_range: range) -> None:
+
+def run_scraper(
+    user_pk_list: list[int], scraper_options: dict[str, Any]
+) -> None:
     """멀티프로세싱에서 실행될 동기 함수, 각 프로세스에서 비동기 루프 실행"""
-    asyncio.run(Scraper(group_range).run())
+    asyncio.run(ScraperTargetUser(user_pk_list, **scraper_options).run())
 
 
 def main() -> None:
-    """커맨드라인 인자를 파싱하고 그룹 범위를 3분할하여 멀티프로세싱 처리"""
+    """커맨드라인 인자를 파싱하고 그룹 범위의 사용자를 게시글 수 기준으로 2분할하여 멀티프로세싱 처리"""
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--min-group",
@@ -41,12 +60,76 @@ def main() -> None:
         default=1000,
         help="Maximum group number",
     )
+    parser.add_argument(
+        "--user-concurrency",
+        type=int,
+        default=1,
+        help="Number of users processed concurrently per process",
+    )
+    parser.add_argument(
+        "--stats-batch-size",
+        type=int,
+        default=10,
+        help="Number of post stats fetched in a single request",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fetch post lists only until already stored posts "
+        "(full sync on the weekly full sync day)",
+    )
+    parser.add_argument(
+        "--tiered-refresh",
+        action="store_true",
+        help="Refresh stats of slow-moving posts every few days "
+        "(all posts on the weekly boundary day)",
+    )
+    parser.add_argument(
+        "--resume",
+        type=uuid.UUID,
+        default=None,
+        metavar="RUN_ID",
+        help="Resume the run, skipping users already completed in it",
+    )
     args = parser.parse_args()
 
-    group_ranges = split_range(args.min_group, args.max_group, 2)
+    if args.resume:
+        run_id = args.resume
+        logger.info(f"Resume aggregate batch run {run_id}")
+    else:
+        run_id = uuid.uuid4()
+        # 오래된 실행의 체크포인트 정리
+        ScrapeCheckpoint.objects.filter(
+            created_at__lt=get_local_now() - timedelta(days=7)
+        ).delete()
+        logger.info(f"Start aggregate batch run {run_id}")
+
+    scraper_options = {
+        "user_concurrency": args.user_concurrency,
+        "stats_batch_size": args.stats_batch_size,
+        "incremental": args.incremental,
+        "tiered_refresh": args.tiered_refresh,
+        "run_id": run_id,
+    }
+
+    # 사용자 당 처리 시간은 게시글 수에 비례, 토큰과 사용자 정보 확인 비용으로 1 을 더함
+    users_with_post_count = list(
+        User.objects.filter(
+            group_id__in=range(args.min_group, args.max_group + 1)
+        )
+        .exclude(UserTokenHealth.in_backoff_q())
+        .annotate(post_count=Count("posts", filter=Q(posts__is_active=True)))
+        .values_list("pk", "post_count")
+    )
+    user_pk_list = [pk for pk, _ in users_with_post_count]
+    weights = [post_count + 1 for _, post_count in users_with_post_count]
+
     processes = []
-    for group_range in group_ranges:
-        p = multiprocessing.Process(target=run_scraper, args=(group_range,))
+    for user_pk_bin in split_weighted(user_pk_list, weights, 2):
+        p = multiprocessing.Process(
+            target=run_scraper,
+            args=(user_pk_bin, scraper_options),
+        )
         p.start()
         processes.append(p)
 
@@ -2,21 +2,26 @@
 [25.03.01] 리뉴얼 추가 배치 (작성자: 정현우)
 - 형태 및 주의사항은 기본 메인 배치인 aggregate_batch 와 완전 동일
 - 하지만 해당 배치는 평균 이상의 게시글을 가진 사용자만 가져와서 업데이트하는 배치
+- 프로세스 분할은 사용자 수가 아닌 사용자별 게시글 수 가중치 기준 (split_weighted)
 - 실행은 아래와 같은 커멘드 활용
 - python ./scraping/aggregate_target_batch.py
 - poetry run python ./scraping/aggregate_target_batch.py
+- poetry run python ./scraping/aggregate_target_batch.py --user-concurrency 5
+- poetry run python ./scraping/aggregate_target_batch.py --stats-batch-size 10
 """
 
+import argparse
 import asyncio
 import multiprocessing
 import warnings
+from typing import Any
 
 import setup_django  # noqa
 from django.db.models import Avg, Count
 
 from scraping.main import ScraperTargetUser
-from users.models import User
-from utils.utils import split_list
+from users.models import User, UserTokenHealth
+from utils.utils import split_weighted
 
 # Django에서 발생하는 RuntimeWarning 무시
 warnings.filterwarnings(
@@ -26,13 +31,47 @@ warnings.filterwarnings(
 )
 
 
-def run_scraper(user_pk_list: list[int]) -> None:
+def run_scraper(
+    user_pk_list: list[int], scraper_options: dict[str, Any]
+) -> None:
     """멀티프로세싱에서 실행될 동기 함수, 각 프로세스에서 비동기 루프 실행"""
-    asyncio.run(ScraperTargetUser(user_pk_list).run())
+    asyncio.run(ScraperTargetUser(user_pk_list, **scraper_options).run())
 
 
 def main() -> None:
     """커맨드라인 인자를 파싱하고 그룹 범위를 3분할하여 멀티프로세싱 처리"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--user-concurrency",
+        type=int,
+        default=1,
+        help="Number of users processed concurrently per process",
+    )
+    parser.add_argument(
+        "--stats-batch-size",
+        type=int,
+        default=10,
+        help="Number of post stats fetched in a single request",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fetch post lists only until already stored posts "
+        "(full sync on the weekly full sync day)",
+    )
+    parser.add_argument(
+        "--tiered-refresh",
+        action="store_true",
+        help="Refresh stats of slow-moving posts every few days "
+        "(all posts on the weekly boundary day)",
+    )
+    args = parser.parse_args()
+    scraper_options = {
+        "user_concurrency": args.user_concurrency,
+        "stats_batch_size": args.stats_batch_size,
+        "incremental": args.incremental,
+        "tiered_refresh": args.tiered_refresh,
+    }
 
     # 1. 모든 사용자에 대해 게시글 수를 계산하고 평균 게시글 수 구하기
     avg_posts_per_user = (
@@ -42,18 +81,28 @@ def main() -> None:
     )["avg_posts"]
 
     # 2. 평균보다 많은 게시글을 가진 사용자들 필터링 (정렬은 최신순)
+    #    토큰 검증 실패로 backoff 중인 사용자는 제외
     users_above_avg = (
         User.objects.annotate(post_count=Count("posts"))
         .filter(post_count__gt=avg_posts_per_user)
+        .exclude(UserTokenHealth.in_backoff_q())
         .order_by("-id")
     )
 
-    # 3. 필터링한 사용자들의 pk를 리스트로 추출
-    user_pk_list = list(users_above_avg.values_list("pk", flat=True))
+    # 3. 필터링한 사용자들의 pk 와 게시글 수를 리스트로 추출
+    users_with_post_count = list(
+        users_above_avg.values_list("pk", "post_count")
+    )
+    user_pk_list = [pk for pk, _ in users_with_post_count]
+    # 사용자 당 처리 시간은 게시글 수에 비례, 토큰과 사용자 정보 확인 비용으로 1 을 더함
+    weights = [post_count + 1 for _, post_count in users_with_post_count]
 
     processes = []
-    for user_pk_list in split_list(user_pk_list, 2):
-        p = multiprocessing.Process(target=run_scraper, args=(user_pk_list,))
+    for user_pk_bin in split_weighted(user_pk_list, weights, 2):
+        p = multiprocessing.Process(
+            target=run_scraper,
+            args=(user_pk_bin, scraper_options),
+        )
         p.start()
         processes.append(p)
 
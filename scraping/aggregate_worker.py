@@ -0,0 +1,151 @@
+"""
+[26.10.17] 작업 큐 기반 분산 배치
+- aggregate_batch 의 고정 그룹 범위 분할 대신 ScrapeJob 테이블을 작업 큐로 사용
+- enqueue 로 사용자 단위 작업을 등록하고, 여러 호스트에서 work 를 실행해 수평 확장
+- 워커는 SELECT ... FOR UPDATE SKIP LOCKED 로 작업을 가져가며 lease 가 만료된 작업은 자동으로 재처리
+- 형태 및 주의사항(setup_django, timezone 워닝)은 aggregate_batch 와 동일
+- 실행은 아래와 같은 커멘드 활용
+- poetry run python ./scraping/aggregate_worker.py enqueue --min-group 1 --max-group 1000
+- poetry run python ./scraping/aggregate_worker.py work --workers 4
+- poetry run python ./scraping/aggregate_worker.py work --workers 4 --user-concurrency 5
+- poetry run python ./scraping/aggregate_worker.py work --workers 1 --poll-seconds 10 (관리자 통계 업데이트 요청 처리용 상시 워커)
+- 관리자 통계 업데이트 요청은 run-scrape-worker.yaml 워크플로가 10분마다 work --workers 1 로 처리
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import warnings
+from typing import Any
+
+import setup_django  # noqa
+
+from scraping.main import ScraperQueueWorker
+from scraping.work_queue import ScrapeJobQueue
+from users.models import User, UserTokenHealth
+
+# Django에서 발생하는 RuntimeWarning 무시
+warnings.filterwarnings(
+    "ignore",
+    message=r"DateTimeField .* received a naive datetime",
+    category=RuntimeWarning,
+)
+
+
+def run_worker(worker_options: dict[str, Any]) -> None:
+    """멀티프로세싱에서 실행될 동기 함수, 각 프로세스에서 비동기 루프 실행"""
+    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+    asyncio.run(ScraperQueueWorker(worker_id, **worker_options).run())
+
+
+def enqueue(args: argparse.Namespace) -> None:
+    """그룹 범위의 사용자들을 작업 큐에 등록"""
+    user_ids = list(
+        User.objects.filter(
+            group_id__in=range(args.min_group, args.max_group + 1)
+        )
+        .exclude(UserTokenHealth.in_backoff_q())
+        .values_list("pk", flat=True)
+    )
+    ScrapeJobQueue.enqueue_users(user_ids)
+
+
+def work(args: argparse.Namespace) -> None:
+    """호스트 당 --workers 개의 프로세스로 작업 큐가 빌 때까지 처리 (--poll-seconds 면 상시 실행)"""
+    worker_options = {
+        "lease_seconds": args.lease_seconds,
+        "user_concurrency": args.user_concurrency,
+        "stats_batch_size": args.stats_batch_size,
+        "incremental": args.incremental,
+        "tiered_refresh": args.tiered_refresh,
+        "poll_seconds": args.poll_seconds,
+    }
+
+    processes = []
+    for _ in range(args.workers):
+        p = multiprocessing.Process(target=run_worker, args=(worker_options,))
+        p.start()
+        processes.append(p)
+
+    for p in processes:
+        p.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    enqueue_parser = subparsers.add_parser(
+        "enqueue", help="Enqueue scrape jobs for users in the group range"
+    )
+    enqueue_parser.add_argument(
+        "--min-group",
+        type=int,
+        default=1,
+        help="Minimum group number",
+    )
+    enqueue_parser.add_argument(
+        "--max-group",
+        type=int,
+        default=1000,
+        help="Maximum group number",
+    )
+    enqueue_parser.set_defaults(func=enqueue)
+
+    work_parser = subparsers.add_parser(
+        "work", help="Run workers until the job queue is empty"
+    )
+    work_parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Number of worker processes on this host",
+    )
+    work_parser.add_argument(
+        "--lease-seconds",
+        type=int,
+        default=600,
+        help="Seconds a claimed job is leased before other workers reclaim it",
+    )
+    work_parser.add_argument(
+        "--user-concurrency",
+        type=int,
+        default=1,
+        help="Number of users processed concurrently per process",
+    )
+    work_parser.add_argument(
+        "--stats-batch-size",
+        type=int,
+        default=10,
+        help="Number of post stats fetched in a single request",
+    )
+    work_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fetch post lists only until already stored posts "
+        "(full sync on the weekly full sync day)",
+    )
+    work_parser.add_argument(
+        "--tiered-refresh",
+        action="store_true",
+        help="Refresh stats of slow-moving posts every few days "
+        "(all posts on the weekly boundary day)",
+    )
+    work_parser.add_argument(
+        "--poll-seconds",
+        type=float,
+        default=0,
+        help="Keep polling the job queue every N seconds instead of exiting "
+        "when it is empty (0: exit when empty)",
+    )
+    work_parser.set_defaults(func=work)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+# 실행
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,24 @@
+import asyncio
 import logging
-from typing import Any
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable
 
+from aiohttp import (
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+    TraceDnsCacheHitParams,
+    TraceDnsCacheMissParams,
+    TraceRequestEndParams,
+)
 from aiohttp.client import ClientSession
 from aiohttp_retry import ExponentialRetry, RetryClient
 
 from scraping.constants import (
     CURRENT_USER_QUERY,
+    POSTS_STATS_BATCH_FIELD,
+    POSTS_STATS_BY_DAY_QUERY,
     POSTS_STATS_QUERY,
     V2_CDN_URL,
     V3_URL,
@@ -15,6 +28,80 @@ from scraping.constants import (
 logger = logging.getLogger("scraping")
 
 
+@dataclass
+class ConnectionStats:
+    """공유 세션의 커넥션 재사용 통계"""
+
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """전체 커넥션 획득 중 keep-alive 로 재사용된 비율"""
+        acquired = self.connections_created + self.connections_reused
+        return self.connections_reused / acquired if acquired else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"requests={self.requests}, "
+            f"connections_created={self.connections_created}, "
+            f"connections_reused={self.connections_reused}, "
+            f"reuse_ratio={self.reuse_ratio:.2%}, "
+            f"dns_cache_hits={self.dns_cache_hits}, "
+            f"dns_cache_misses={self.dns_cache_misses}"
+        )
+
+
+def create_trace_config(stats: ConnectionStats) -> TraceConfig:
+    """aiohttp 세션에 붙여 ConnectionStats 를 집계하는 TraceConfig 생성"""
+
+    async def on_request_end(
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        stats.requests += 1
+
+    async def on_connection_create_end(
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceConnectionCreateEndParams,
+    ) -> None:
+        stats.connections_created += 1
+
+    async def on_connection_reuseconn(
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceConnectionReuseconnParams,
+    ) -> None:
+        stats.connections_reused += 1
+
+    async def on_dns_cache_hit(
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceDnsCacheHitParams,
+    ) -> None:
+        stats.dns_cache_hits += 1
+
+    async def on_dns_cache_miss(
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceDnsCacheMissParams,
+    ) -> None:
+        stats.dns_cache_misses += 1
+
+    trace_config = TraceConfig()
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+    trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+    return trace_config
+
+
 def get_header(access_token: str, refresh_token: str) -> dict[str, str]:
     return {
         "authority": "v3.velog.io",
@@ -29,7 +116,11 @@ async def fetch_velog_user_chk(
     access_token: str,
     refresh_token: str,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
-    # 토큰 유효성 검증
+    """토큰 유효성 검증, (갱신된 토큰 쿠키, 응답) 반환
+
+    토큰이 유효하지 않으면 응답의 data.currentUser 가 null 이고,
+    요청 실패(네트워크 오류, timeout, 200 이 아닌 응답, JSON 이 아닌 응답)면 ({}, {}) 를 반환해 토큰 실패와 구분
+    """
     payload = {"query": CURRENT_USER_QUERY}
     headers = get_header(access_token, refresh_token)
     try:
@@ -38,6 +129,12 @@ async def fetch_velog_user_chk(
             json=payload,
             headers=headers,
         ) as response:
+            if response.status != 200:
+                text = await response.text()
+                logger.error(
+                    f"Failed to fetch user: HTTP error {response.status}: {text}"
+                )
+                return {}, {}
             data = await response.json()
             cookies = {
                 cookie.key: cookie.value
@@ -83,27 +180,61 @@ async def fetch_velog_posts(
         return []
 
 
+async def iter_velog_posts(
+    session: ClientSession,
+    username: str,
+    access_token: str,
+    refresh_token: str,
+    is_unchanged: Callable[[dict[str, str]], bool] | None = None,
+) -> AsyncIterator[list[dict[str, str]]]:
+    """한 유저의 포스트를 페이지(50개) 단위로 가져오는 async generator
+
+    페이지를 넘겨주기 전에 다음 페이지 요청을 미리 보내서, 호출한 쪽의 페이지 처리(DB 저장 등)와
+    다음 페이지 응답 대기가 겹치도록 함
+    is_unchanged 가 주어지면(증분 동기화) 이미 저장된 것과 같은 게시글이 나온 페이지까지만 가져옴.
+    게시글 목록은 최신순이므로 그 이후 페이지는 모두 저장된 게시글임
+    """
+
+    def request_page(cursor: str) -> asyncio.Future[list[dict[str, str]]]:
+        return asyncio.ensure_future(
+            fetch_velog_posts(
+                session,
+                username,
+                access_token,
+                refresh_token,
+                cursor,
+            )
+        )
+
+    next_page = request_page("")
+    try:
+        while True:
+            posts = await next_page
+            if not posts or "id" not in posts[-1]:
+                return
+            if is_unchanged and any(is_unchanged(post) for post in posts):
+                yield posts
+                return
+            next_page = request_page(posts[-1]["id"])
+            yield posts
+    finally:
+        # 호출한 쪽이 중간에 멈추면 미리 보낸 요청은 취소
+        next_page.cancel()
+
+
 async def fetch_all_velog_posts(
     session: ClientSession,
     username: str,
     access_token: str,
     refresh_token: str,
+    is_unchanged: Callable[[dict[str, str]], bool] | None = None,
 ) -> list[dict[str, str]]:
-    """한 유저의 모든 포스트를 가져오는 함수"""
-    cursor = ""
+    """한 유저의 모든 포스트를 가져오는 함수 (iter_velog_posts 의 모든 페이지를 합침)"""
     total_posts = list()
-    while True:
-        posts = await fetch_velog_posts(
-            session,
-            username,
-            access_token,
-            refresh_token,
-            cursor,
-        )
-        if not posts or "id" not in posts[-1]:
-            break
+    async for posts in iter_velog_posts(
+        session, username, access_token, refresh_token, is_unchanged
+    ):
         total_posts.extend(posts)
-        cursor = posts[-1]["id"]
     return total_posts
 
 
@@ -111,10 +242,64 @@ async def fetch_post_stats(
     post_id: str,
     access_token: str,
     refresh_token: str,
+    session: ClientSession | None = None,
+    retry_attempts: int = 3,
 ) -> dict[str, str]:
-    """post_id에 대한 통계 정보 가져오는 graphQL 호출"""
+    """post_id에 대한 통계 정보 가져오는 graphQL 호출
+
+    session 이 주어지면 해당 세션의 커넥션 풀(keep-alive, DNS 캐시)을 재사용하고,
+    없으면 호출마다 새로운 세션을 만들어 사용함
+    retry_attempts 는 RetryClient 의 시도 횟수, 호출한 쪽에서 재시도를 관리하면 1
+    """
+    retry_options = ExponentialRetry(attempts=retry_attempts, start_timeout=1)
+    if session is not None:
+        # 공유 세션은 호출한 쪽에서 관리하므로 RetryClient 로 닫지 않음
+        retry_client = RetryClient(
+            client_session=session, retry_options=retry_options
+        )
+        return await _request_post_stats(
+            retry_client, post_id, access_token, refresh_token
+        )
+
+    async with RetryClient(retry_options=retry_options) as retry_client:
+        return await _request_post_stats(
+            retry_client, post_id, access_token, refresh_token
+        )
+
+
+async def fetch_post_stats_by_day(
+    session: ClientSession,
+    post_id: str,
+    access_token: str,
+    refresh_token: str,
+) -> dict[str, Any]:
+    """post_id 의 전체 조회수와 일별 조회수(count_by_day)를 가져오는 graphQL 호출
+
+    Returns:
+        {"data": {"getStats": {"total": int, "count_by_day": [{"count": int, "day": str}]}}},
+        실패 시 빈 dict
+    """
+    retry_client = RetryClient(
+        client_session=session,
+        retry_options=ExponentialRetry(attempts=3, start_timeout=1),
+    )
+    return await _request_post_stats(
+        retry_client,
+        post_id,
+        access_token,
+        refresh_token,
+        query=POSTS_STATS_BY_DAY_QUERY,
+    )
+
 
-    query = POSTS_STATS_QUERY
+async def _request_post_stats(
+    retry_client: RetryClient,
+    post_id: str,
+    access_token: str,
+    refresh_token: str,
+    query: str = POSTS_STATS_QUERY,
+) -> dict[str, str]:
+    """fetch_post_stats 의 실제 요청 처리, 실패 시 빈 dict 반환"""
     variables = {"post_id": post_id}
     payload = {
         "query": query,
@@ -123,35 +308,114 @@ async def fetch_post_stats(
     }
     headers = get_header(access_token, refresh_token)
 
-    retry_options = ExponentialRetry(attempts=3, start_timeout=1)
-    async with RetryClient(retry_options=retry_options) as retry_client:
-        try:
-            async with retry_client.post(
-                V2_CDN_URL, json=payload, headers=headers
-            ) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    logger.error(
-                        f"HTTP error {response.status}: {text} (post_id: {post_id})"
-                    )
-                    return {}
-                content_type = response.headers.get("Content-Type", "")
-                if "application/json" not in content_type:
-                    text = await response.text()
-                    logger.error(
-                        f"Unexpected response format: {text} (post_id: {post_id})"
-                    )
-                    return {}
-                try:
-                    res: dict[str, str] = await response.json()
-                    return res
-                except Exception as e:
-                    logger.error(
-                        f"JSON decoding failed: {e} (post_id: {post_id})"
-                    )
-                    return {}
-        except Exception as e:
-            logger.error(
-                f"Failed to fetch post stats: {e} (post_id: {post_id})"
+    try:
+        async with retry_client.post(
+            V2_CDN_URL, json=payload, headers=headers
+        ) as response:
+            if response.status != 200:
+                text = await response.text()
+                logger.error(
+                    f"HTTP error {response.status}: {text} (post_id: {post_id})"
+                )
+                return {}
+            content_type = response.headers.get("Content-Type", "")
+            if "application/json" not in content_type:
+                text = await response.text()
+                logger.error(
+                    f"Unexpected response format: {text} (post_id: {post_id})"
+                )
+                return {}
+            try:
+                res: dict[str, str] = await response.json()
+                return res
+            except Exception as e:
+                logger.error(f"JSON decoding failed: {e} (post_id: {post_id})")
+                return {}
+    except Exception as e:
+        logger.error(f"Failed to fetch post stats: {e} (post_id: {post_id})")
+        return {}
+
+
+def build_posts_stats_batch_query(count: int) -> str:
+    """getStats 필드를 stats_{index} alias 로 count 개 묶은 단일 GraphQL 문서 생성"""
+    variables = ", ".join(f"$post_id_{i}: ID!" for i in range(count))
+    fields = "".join(
+        POSTS_STATS_BATCH_FIELD.format(index=i) for i in range(count)
+    )
+    return f"""
+    query GetStatsBatch({variables}) {{{fields}
+    }}
+    """
+
+
+async def fetch_posts_stats_batch(
+    session: ClientSession,
+    post_ids: list[str],
+    access_token: str,
+    refresh_token: str,
+) -> dict[str, dict[str, Any]] | None:
+    """여러 post_id 의 통계 정보를 하나의 graphQL 요청으로 가져오는 호출
+
+    Returns:
+        post_id 별 fetch_post_stats 와 같은 형태({"data": {"getStats": ...}})의 dict.
+        일부 게시글의 통계가 없으면 해당 post_id 는 빠져 있음.
+        엔드포인트가 batch 요청 자체를 거부한 경우(400, data 없이 errors 만 있는 응답) None,
+        일시적인 실패(네트워크 오류, 429, 5xx 등)는 빈 dict 를 반환해 해당 게시글만 단건 요청으로 대체
+    """
+    payload = {
+        "query": build_posts_stats_batch_query(len(post_ids)),
+        "variables": {
+            f"post_id_{i}": post_id for i, post_id in enumerate(post_ids)
+        },
+        "operationName": "GetStatsBatch",
+    }
+    headers = get_header(access_token, refresh_token)
+
+    try:
+        async with session.post(
+            V2_CDN_URL, json=payload, headers=headers
+        ) as response:
+            if response.status == 400:
+                text = await response.text()
+                logger.warning(
+                    f"Batch stats request rejected {response.status}: {text} "
+                    f"(post_ids: {post_ids})"
+                )
+                return None
+            if response.status != 200:
+                text = await response.text()
+                logger.warning(
+                    f"Batch stats request failed {response.status}: {text} "
+                    f"(post_ids: {post_ids})"
+                )
+                return {}
+            data = await response.json()
+    except Exception as e:
+        logger.warning(
+            f"Failed to fetch batch post stats: {e} (post_ids: {post_ids})"
+        )
+        return {}
+
+    if not isinstance(data, dict):
+        logger.warning(
+            f"Unexpected batch stats response: {data} (post_ids: {post_ids})"
+        )
+        return {}
+
+    stats_data = data.get("data")
+    if not isinstance(stats_data, dict):
+        if data.get("errors"):
+            logger.warning(
+                f"Batch stats request rejected: {data} (post_ids: {post_ids})"
             )
-            return {}
+            return None
+        logger.warning(
+            f"Unexpected batch stats response: {data} (post_ids: {post_ids})"
+        )
+        return {}
+
+    return {
+        post_id: {"data": {"getStats": stats_data[f"stats_{i}"]}}
+        for i, post_id in enumerate(post_ids)
+        if isinstance(stats_data.get(f"stats_{i}"), dict)
+    }
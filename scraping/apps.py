@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class ScrapingConfig(AppConfig):  # type: ignore
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "scraping"
@@ -0,0 +1,74 @@
+"""
+[26.10.17] 신규 사용자 과거 통계 backfill 배치
+- 가입 직후 사용자는 일별 통계가 없어 첫 주간 분석이 의미 없으므로, getStats 의 일별 조회수로 과거 통계를 채움
+- 일반 사용자 처리(토큰, 게시글 동기화, 오늘 통계) 후 게시글 전체의 과거 통계를 한 번에 bulk insert
+- 이미 있는 (게시글, 날짜) 통계는 덮어쓰지 않으므로 여러 번 실행해도 안전
+- 실행은 아래와 같은 커멘드 활용
+- poetry run python ./scraping/backfill_batch.py
+- poetry run python ./scraping/backfill_batch.py --joined-days 3
+- poetry run python ./scraping/backfill_batch.py --user-pk 1 2 3
+"""
+
+import argparse
+import asyncio
+import warnings
+from datetime import timedelta
+
+import setup_django  # noqa
+
+from scraping.main import ScraperBackfill
+from users.models import User, UserTokenHealth
+from utils.utils import get_local_now
+
+# Django에서 발생하는 RuntimeWarning 무시
+warnings.filterwarnings(
+    "ignore",
+    message=r"DateTimeField .* received a naive datetime",
+    category=RuntimeWarning,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--user-pk",
+        type=int,
+        nargs="+",
+        help="Backfill only these users (default: recently joined users)",
+    )
+    parser.add_argument(
+        "--joined-days",
+        type=int,
+        default=1,
+        help="Backfill users who joined within this many days",
+    )
+    parser.add_argument(
+        "--user-concurrency",
+        type=int,
+        default=1,
+        help="Number of users processed concurrently",
+    )
+    args = parser.parse_args()
+
+    if args.user_pk:
+        user_pk_list = args.user_pk
+    else:
+        user_pk_list = list(
+            User.objects.filter(
+                created_at__gte=get_local_now()
+                - timedelta(days=args.joined_days)
+            )
+            .exclude(UserTokenHealth.in_backoff_q())
+            .values_list("pk", flat=True)
+        )
+
+    asyncio.run(
+        ScraperBackfill(
+            user_pk_list, user_concurrency=args.user_concurrency
+        ).run()
+    )
+
+
+# 실행
+if __name__ == "__main__":
+    main()
@@ -35,3 +35,21 @@ POSTS_STATS_QUERY: Final[str] = """
         }
     }
     """
+
+# 신규 사용자 과거 통계 backfill 용, 최근 일별 조회수(count_by_day)까지 함께 조회
+POSTS_STATS_BY_DAY_QUERY: Final[str] = """
+    query GetStats($post_id: ID!) {
+        getStats(post_id: $post_id) {
+            total
+            count_by_day {
+                count
+                day
+            }
+        }
+    }
+    """
+
+POSTS_STATS_BATCH_FIELD: Final[str] = """
+        stats_{index}: getStats(post_id: $post_id_{index}) {{
+            total
+        }}"""
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+import psycopg
+from django.db import connections
+from psycopg.conninfo import make_conninfo
+
+logger = logging.getLogger("scraping")
+
+# libpq 접속 정보가 아닌 django 전용 OPTIONS 키
+DJANGO_ONLY_OPTIONS = {
+    "assume_role",
+    "cursor_factory",
+    "isolation_level",
+    "pool",
+    "server_side_binding",
+}
+
+
+class AsyncPostgresPool:
+    """
+    스크래핑 전용 비동기 Postgres 커넥션 풀
+    sync_to_async(thread_sensitive=True) 는 모든 DB 작업을 하나의 스레드에서 순서대로 실행하므로,
+    통계 upsert 처럼 동시에 실행되는 쓰기 작업은 psycopg AsyncConnection 으로 직접 실행
+    접속 정보는 django DATABASES 설정을 그대로 사용
+    """
+
+    def __init__(self, conninfo: str, max_size: int = 5) -> None:
+        self.conninfo = conninfo
+        self.max_size = max(1, max_size)
+        self._semaphore = asyncio.Semaphore(self.max_size)
+        self._idle: list[psycopg.AsyncConnection[Any]] = []
+        # 유휴 커넥션과 사용 중인 커넥션 모두, close 에서 함께 닫음
+        self._connections: set[psycopg.AsyncConnection[Any]] = set()
+        self._closed = False
+
+    @staticmethod
+    def is_supported(alias: str = "default") -> bool:
+        """Postgres 가 아니면(로컬 sqlite 등) 기존 ORM 경로를 사용"""
+        return bool(connections[alias].vendor == "postgresql")
+
+    @classmethod
+    def from_django_settings(
+        cls, alias: str = "default", max_size: int = 5
+    ) -> "AsyncPostgresPool":
+        settings_dict = connections[alias].settings_dict
+        options = {
+            key: value
+            for key, value in settings_dict.get("OPTIONS", {}).items()
+            if key not in DJANGO_ONLY_OPTIONS
+        }
+        conninfo = make_conninfo(
+            **{
+                key: value
+                for key, value in {
+                    "dbname": settings_dict["NAME"],
+                    "user": settings_dict["USER"],
+                    "password": settings_dict["PASSWORD"],
+                    "host": settings_dict["HOST"],
+                    "port": settings_dict["PORT"],
+                    **options,
+                }.items()
+                if value not in (None, "")
+            }
+        )
+        return cls(conninfo, max_size=max_size)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[psycopg.AsyncConnection[Any]]:
+        """유휴 커넥션을 재사용하고, 없으면 max_size 까지 새로 연결"""
+        async with self._semaphore:
+            if self._closed:
+                raise RuntimeError("AsyncPostgresPool is closed")
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = await psycopg.AsyncConnection.connect(
+                    self.conninfo, autocommit=True
+                )
+                self._connections.add(conn)
+                # 연결하는 동안 close 가 호출됐으면 바로 닫음
+                if self._closed:
+                    await self._discard(conn)
+                    raise RuntimeError("AsyncPostgresPool is closed")
+            try:
+                yield conn
+            except BaseException:
+                await self._discard(conn)
+                raise
+            if (
+                self._closed
+                or conn.closed
+                or conn.info.transaction_status
+                != psycopg.pq.TransactionStatus.IDLE
+            ):
+                await self._discard(conn)
+            else:
+                self._idle.append(conn)
+
+    async def _discard(self, conn: psycopg.AsyncConnection[Any]) -> None:
+        self._connections.discard(conn)
+        await conn.close()
+
+    async def execute(self, query: str, params: list[Any]) -> int:
+        """단일 트랜잭션으로 쿼리 실행 후 영향받은 row 수 반환"""
+        async with self.connection() as conn:
+            async with conn.transaction():
+                cursor = await conn.execute(query, params)
+                return int(cursor.rowcount)
+
+    async def fetch_all(
+        self, query: str, params: list[Any]
+    ) -> list[tuple[Any, ...]]:
+        async with self.connection() as conn:
+            async with conn.transaction():
+                cursor = await conn.execute(query, params)
+                rows: list[tuple[Any, ...]] = await cursor.fetchall()
+                return rows
+
+    async def close(self) -> None:
+        """유휴 커넥션과 사용 중인 커넥션을 모두 닫고, 이후의 커넥션 요청은 거부"""
+        self._closed = True
+        self._idle.clear()
+        while self._connections:
+            await self._connections.pop().close()
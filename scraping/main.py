@@ -1,33 +1,97 @@
 import asyncio
 import logging
-from typing import Any
+import uuid
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Collection
 
 import aiohttp
 import async_timeout
 import environ
 import sentry_sdk
 from asgiref.sync import sync_to_async
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Max, Min, OuterRef, Q, Subquery
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 
 from modules.token_encryption.aes_encryption import AESEncryption
 from posts.models import Post, PostDailyStatistics
 from scraping.apis import (
-    fetch_all_velog_posts,
+    ConnectionStats,
+    create_trace_config,
     fetch_post_stats,
+    fetch_post_stats_by_day,
+    fetch_posts_stats_batch,
     fetch_velog_user_chk,
+    iter_velog_posts,
 )
-from users.models import User
-from utils.utils import get_local_now
+from scraping.db import AsyncPostgresPool
+from scraping.models import ScrapeCheckpoint, ScrapeJob
+from scraping.protocols import RateLimiter
+from scraping.rate_limiter import (
+    AdaptiveRateLimiter,
+    SharedRateBudget,
+    create_rate_limit_trace_config,
+)
+from scraping.refresh_scheduler import StatsRefreshScheduler
+from scraping.work_queue import ScrapeJobQueue
+from scraping.write_buffer import DailyStatisticsBuffer
+from users.models import User, UserTokenHealth
+from utils.utils import get_local_date, get_local_now
 
 logger = logging.getLogger("scraping")
 
 
 class Scraper:
-    def __init__(self, group_range: range, max_connections: int = 40):
+    # 통계를 가져오지 못한 게시글의 재시도 횟수와 재시도 동시성 제한
+    DEAD_LETTER_ATTEMPTS = 2
+    DEAD_LETTER_CONCURRENCY = 5
+    # 증분 동기화를 사용해도 삭제된 게시글 반영을 위해 전체 동기화하는 요일 (월요일)
+    FULL_SYNC_WEEKDAY = 0
+    # 통계 upsert 를 동시에 실행할 비동기 Postgres 커넥션 수
+    DB_POOL_SIZE = 5
+    # 여러 사용자의 통계 쓰기를 모아서 flush 하는 row 수, 시간(초) 임계치
+    WRITE_BUFFER_MAX_ROWS = 5000
+    WRITE_BUFFER_MAX_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        group_range: range,
+        max_connections: int = 40,
+        user_concurrency: int = 1,
+        stats_batch_size: int = 10,
+        rate_limiter: RateLimiter | None = None,
+        incremental: bool = False,
+        tiered_refresh: bool = False,
+        run_id: uuid.UUID | None = None,
+    ):
         self.env = environ.Env()
         self.group_range = group_range
         # 최대 동시 연결 수 제한
         self.semaphore = asyncio.Semaphore(max_connections)
+        # 동시에 처리할 최대 사용자 수 제한
+        self.user_concurrency = max(1, user_concurrency)
+        # 공유 세션의 커넥션 재사용 통계
+        self.connection_stats = ConnectionStats()
+        # 하나의 요청에 묶어서 가져올 게시글 통계 수, 1 이하면 단건 요청만 사용
+        self.stats_batch_size = max(1, stats_batch_size)
+        self.stats_batch_supported = True
+        # 고정 대기 시간 대신 응답 상태와 지연 시간으로 요청 속도 조절
+        # 다른 배치 프로세스, 우선 처리 레인과 velog 요청 예산(VELOG_SHARED_RATE_LIMIT)을 공유
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(
+            shared_budget=SharedRateBudget.from_settings()
+        )
+        # 저장된 게시글까지만 목록을 가져오는 증분 동기화 여부 (FULL_SYNC_WEEKDAY 는 전체 동기화)
+        self.incremental = incremental
+        # 최근 조회수 증가량과 게시글 나이로 통계 갱신 주기를 나눌지 여부
+        self.tiered_refresh = tiered_refresh
+        # 사용자별 진행 상황을 기록할 배치 실행 ID, None 이면 기록하지 않음
+        self.run_id = run_id
+        # 비동기 Postgres 커넥션 풀, run 동안만 열림 (Postgres 가 아니면 None)
+        self.db_pool: AsyncPostgresPool | None = None
+        # 통계 write-behind 버퍼, run 동안만 열림 (None 이면 청크마다 바로 기록)
+        self.write_buffer: DailyStatisticsBuffer | None = None
 
     async def update_old_tokens(
         self,
@@ -132,11 +196,18 @@ class Scraper:
     ) -> bool:
         """Post 객체를 일정 크기의 배치로 나눠서 삽입 또는 업데이트"""
         try:
+            counts = {"inserted": 0, "updated": 0, "unchanged": 0}
             for i in range(0, len(fetched_posts), batch_size):
                 batch_posts = fetched_posts[i : i + batch_size]
-                await self._upsert_batch(user, batch_posts)
-                # 배치 작업 사이 강제 대기 시간
-                await asyncio.sleep(0.2)
+                batch_counts = await self._upsert_batch(user, batch_posts)
+                for key in counts:
+                    counts[key] += batch_counts[key]
+            logger.info(
+                f"Upserted posts (inserted: {counts['inserted']}, "
+                f"updated: {counts['updated']}, "
+                f"unchanged: {counts['unchanged']})"
+                f" (user velog uuid: {user.velog_uuid})"
+            )
             return True
         except Exception as e:
             logger.error(
@@ -148,29 +219,50 @@ class Scraper:
 
     async def _upsert_batch(
         self, user: User, batch_posts: list[dict[str, Any]]
-    ) -> None:
-        """단일 배치 처리, bulk_upsert_posts 에서 호출됨"""
+    ) -> dict[str, int]:
+        """단일 배치 처리, bulk_upsert_posts 에서 호출됨
+
+        저장된 값과 비교해 제목, slug, released_at 이 바뀐 게시글만 업데이트
+        (변경 없는 row 까지 매일 UPDATE 하면 dead tuple, WAL 이 posts_post 전체에 쌓임)
+
+        Returns:
+            inserted, updated, unchanged 게시글 수
+        """
 
         @sync_to_async(thread_sensitive=True)  # type: ignore
-        def _execute_transaction() -> None:
+        def _execute_transaction() -> dict[str, int]:
             with transaction.atomic():
                 post_uuids = [post["id"] for post in batch_posts]
                 existing_posts = {
-                    str(post.post_uuid): post
-                    for post in Post.objects.filter(post_uuid__in=post_uuids)
+                    str(post["post_uuid"]): post
+                    for post in Post.objects.filter(
+                        post_uuid__in=post_uuids
+                    ).values("id", "post_uuid", "title", "slug", "released_at")
                 }
 
                 posts_to_create = []
-                posts_to_update = []
+                changed_rows = []
 
                 for post_data in batch_posts:
                     post_uuid = post_data["id"]
+                    released_at = self.parse_released_at(
+                        post_data["released_at"]
+                    )
                     if post_uuid in existing_posts:
                         post = existing_posts[post_uuid]
-                        post.title = post_data["title"]
-                        post.slug = post_data["url_slug"]
-                        post.released_at = post_data["released_at"]
-                        posts_to_update.append(post)
+                        if (
+                            post["title"] != post_data["title"]
+                            or post["slug"] != post_data["url_slug"]
+                            or post["released_at"] != released_at
+                        ):
+                            changed_rows.append(
+                                (
+                                    post["id"],
+                                    post_data["title"],
+                                    post_data["url_slug"],
+                                    released_at,
+                                )
+                            )
                     else:
                         posts_to_create.append(
                             Post(
@@ -178,32 +270,83 @@ class Scraper:
                                 title=post_data["title"],
                                 user=user,
                                 slug=post_data["url_slug"],
-                                released_at=post_data["released_at"],
+                                released_at=released_at,
                             )
                         )
 
-                if posts_to_update:
-                    Post.objects.bulk_update(
-                        posts_to_update, ["title", "slug", "released_at"]
-                    )
+                updated = self._update_changed_posts(changed_rows)
 
                 if posts_to_create:
                     Post.objects.bulk_create(posts_to_create)
 
-        await _execute_transaction()
+            return {
+                "inserted": len(posts_to_create),
+                "updated": updated,
+                "unchanged": len(batch_posts) - len(posts_to_create) - updated,
+            }
+
+        counts: dict[str, int] = await _execute_transaction()
+        return counts
+
+    @staticmethod
+    def _update_changed_posts(
+        changed_rows: list[tuple[int, str, str | None, Any]],
+    ) -> int:
+        """변경된 게시글을 단일 UPDATE ... FROM (VALUES ...) 문으로 업데이트
+
+        Args:
+            changed_rows: (id, title, slug, released_at) 튜플 리스트
+
+        Returns:
+            실제로 업데이트된 row 수
+        """
+        if not changed_rows:
+            return 0
+
+        table = connection.ops.quote_name(Post._meta.db_table)
+        values_sql = ", ".join(
+            ["(%s::bigint, %s::varchar, %s::varchar, %s::timestamptz)"]
+            * len(changed_rows)
+        )
+        params: list[Any] = [get_local_now()]
+        params.extend(value for row in changed_rows for value in row)
+
+        with connection.cursor() as cursor:
+            # 비교 이후 다른 워커가 같은 값으로 갱신한 row 는 다시 쓰지 않음
+            cursor.execute(
+                f"""
+                UPDATE {table} AS p
+                SET title = v.title,
+                    slug = v.slug,
+                    released_at = v.released_at,
+                    updated_at = %s
+                FROM (VALUES {values_sql}) AS v(id, title, slug, released_at)
+                WHERE p.id = v.id
+                  AND (p.title, p.slug, p.released_at)
+                      IS DISTINCT FROM (v.title, v.slug, v.released_at)
+                """,
+                params,
+            )
+            return int(cursor.rowcount)
 
     async def sync_post_active_status(
         self,
         user: User,
         current_post_ids: set[str],
         min_posts_threshold: int = 1,
-    ) -> None:
+    ) -> tuple[int, int]:
         """현재 API에서 가져온 게시글 목록을 기준으로 활성/비활성 상태 동기화
 
+        건수 계산, 방어 로직, 비활성화/재활성화를 하나의 SQL 문으로 처리
+        ((user_id, is_active) 인덱스 사용)
+
         Args:
             user: 대상 사용자
             current_post_ids: 현재 API에서 가져온 게시글 ID 집합
             min_posts_threshold: API 응답에 최소 이 개수 이상의 게시글이 있어야 상태변경을 실행
+
+        Returns:
+            (비활성화된 게시글 수, 재활성화된 게시글 수)
         """
 
         # API 응답이 너무 적으면 상태변경 하지 않음 (API 오류 가능성)
@@ -211,167 +354,776 @@ class Scraper:
             logger.warning(
                 f"Skipping post status sync for user {user.velog_uuid} - Too few posts returned ({len(current_post_ids)})"
             )
-            return
+            return 0, 0
+
+        table = connection.ops.quote_name(Post._meta.db_table)
 
         @sync_to_async(thread_sensitive=True)  # type: ignore
-        def _execute_sync() -> None:
-            # 1. 비활성화 로직: 현재 목록에 없는 활성화된 게시글 찾기
-            posts_to_deactivate = Post.objects.filter(
-                user=user, is_active=True
-            ).exclude(post_uuid__in=current_post_ids)
-
-            deactivation_count = posts_to_deactivate.count()
-
-            # 너무 많은 게시글이 비활성화되는 경우 방어 로직
-            active_posts_count = Post.objects.filter(
-                user=user, is_active=True
-            ).count()
-
-            if (
-                active_posts_count > 0
-                and deactivation_count / active_posts_count > 0.5
-            ):
-                logger.warning(
-                    f"Suspicious deactivation detected for user {user.velog_uuid}: "
-                    f"Would deactivate {deactivation_count} out of {active_posts_count} posts. "
-                    f"Skipping post status sync as a safety measure."
+        def _execute_sync() -> tuple[int, int, int, int]:
+            with connection.cursor() as cursor:
+                # 현재 목록에 없는 활성 게시글이 절반을 넘으면(API 오류 가능성) 아무것도 바꾸지 않음
+                cursor.execute(
+                    f"""
+                    WITH current_posts AS (
+                        SELECT unnest(%(post_uuids)s::uuid[]) AS post_uuid
+                    ),
+                    counts AS (
+                        SELECT
+                            count(*) FILTER (WHERE p.is_active) AS active_count,
+                            count(*) FILTER (
+                                WHERE p.is_active AND c.post_uuid IS NULL
+                            ) AS deactivation_count
+                        FROM {table} AS p
+                        LEFT JOIN current_posts AS c
+                            ON c.post_uuid = p.post_uuid
+                        WHERE p.user_id = %(user_id)s
+                    ),
+                    changed AS (
+                        UPDATE {table} AS p
+                        SET is_active = NOT p.is_active,
+                            updated_at = %(now)s
+                        FROM counts
+                        WHERE p.user_id = %(user_id)s
+                          AND counts.deactivation_count * 2
+                              <= counts.active_count
+                          AND p.is_active <> EXISTS (
+                              SELECT 1 FROM current_posts AS c
+                              WHERE c.post_uuid = p.post_uuid
+                          )
+                        RETURNING p.is_active
+                    )
+                    SELECT
+                        counts.active_count,
+                        counts.deactivation_count,
+                        (SELECT count(*) FROM changed WHERE NOT is_active),
+                        (SELECT count(*) FROM changed WHERE is_active)
+                    FROM counts
+                    """,
+                    {
+                        "post_uuids": list(current_post_ids),
+                        "user_id": user.id,
+                        "now": get_local_now(),
+                    },
                 )
-                return
+                counts: tuple[int, int, int, int] = cursor.fetchone()
+                return counts
+
+        (
+            active_posts_count,
+            deactivation_count,
+            deactivated_count,
+            reactivated_count,
+        ) = await _execute_sync()
+
+        # 너무 많은 게시글이 비활성화되는 경우 방어 로직
+        if deactivation_count * 2 > active_posts_count:
+            logger.warning(
+                f"Suspicious deactivation detected for user {user.velog_uuid}: "
+                f"Would deactivate {deactivation_count} out of {active_posts_count} posts. "
+                f"Skipping post status sync as a safety measure."
+            )
+            return 0, 0
 
-            # 2. 재활성화 로직: 현재 목록에 있지만 비활성화된 게시글 찾기
-            posts_to_reactivate = Post.objects.filter(
-                user=user, is_active=False, post_uuid__in=current_post_ids
+        if deactivated_count > 0:
+            logger.info(
+                f"Deactivated {deactivated_count} posts for user {user.velog_uuid}"
+            )
+        if reactivated_count > 0:
+            logger.info(
+                f"Reactivated {reactivated_count} posts for user {user.velog_uuid}"
             )
+        return deactivated_count, reactivated_count
 
-            reactivation_count = posts_to_reactivate.count()
+    async def bulk_update_daily_statistics(
+        self, posts_with_stats: list[tuple[dict[str, Any], dict[str, Any]]]
+    ) -> int:
+        """여러 게시글의 PostDailyStatistics 를 한 번의 INSERT ... ON CONFLICT 로 upsert
 
-            # 상태 업데이트 실행
-            if deactivation_count > 0:
-                logger.info(
-                    f"Deactivating {deactivation_count} posts for user {user.velog_uuid}"
-                )
-                posts_to_deactivate.update(is_active=False)
+        Args:
+            posts_with_stats: (게시글 데이터, getStats 응답) 튜플 리스트
 
-            if reactivation_count > 0:
-                logger.info(
-                    f"Reactivating {reactivation_count} posts for user {user.velog_uuid}"
-                )
-                posts_to_reactivate.update(is_active=True)
+        Returns:
+            upsert 된 통계 row 수
+        """
+        counts_by_post_uuid = self.collect_daily_counts(posts_with_stats)
+        if not counts_by_post_uuid:
+            return 0
 
-        await _execute_sync()
+        try:
+            return await self.write_daily_statistics(counts_by_post_uuid)
+        except Exception as e:
+            logger.error(f"Failed to bulk update daily statistics: {e}")
+            sentry_sdk.capture_exception(e)
+            return 0
 
-    async def update_daily_statistics(
-        self, post: dict[str, Any], stats: dict[str, Any]
+    async def save_daily_statistics(
+        self,
+        user: User,
+        posts_with_stats: list[tuple[dict[str, Any], dict[str, Any]]],
     ) -> None:
-        """PostDailyStatistics를 업데이트 또는 생성 (upsert)"""
-        if not stats or not isinstance(stats, dict):
-            logger.warning(
-                f"Skip updating statistics due to invalid stats data for post {post['id']}"
-            )
+        """write-behind 버퍼가 열려 있으면 버퍼에 추가, 아니면 바로 upsert"""
+        if self.write_buffer is None:
+            await self.bulk_update_daily_statistics(posts_with_stats)
             return
 
-        try:
-            today = get_local_now().date()
-            post_id = post["id"]
+        counts_by_post_uuid = self.collect_daily_counts(posts_with_stats)
+        if counts_by_post_uuid:
+            await self.write_buffer.add(user.id, counts_by_post_uuid)
+
+    @staticmethod
+    def collect_daily_counts(
+        posts_with_stats: list[tuple[dict[str, Any], dict[str, Any]]],
+    ) -> dict[str, tuple[int, int]]:
+        """getStats 응답에서 게시글 UUID 별 (조회수, 좋아요 수) 추출, 잘못된 응답은 건너뜀"""
+        counts_by_post_uuid: dict[str, tuple[int, int]] = {}
 
-            stats_data = stats.get("data", {})
+        for post, stats in posts_with_stats:
+            stats_data = (
+                stats.get("data", {}) if isinstance(stats, dict) else {}
+            )
             if not stats_data or not isinstance(
                 stats_data.get("getStats"),
                 dict,
             ):
                 logger.warning(
-                    f"Skip updating statistics due to missing getStats data for post {post_id}"
+                    f"Skip updating statistics due to missing getStats data for post {post['id']}"
                 )
-                return
+                continue
 
-            view_count = stats_data["getStats"].get("total", 0)
-            like_count = post.get("likes", 0)
-
-            # 트랜잭션 내에서 실행
-            @sync_to_async  # type: ignore
-            def update_stats_in_transaction() -> None:
-                with transaction.atomic():
-                    # 락을 최소화하기 위해 select_for_update는 사용하지 않음
-                    try:
-                        post_obj = Post.objects.get(post_uuid=post_id)
-
-                        daily_stats, created = (
-                            PostDailyStatistics.objects.get_or_create(
-                                post=post_obj,
-                                date=today,
-                                defaults={
-                                    "daily_view_count": view_count,
-                                    "daily_like_count": like_count,
-                                },
-                            )
+            counts_by_post_uuid[post["id"]] = (
+                stats_data["getStats"].get("total", 0),
+                post.get("likes", 0),
+            )
+
+        return counts_by_post_uuid
+
+    async def write_daily_statistics(
+        self,
+        counts_by_post_uuid: dict[str, tuple[int, int]],
+        completed_user_ids: Collection[int] = (),
+    ) -> int:
+        """통계 upsert 와 완료된 사용자의 체크포인트(run_id 가 있을 때)를 한 트랜잭션으로 기록
+
+        Args:
+            counts_by_post_uuid: 게시글 UUID 별 (조회수, 좋아요 수)
+            completed_user_ids: 통계 갱신까지 끝나 DONE 체크포인트를 기록할 사용자 ID
+
+        Returns:
+            upsert 된 통계 row 수
+        """
+        checkpoint_user_ids = list(completed_user_ids) if self.run_id else []
+        if self.db_pool is not None:
+            return await self._write_daily_statistics_async(
+                self.db_pool,
+                counts_by_post_uuid,
+                self.run_id,
+                checkpoint_user_ids,
+            )
+
+        today = get_local_now().date()
+
+        @sync_to_async(thread_sensitive=True)  # type: ignore
+        def _execute_upsert() -> int:
+            with transaction.atomic():
+                post_ids_by_uuid = {
+                    str(post_uuid): post_id
+                    for post_uuid, post_id in Post.objects.filter(
+                        post_uuid__in=counts_by_post_uuid.keys()
+                    ).values_list("post_uuid", "id")
+                }
+
+                missing_post_uuids = (
+                    counts_by_post_uuid.keys() - post_ids_by_uuid
+                )
+                if missing_post_uuids:
+                    logger.warning(
+                        f"Post not found: {list(missing_post_uuids)}"
+                    )
+
+                daily_stats = [
+                    PostDailyStatistics(
+                        post_id=post_ids_by_uuid[post_uuid],
+                        date=today,
+                        daily_view_count=view_count,
+                        daily_like_count=like_count,
+                    )
+                    for post_uuid, (
+                        view_count,
+                        like_count,
+                    ) in counts_by_post_uuid.items()
+                    if post_uuid in post_ids_by_uuid
+                ]
+
+                # 단일 INSERT ... ON CONFLICT (post_id, date) DO UPDATE 문으로 처리
+                PostDailyStatistics.objects.bulk_create(
+                    daily_stats,
+                    update_conflicts=True,
+                    unique_fields=["post", "date"],
+                    update_fields=[
+                        "daily_view_count",
+                        "daily_like_count",
+                        "is_carried",
+                        "updated_at",
+                    ],
+                )
+                ScrapeCheckpoint.objects.bulk_create(
+                    [
+                        ScrapeCheckpoint(
+                            run_id=self.run_id,
+                            user_id=user_id,
+                            step=ScrapeCheckpoint.Step.DONE,
                         )
+                        for user_id in checkpoint_user_ids
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["run_id", "user"],
+                    update_fields=["step", "updated_at"],
+                )
+                return len(daily_stats)
 
-                        if not created:
-                            daily_stats.daily_view_count = view_count
-                            daily_stats.daily_like_count = like_count
-                            daily_stats.updated_at = get_local_now()
-                            daily_stats.save(
-                                update_fields=[
-                                    "daily_view_count",
-                                    "daily_like_count",
-                                    "updated_at",
-                                ]
-                            )
-                    except Post.DoesNotExist as e:
-                        logger.warning(f"Post not found: {post_id}")
-                        sentry_sdk.capture_exception(e)
-                        return
+        written: int = await _execute_upsert()
+        return written
 
-            await update_stats_in_transaction()
+    @staticmethod
+    async def _write_daily_statistics_async(
+        db_pool: AsyncPostgresPool,
+        counts_by_post_uuid: dict[str, tuple[int, int]],
+        run_id: uuid.UUID | None,
+        checkpoint_user_ids: list[int],
+    ) -> int:
+        """write_daily_statistics 의 비동기 커넥션 풀 경로
 
-        except Exception as e:
-            logger.error(
-                f"Failed to update daily statistics for post {post['id']}: {str(e)}"
+        sync_to_async 단일 스레드를 거치지 않으므로 여러 사용자의 통계 upsert 가 동시에 실행됨
+        """
+        today = get_local_date()
+        now = get_local_now()
+
+        async with db_pool.connection() as conn, conn.transaction():
+            cursor = await conn.execute(
+                f"SELECT id, post_uuid FROM {Post._meta.db_table} "
+                "WHERE post_uuid = ANY(%s::uuid[])",
+                [list(counts_by_post_uuid)],
             )
-            sentry_sdk.capture_exception(e)
-            return
+            post_ids_by_uuid = {
+                str(post_uuid): post_id
+                for post_id, post_uuid in await cursor.fetchall()
+            }
+
+            missing_post_uuids = counts_by_post_uuid.keys() - post_ids_by_uuid
+            if missing_post_uuids:
+                logger.warning(f"Post not found: {list(missing_post_uuids)}")
+
+            rows = [
+                (post_ids_by_uuid[post_uuid], view_count, like_count)
+                for post_uuid, (
+                    view_count,
+                    like_count,
+                ) in counts_by_post_uuid.items()
+                if post_uuid in post_ids_by_uuid
+            ]
+            if rows:
+                params: list[Any] = []
+                for post_id, view_count, like_count in rows:
+                    params.extend(
+                        [post_id, today, view_count, like_count, now, now]
+                    )
+                # ORM 경로와 같은 단일 INSERT ... ON CONFLICT (post_id, date) DO UPDATE
+                await conn.execute(
+                    f"""
+                    INSERT INTO {PostDailyStatistics._meta.db_table}
+                        (post_id, date, daily_view_count, daily_like_count,
+                         is_carried, created_at, updated_at)
+                    VALUES {", ".join(["(%s, %s, %s, %s, FALSE, %s, %s)"] * len(rows))}
+                    ON CONFLICT (post_id, date) DO UPDATE SET
+                        daily_view_count = EXCLUDED.daily_view_count,
+                        daily_like_count = EXCLUDED.daily_like_count,
+                        is_carried = EXCLUDED.is_carried,
+                        updated_at = EXCLUDED.updated_at
+                    """,
+                    params,
+                )
+
+            if checkpoint_user_ids:
+                params = []
+                for user_id in checkpoint_user_ids:
+                    params.extend(
+                        [run_id, user_id, ScrapeCheckpoint.Step.DONE, now, now]
+                    )
+                await conn.execute(
+                    f"""
+                    INSERT INTO {ScrapeCheckpoint._meta.db_table}
+                        (run_id, user_id, step, created_at, updated_at)
+                    VALUES {", ".join(["(%s, %s, %s, %s, %s)"] * len(checkpoint_user_ids))}
+                    ON CONFLICT (run_id, user_id) DO UPDATE SET
+                        step = EXCLUDED.step,
+                        updated_at = EXCLUDED.updated_at
+                    """,
+                    params,
+                )
+
+        return len(rows)
 
     async def fetch_post_stats_limited(
-        self, post_id: str, access_token: str, refresh_token: str
+        self,
+        post_id: str,
+        access_token: str,
+        refresh_token: str,
+        session: aiohttp.ClientSession | None = None,
+        semaphore: asyncio.Semaphore | None = None,
     ) -> dict[str, str] | None:
-        """세마포어를 적용한 fetch_post_stats + 엄격한 재시도 로직 추가"""
-        async with self.semaphore:
-            for attempt in range(3):  # 최대 3번 재시도
-                try:
-                    async with async_timeout.timeout(5):  # 5초 타임아웃 설정
-                        stats_results = await fetch_post_stats(
-                            post_id, access_token, refresh_token
-                        )
-                        if not stats_results:
-                            raise Exception("the stats_results is empty")
+        """세마포어를 적용한 fetch_post_stats 단일 시도, 실패하면 None
 
-                        stats_data = stats_results.get("data", {})  # type: ignore
-                        if not stats_data or not isinstance(
-                            stats_data.get("getStats"),  # type: ignore
-                            dict,
-                        ):
-                            raise Exception("the stats_results is empty")
-                        return stats_results
-                except aiohttp.ClientError as e:
-                    logger.warning(
-                        f"Network error fetching post stats (attempt {attempt+1}/3): {e}, "
-                        f"post_id >> {post_id}"
+        실패한 게시글은 동시성 슬롯을 붙잡고 재시도하지 않고,
+        사용자 처리 마지막의 dead-letter 재시도(retry_dead_letter_stats)로 넘김
+        """
+        async with semaphore or self.semaphore:
+            await self.rate_limiter.acquire()
+            try:
+                async with async_timeout.timeout(5):  # 5초 타임아웃 설정
+                    stats_results = await fetch_post_stats(
+                        post_id,
+                        access_token,
+                        refresh_token,
+                        session=session,
+                        retry_attempts=1,
                     )
-                    sentry_sdk.capture_exception(e)
-                except asyncio.TimeoutError as e:
-                    logger.warning(
-                        f"Timeout fetching post stats (attempt {attempt+1}/3), "
-                        f"post_id >> {post_id}"
+                    if not stats_results:
+                        raise Exception("the stats_results is empty")
+
+                    stats_data = stats_results.get("data", {})  # type: ignore
+                    if not stats_data or not isinstance(
+                        stats_data.get("getStats"),  # type: ignore
+                        dict,
+                    ):
+                        raise Exception("the stats_results is empty")
+                    return stats_results
+            except aiohttp.ClientError as e:
+                logger.warning(
+                    f"Network error fetching post stats: {e}, "
+                    f"post_id >> {post_id}"
+                )
+                sentry_sdk.capture_exception(e)
+            except asyncio.TimeoutError as e:
+                logger.warning(
+                    f"Timeout fetching post stats, post_id >> {post_id}"
+                )
+                sentry_sdk.capture_exception(e)
+            except Exception as e:
+                logger.warning(
+                    f"Unexpected error fetching post stats: {e}, {e.__class__}, "
+                    f"post_id >> {post_id}"
+                )
+                sentry_sdk.capture_exception(e)
+            return None
+
+    async def retry_dead_letter_stats(
+        self,
+        dead_letter_posts: list[dict[str, Any]],
+        access_token: str,
+        refresh_token: str,
+        session: aiohttp.ClientSession,
+    ) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+        """통계를 가져오지 못한 게시글을 별도의 동시성 제한으로 재시도
+
+        Returns:
+            재시도로 통계를 가져온 (게시글, 통계 응답) 리스트
+        """
+        retry_semaphore = asyncio.Semaphore(self.DEAD_LETTER_CONCURRENCY)
+        recovered_posts: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        pending_posts = dead_letter_posts
+
+        for _ in range(self.DEAD_LETTER_ATTEMPTS):
+            if not pending_posts:
+                break
+            results = await asyncio.gather(
+                *(
+                    self.fetch_post_stats_limited(
+                        post["id"],
+                        access_token,
+                        refresh_token,
+                        session=session,
+                        semaphore=retry_semaphore,
                     )
-                    sentry_sdk.capture_exception(e)
-                except Exception as e:
-                    logger.warning(
-                        f"Unexpected error fetching post stats (attempt {attempt+1}/3): {e}, {e.__class__}, "
-                        f"post_id >> {post_id}"
+                    for post in pending_posts
+                )
+            )
+            recovered_posts += [
+                (post, stats)
+                for post, stats in zip(pending_posts, results)
+                if stats
+            ]
+            pending_posts = [
+                post
+                for post, stats in zip(pending_posts, results)
+                if not stats
+            ]
+
+        if pending_posts:
+            logger.warning(
+                f"Failed to fetch stats of {len(pending_posts)} posts "
+                f"after dead-letter retries, "
+                f"post_ids >> {[post['id'] for post in pending_posts]}"
+            )
+        return recovered_posts
+
+    async def fetch_posts_stats_batch_limited(
+        self,
+        post_ids: list[str],
+        access_token: str,
+        refresh_token: str,
+        session: aiohttp.ClientSession,
+    ) -> dict[str, dict[str, Any]] | None:
+        """세마포어를 적용한 fetch_posts_stats_batch, 엔드포인트가 batch 를 거부하면 None"""
+        async with self.semaphore:
+            await self.rate_limiter.acquire()
+            try:
+                async with async_timeout.timeout(10):
+                    return await fetch_posts_stats_batch(
+                        session, post_ids, access_token, refresh_token
+                    )
+            except asyncio.TimeoutError as e:
+                # 타임아웃은 batch 거부가 아니므로 단건 요청으로만 대체
+                logger.warning(
+                    f"Timeout fetching batch post stats, post_ids >> {post_ids}"
+                )
+                sentry_sdk.capture_exception(e)
+                return {}
+
+    async def fetch_chunk_stats(
+        self,
+        chunk_posts: list[dict[str, Any]],
+        access_token: str,
+        refresh_token: str,
+        session: aiohttp.ClientSession,
+    ) -> list[dict[str, Any] | None]:
+        """청크 게시글의 통계를 stats_batch_size 단위의 batch 요청으로 가져옴
+
+        batch 로 가져오지 못한 게시글만 단건 요청(fetch_post_stats_limited)으로 대체하며,
+        엔드포인트가 batch 를 거부하면 이후에는 단건 요청만 사용함
+
+        Returns:
+            chunk_posts 와 같은 순서의 통계 응답 리스트, 실패한 게시글은 None
+        """
+        stats_by_post_id: dict[str, dict[str, Any]] = {}
+
+        if self.stats_batch_size > 1 and self.stats_batch_supported:
+            post_ids = [post["id"] for post in chunk_posts]
+            batch_results = await asyncio.gather(
+                *(
+                    self.fetch_posts_stats_batch_limited(
+                        post_ids[i : i + self.stats_batch_size],
+                        access_token,
+                        refresh_token,
+                        session,
+                    )
+                    for i in range(0, len(post_ids), self.stats_batch_size)
+                )
+            )
+            for batch_result in batch_results:
+                if batch_result is None:
+                    if self.stats_batch_supported:
+                        logger.warning(
+                            "Batch stats request is rejected, "
+                            "fall back to single post stats requests"
+                        )
+                    self.stats_batch_supported = False
+                    continue
+                stats_by_post_id.update(batch_result)
+
+        missing_posts = [
+            post for post in chunk_posts if post["id"] not in stats_by_post_id
+        ]
+        fallback_results = await asyncio.gather(
+            *(
+                self.fetch_post_stats_limited(
+                    post["id"],
+                    access_token,
+                    refresh_token,
+                    session=session,
+                )
+                for post in missing_posts
+            )
+        )
+        for post, stats in zip(missing_posts, fallback_results):
+            if stats:
+                stats_by_post_id[post["id"]] = stats
+
+        return [stats_by_post_id.get(post["id"]) for post in chunk_posts]
+
+    def is_full_sync(self) -> bool:
+        """증분 동기화가 꺼져 있거나 주간 전체 동기화 요일이면 전체 동기화"""
+        return (
+            not self.incremental
+            or get_local_now().weekday() == self.FULL_SYNC_WEEKDAY
+        )
+
+    async def get_stored_posts(self, user: User) -> dict[str, dict[str, Any]]:
+        """증분 동기화용, 저장된 활성 게시글을 velog 게시글 목록 응답과 같은 키로 조회
+
+        likes 는 목록을 다시 가져오지 않으므로 마지막 통계의 좋아요 수를 사용
+        """
+        latest_like_count = (
+            PostDailyStatistics.objects.filter(post=OuterRef("pk"))
+            .order_by("-date")
+            .values("daily_like_count")[:1]
+        )
+
+        @sync_to_async(thread_sensitive=True)  # type: ignore
+        def _get_stored_posts() -> dict[str, dict[str, Any]]:
+            return {
+                str(post["post_uuid"]): {
+                    "id": str(post["post_uuid"]),
+                    "title": post["title"],
+                    "url_slug": post["slug"],
+                    "released_at": post["released_at"],
+                    "likes": post["likes"] or 0,
+                }
+                for post in Post.objects.filter(user=user, is_active=True)
+                .annotate(likes=Subquery(latest_like_count))
+                .values("post_uuid", "title", "slug", "released_at", "likes")
+            }
+
+        stored_posts: dict[str, dict[str, Any]] = await _get_stored_posts()
+        return stored_posts
+
+    @staticmethod
+    def parse_released_at(
+        released_at: str | datetime | None,
+    ) -> datetime | None:
+        """velog 응답의 released_at(ISO 문자열)을 저장된 값과 비교할 수 있게 datetime 으로 변환"""
+        if not released_at:
+            return None
+        if isinstance(released_at, datetime):
+            return released_at
+        parsed: datetime | None = parse_datetime(released_at)
+        return parsed
+
+    @staticmethod
+    def is_unchanged_post(
+        post: dict[str, Any], stored_post: dict[str, Any] | None
+    ) -> bool:
+        """velog 게시글이 저장된 게시글과 released_at, 제목, slug 까지 같은지 여부"""
+        if stored_post is None:
+            return False
+        return bool(
+            stored_post["released_at"]
+            == Scraper.parse_released_at(post.get("released_at"))
+            and stored_post["title"] == post.get("title")
+            and stored_post["url_slug"] == post.get("url_slug")
+        )
+
+    async def split_posts_by_refresh_tier(
+        self, user: User, posts: list[dict[str, Any]]
+    ) -> tuple[
+        list[dict[str, Any]], list[tuple[dict[str, Any], dict[str, Any]]]
+    ]:
+        """오늘 통계를 갱신할 게시글과 건너뛸 게시글 분리
+
+        건너뛴 게시글은 save_carried_statistics 로 마지막 조회수를 오늘 통계로 기록(carry forward)해서
+        일별 통계 row 와 대시보드 합계가 유지되도록 함, 조회수 증가량은 갱신된 row 로만 계산
+
+        Returns:
+            (갱신할 게시글 목록, 건너뛴 게시글의 (게시글 데이터, getStats 형태의 마지막 통계) 목록)
+        """
+        scheduler = StatsRefreshScheduler(get_local_now().date())
+        recent = Q(
+            daily_statistics__date__gte=get_local_date()
+            - timedelta(days=scheduler.LOOKBACK_DAYS),
+            daily_statistics__is_carried=False,
+        )
+
+        @sync_to_async(thread_sensitive=True)  # type: ignore
+        def _get_recent_stats() -> dict[str, dict[str, Any]]:
+            return {
+                str(post["post_uuid"]): post
+                for post in Post.objects.filter(
+                    user=user, post_uuid__in=[post["id"] for post in posts]
+                )
+                .annotate(
+                    min_views=Min(
+                        "daily_statistics__daily_view_count", filter=recent
+                    ),
+                    max_views=Max(
+                        "daily_statistics__daily_view_count", filter=recent
+                    ),
+                    first_date=Min("daily_statistics__date", filter=recent),
+                    last_date=Max("daily_statistics__date", filter=recent),
+                )
+                .values(
+                    "id",
+                    "post_uuid",
+                    "released_at",
+                    "min_views",
+                    "max_views",
+                    "first_date",
+                    "last_date",
+                )
+            }
+
+        recent_stats = await _get_recent_stats()
+        due_posts = []
+        carried_posts = []
+        for post in posts:
+            stored = recent_stats.get(post["id"])
+            if stored is None:
+                due_posts.append(post)
+                continue
+
+            interval = scheduler.refresh_interval(
+                scheduler.daily_views(
+                    stored["min_views"],
+                    stored["max_views"],
+                    stored["first_date"],
+                    stored["last_date"],
+                ),
+                stored["released_at"],
+            )
+            if scheduler.is_due(stored["id"], interval):
+                due_posts.append(post)
+            else:
+                # 누적 조회수이므로 최근 최대값이 마지막 조회수
+                carried_posts.append(
+                    (
+                        post,
+                        {"data": {"getStats": {"total": stored["max_views"]}}},
                     )
-                    sentry_sdk.capture_exception(e)
-                await asyncio.sleep(2)  # 재시도 전에 대기
-            return None  # 최종적으로 실패한 경우
+                )
+
+        logger.info(
+            f"Refresh stats for {len(due_posts)} posts, "
+            f"carry forward {len(carried_posts)} posts "
+            f"(user velog uuid: {user.velog_uuid})"
+        )
+        return due_posts, carried_posts
+
+    async def save_carried_statistics(
+        self,
+        posts_with_stats: list[tuple[dict[str, Any], dict[str, Any]]],
+    ) -> int:
+        """건너뛴 게시글의 마지막 조회수를 is_carried 로 표시해 오늘 통계로 기록
+
+        오늘 이미 갱신된 통계가 있으면 덮어쓰지 않음 (INSERT ... ON CONFLICT DO NOTHING)
+
+        Returns:
+            전달된 통계 row 수
+        """
+        counts_by_post_uuid = self.collect_daily_counts(posts_with_stats)
+        if not counts_by_post_uuid:
+            return 0
+
+        today = get_local_now().date()
+
+        @sync_to_async(thread_sensitive=True)  # type: ignore
+        def _insert_carried() -> int:
+            post_ids_by_uuid = {
+                str(post_uuid): post_id
+                for post_uuid, post_id in Post.objects.filter(
+                    post_uuid__in=counts_by_post_uuid.keys()
+                ).values_list("post_uuid", "id")
+            }
+            daily_stats = [
+                PostDailyStatistics(
+                    post_id=post_ids_by_uuid[post_uuid],
+                    date=today,
+                    daily_view_count=view_count,
+                    daily_like_count=like_count,
+                    is_carried=True,
+                )
+                for post_uuid, (
+                    view_count,
+                    like_count,
+                ) in counts_by_post_uuid.items()
+                if post_uuid in post_ids_by_uuid
+            ]
+            PostDailyStatistics.objects.bulk_create(
+                daily_stats, ignore_conflicts=True
+            )
+            return len(daily_stats)
+
+        try:
+            carried: int = await _insert_carried()
+            return carried
+        except Exception as e:
+            logger.error(f"Failed to save carried daily statistics: {e}")
+            sentry_sdk.capture_exception(e)
+            return 0
+
+    async def update_token_health(self, user: User, is_valid: bool) -> None:
+        """토큰 검증 결과 기록, 연속 실패 횟수에 따라 다음 재시도 시간(backoff) 설정"""
+
+        @sync_to_async(thread_sensitive=True)  # type: ignore
+        def _update_token_health() -> None:
+            now = get_local_now()
+            health, _ = UserTokenHealth.objects.get_or_create(user=user)
+            if is_valid:
+                health.last_success_at = now
+                health.consecutive_failures = 0
+                health.next_retry_at = None
+                health.failed_token_digest = ""
+            else:
+                health.last_failure_at = now
+                health.consecutive_failures += 1
+                health.next_retry_at = now + UserTokenHealth.backoff_delay(
+                    health.consecutive_failures
+                )
+                health.failed_token_digest = UserTokenHealth.token_digest(
+                    user.access_token
+                )
+            health.save()
+
+        try:
+            await _update_token_health()
+        except Exception as e:
+            logger.error(
+                f"Failed to update token health: {e} "
+                f"(user velog uuid: {user.velog_uuid})"
+            )
+            sentry_sdk.capture_exception(e)
+
+    def get_checkpoint_run_id(self, user: User) -> uuid.UUID | None:
+        """사용자의 진행 단계를 기록할 run_id, None 이면 기록하지 않음"""
+        return self.run_id
+
+    async def save_checkpoint(
+        self, user: User, step: ScrapeCheckpoint.Step
+    ) -> None:
+        """run_id 가 있으면 사용자별 진행 단계 기록, 실패해도 스크래핑은 계속 진행"""
+        run_id = self.get_checkpoint_run_id(user)
+        if run_id is None:
+            return
+
+        @sync_to_async(thread_sensitive=True)  # type: ignore
+        def _save_checkpoint() -> None:
+            ScrapeCheckpoint.objects.update_or_create(
+                run_id=run_id, user=user, defaults={"step": step}
+            )
+
+        try:
+            await _save_checkpoint()
+        except Exception as e:
+            logger.error(
+                f"Failed to save checkpoint {step}: {e} "
+                f"(user velog uuid: {user.velog_uuid})"
+            )
+            sentry_sdk.capture_exception(e)
+
+    async def exclude_completed_users(self, users: list[User]) -> list[User]:
+        """같은 run_id 로 이미 처리를 완료한 사용자를 제외 (--resume)"""
+        if self.run_id is None:
+            return users
+
+        completed_user_ids = {
+            user_id
+            async for user_id in ScrapeCheckpoint.objects.filter(
+                run_id=self.run_id, step=ScrapeCheckpoint.Step.DONE
+            ).values_list("user_id", flat=True)
+        }
+        if completed_user_ids:
+            logger.info(
+                f"Skip {len(completed_user_ids)} users already completed "
+                f"in run {self.run_id}"
+            )
+        return [user for user in users if user.id not in completed_user_ids]
 
     async def process_user(
         self, user: User, session: aiohttp.ClientSession
@@ -394,15 +1146,26 @@ class Scraper:
             origin_refresh_token,
         )
 
+        # 요청 실패나 currentUser 가 없는 응답은 토큰 상태를 알 수 없으므로 backoff 없이 이번 실행에서만 건너뜀
+        current_user_data = user_data.get("data")
         if (
-            not (user_data or new_user_cookies)
-            or user_data.get("data", {}).get("currentUser") is None
+            not isinstance(current_user_data, dict)
+            or "currentUser" not in current_user_data
         ):
+            logger.warning(
+                f"Skip user because the token check request failed. (user velog uuid: {user.velog_uuid})"
+            )
+            return
+
+        if current_user_data["currentUser"] is None:
             logger.warning(
                 f"Failed to fetch user data because of wrong tokens. (user velog uuid: {user.velog_uuid})"
             )
+            await self.update_token_health(user, is_valid=False)
             return
 
+        await self.update_token_health(user, is_valid=True)
+
         if new_user_cookies:
             user_token_result = await self.update_old_tokens(
                 user,
@@ -422,60 +1185,205 @@ class Scraper:
         )
         if not user_info_result:
             raise Exception("Failed to update user_info, Check the logs")
+        await self.save_checkpoint(user, ScrapeCheckpoint.Step.USER_INFO)  # type: ignore
 
         # ========================================================== #
         # STEP2: 게시물 전체 목록을 가져와서 upsert 와 상태 동기화 (비활성, 활성)
         # ========================================================== #
         username = user_data["data"]["currentUser"]["username"]
-        fetched_posts = await fetch_all_velog_posts(
-            session, username, origin_access_token, origin_refresh_token
-        )
+        full_sync = self.is_full_sync()
+        stored_posts: dict[str, dict[str, Any]] = {}
+        if not full_sync:
+            stored_posts = await self.get_stored_posts(user)
+
+        # 페이지가 도착하는 대로 upsert, 그 동안 다음 페이지는 미리 요청됨
+        fetched_posts: list[dict[str, Any]] = []
+        async for page_posts in iter_velog_posts(
+            session,
+            username,
+            origin_access_token,
+            origin_refresh_token,
+            is_unchanged=(
+                None
+                if full_sync
+                else lambda post: self.is_unchanged_post(
+                    post, stored_posts.get(post["id"])
+                )
+            ),
+        ):
+            # 게시물이 새로 생겼으면 추가, 아니면 업데이트
+            await self.bulk_upsert_posts(user, page_posts)
+            fetched_posts.extend(page_posts)
+
         all_post_ids = {post["id"] for post in fetched_posts}
         logger.info(
-            f"Fetched {len(all_post_ids)} posts for user {user.velog_uuid}"
+            f"Fetched {len(all_post_ids)} posts for user {user.velog_uuid} "
+            f"({'full' if full_sync else 'incremental'} sync)"
         )
 
-        # 게시물이 새로 생겼으면 추가, 아니면 업데이트
-        await self.bulk_upsert_posts(user, fetched_posts)
-
-        # 게시글 활성/비활성 상태 동기화
-        await self.sync_post_active_status(
-            user, all_post_ids, min_posts_threshold=1
-        )
+        if full_sync:
+            # 게시글 활성/비활성 상태 동기화, 전체 목록을 가져온 경우에만 가능
+            await self.sync_post_active_status(
+                user, all_post_ids, min_posts_threshold=1
+            )
+        else:
+            # 증분 동기화로 가져오지 않은 저장된 게시글도 통계는 갱신
+            fetched_posts = fetched_posts + [
+                stored_post
+                for post_uuid, stored_post in stored_posts.items()
+                if post_uuid not in all_post_ids
+            ]
+        await self.save_checkpoint(user, ScrapeCheckpoint.Step.POSTS)  # type: ignore
 
         # ========================================================== #
         # STEP3: 게시물 전체 목록을 기반으로 세부 통계 가져와서 upsert
         # ========================================================== #
-        # 게시물을 적절한 크기의 청크로 나누어 처리
-        chunk_size = 20
+        if self.tiered_refresh:
+            # 조회수 변화가 적은 게시글은 며칠에 한 번만 getStats 요청
+            (
+                fetched_posts,
+                carried_posts,
+            ) = await self.split_posts_by_refresh_tier(user, fetched_posts)
+            if carried_posts:
+                await self.save_carried_statistics(carried_posts)
+
+        # 게시물을 적절한 크기의 청크로 나누어 처리, 청크 당 최대 20개의 요청
+        chunk_size = 20 * self.stats_batch_size
+        # 통계를 가져오지 못한 게시글은 모아서 마지막에 재시도
+        dead_letter_posts: list[dict[str, Any]] = []
         for i in range(0, len(fetched_posts), chunk_size):
             chunk_posts = fetched_posts[i : i + chunk_size]
-            tasks = [
-                self.fetch_post_stats_limited(
-                    post["id"], origin_access_token, origin_refresh_token
-                )
-                for post in chunk_posts
-            ]
-            statistics_results = await asyncio.gather(*tasks)
-
-            # 통계 정보 업데이트 처리
-            update_tasks = []
-            for post, stats in zip(chunk_posts, statistics_results):
-                if stats:
-                    update_tasks.append(
-                        self.update_daily_statistics(post, stats)
-                    )
-
-            if update_tasks:
-                await asyncio.gather(*update_tasks)
+            statistics_results = await self.fetch_chunk_stats(
+                chunk_posts,
+                origin_access_token,
+                origin_refresh_token,
+                session,
+            )
 
-            # 처리 사이에 짧은 대기 시간 추가
-            await asyncio.sleep(0.5)
+            # 청크 단위 통계 정보를 한 번에 upsert
+            posts_with_stats = [
+                (post, stats)
+                for post, stats in zip(chunk_posts, statistics_results)
+                if stats
+            ]
+            if posts_with_stats:
+                await self.save_daily_statistics(user, posts_with_stats)
+            dead_letter_posts += [
+                post
+                for post, stats in zip(chunk_posts, statistics_results)
+                if not stats
+            ]
 
+        if dead_letter_posts:
+            recovered_posts = await self.retry_dead_letter_stats(
+                dead_letter_posts,
+                origin_access_token,
+                origin_refresh_token,
+                session,
+            )
+            if recovered_posts:
+                await self.save_daily_statistics(user, recovered_posts)
+
+        if self.write_buffer is not None:
+            # DONE 체크포인트는 버퍼 flush 때 통계와 같은 트랜잭션으로 기록
+            await self.write_buffer.mark_completed(user.id)
+        else:
+            await self.save_checkpoint(user, ScrapeCheckpoint.Step.DONE)  # type: ignore
         logger.info(
             f"Succeeded to update stats. (user velog uuid: {user.velog_uuid}, email: {user.email})"
         )
 
+    async def process_user_safely(
+        self,
+        user: User,
+        session: aiohttp.ClientSession,
+        user_semaphore: asyncio.Semaphore,
+    ) -> bool:
+        """사용자 단위 동시성 제한과 실패 격리를 적용한 process_user"""
+        async with user_semaphore:
+            try:
+                await self.process_user(user, session)
+                return True
+            except Exception as e:
+                # 한 사용자의 실패가 다른 사용자의 처리를 멈추지 않도록 격리
+                logger.error(
+                    f"Failed to process user: {e} "
+                    f"(user velog uuid: {user.velog_uuid})"
+                )
+                sentry_sdk.capture_exception(e)
+                return False
+
+    async def process_users(
+        self, users: list[User], session: aiohttp.ClientSession
+    ) -> None:
+        """user_concurrency 만큼의 사용자를 동시에 처리, session 과 semaphore 는 공유"""
+        users = await self.exclude_completed_users(users)
+        user_semaphore = asyncio.Semaphore(self.user_concurrency)
+        results = await asyncio.gather(
+            *(
+                self.process_user_safely(user, session, user_semaphore)
+                for user in users
+            )
+        )
+
+        failed_count = results.count(False)
+        if failed_count:
+            logger.warning(
+                f"Failed to process {failed_count} out of {len(users)} users"
+            )
+
+    @asynccontextmanager
+    async def open_db_pool(self) -> AsyncIterator[None]:
+        """run 동안 사용할 비동기 Postgres 커넥션 풀 생성 및 종료"""
+        if not AsyncPostgresPool.is_supported():
+            yield
+            return
+
+        self.db_pool = AsyncPostgresPool.from_django_settings(
+            max_size=self.DB_POOL_SIZE
+        )
+        try:
+            yield
+        finally:
+            await self.db_pool.close()
+            self.db_pool = None
+
+    @asynccontextmanager
+    async def open_write_buffer(self) -> AsyncIterator[None]:
+        """run 동안 사용할 통계 write-behind 버퍼 생성, 종료 시 남은 쓰기를 flush"""
+        self.write_buffer = DailyStatisticsBuffer(
+            self.write_daily_statistics,
+            max_rows=self.WRITE_BUFFER_MAX_ROWS,
+            max_interval=self.WRITE_BUFFER_MAX_INTERVAL,
+        )
+        try:
+            yield
+        finally:
+            await self.write_buffer.flush()
+            logger.info(
+                f"Flushed daily statistics buffer {self.write_buffer.flush_count} times "
+                f"(failed users: {len(self.write_buffer.failed_user_ids)})"
+            )
+            self.write_buffer = None
+
+    def create_session(self) -> aiohttp.ClientSession:
+        """모든 요청이 공유하는 세션 생성, keep-alive 와 DNS 캐시로 커넥션 재사용"""
+        # [25.06.13] 핫픽스: 쿠키 자동 저장 강제 비활성화
+        connector = aiohttp.TCPConnector(
+            limit=30,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        cookie_jar = aiohttp.DummyCookieJar()  # 쿠키 저장 비활성화
+        return aiohttp.ClientSession(
+            connector=connector,
+            cookie_jar=cookie_jar,
+            trace_configs=[
+                create_trace_config(self.connection_stats),
+                create_rate_limit_trace_config(self.rate_limiter),
+            ],
+        )
+
     async def run(self) -> None:
         """스크래핑 작업 실행"""
         logger.info(
@@ -484,36 +1392,50 @@ class Scraper:
             f"{get_local_now().isoformat()}"
         )
 
-        # [25.06.13] 핫픽스: 쿠키 자동 저장 강제 비활성화
-        connector = aiohttp.TCPConnector(limit=30)
-        cookie_jar = aiohttp.DummyCookieJar()  # 쿠키 저장 비활성화
-
         users = [
             user
             async for user in User.objects.filter(
                 group_id__in=self.group_range
-            )
+            ).exclude(UserTokenHealth.in_backoff_q())
         ]
-        async with aiohttp.ClientSession(
-            connector=connector,
-            cookie_jar=cookie_jar,
-        ) as session:
-            for user in users:
-                await self.process_user(user, session)
+        async with (
+            self.create_session() as session,
+            self.open_db_pool(),
+            self.open_write_buffer(),
+        ):
+            await self.process_users(users, session)
 
         logger.info(
-            f"Finished scraping for group range ({min(self.group_range)} ~ {max(self.group_range)})."
+            f"Finished scraping for group range ({min(self.group_range)} ~ {max(self.group_range)}). "
+            f"Connection stats: {self.connection_stats.summary()}, "
+            f"rate limit: {self.rate_limiter.current_rate:.2f} req/s"
         )
 
 
 class ScraperTargetUser(Scraper):
     def __init__(
-        self, user_pk_list: list[int], max_connections: int = 40
+        self,
+        user_pk_list: list[int],
+        max_connections: int = 40,
+        user_concurrency: int = 1,
+        stats_batch_size: int = 10,
+        rate_limiter: RateLimiter | None = None,
+        incremental: bool = False,
+        tiered_refresh: bool = False,
+        run_id: uuid.UUID | None = None,
     ) -> None:
-        self.env = environ.Env()
+        # 그룹 범위 대신 user_pk_list 로 대상 사용자를 지정
+        super().__init__(
+            group_range=range(0),
+            max_connections=max_connections,
+            user_concurrency=user_concurrency,
+            stats_batch_size=stats_batch_size,
+            rate_limiter=rate_limiter,
+            incremental=incremental,
+            tiered_refresh=tiered_refresh,
+            run_id=run_id,
+        )
         self.user_pk_list = user_pk_list
-        # 최대 동시 연결 수 제한
-        self.semaphore = asyncio.Semaphore(max_connections)
 
     async def run(self) -> None:
         """타겟 유저 스크래핑 작업 실행"""
@@ -527,10 +1449,270 @@ class ScraperTargetUser(Scraper):
             user
             async for user in User.objects.filter(id__in=self.user_pk_list)
         ]
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(limit=30)
-        ) as session:
-            for user in users:
-                await self.process_user(user, session)
+        async with (
+            self.create_session() as session,
+            self.open_db_pool(),
+            self.open_write_buffer(),
+        ):
+            await self.process_users(users, session)
+
+        logger.info(
+            f"Finished target user scraping ({self.user_pk_list}). "
+            f"Connection stats: {self.connection_stats.summary()}, "
+            f"rate limit: {self.rate_limiter.current_rate:.2f} req/s"
+        )
+
+
+class ScraperBackfill(ScraperTargetUser):
+    """
+    신규 사용자 온보딩용 스크래퍼
+    일반 사용자 처리(토큰, 게시글 동기화, 오늘 통계) 후 getStats 의 일별 조회수(count_by_day)로
+    과거 일별 통계를 채워서, 매일 쌓기 전에도 대시보드와 주간 분석에 사용할 수 있도록 함
+    """
+
+    async def process_user(
+        self, user: User, session: aiohttp.ClientSession
+    ) -> None:
+        await super().process_user(user, session)
+
+        # 토큰이 유효하지 않아 처리하지 못한 사용자는 건너뜀
+        token_is_valid = await UserTokenHealth.objects.filter(
+            user=user, consecutive_failures=0
+        ).aexists()
+        if token_is_valid:
+            await self.backfill_user_statistics(user, session)
+
+    async def backfill_user_statistics(
+        self, user: User, session: aiohttp.ClientSession
+    ) -> int:
+        """사용자의 모든 활성 게시글 과거 일별 통계를 한 번의 bulk insert 로 기록
+
+        누적 조회수는 전체 조회수에서 이후 날짜의 일별 조회수를 빼서 계산하고,
+        과거 좋아요 수는 알 수 없으므로 현재 좋아요 수를 사용
+        이미 있는 (게시글, 날짜) 통계는 건너뛰고 덮어쓰지 않음
+
+        Returns:
+            새로 기록한 통계 row 수
+        """
+        aes_key_index = (user.group_id % 100) % 10
+        aes_key = self.env(f"AES_KEY_{aes_key_index}").encode()
+        aes_encryption = AESEncryption(aes_key)
+        access_token = aes_encryption.decrypt(user.access_token)
+        refresh_token = aes_encryption.decrypt(user.refresh_token)
+
+        latest_like_count = (
+            PostDailyStatistics.objects.filter(post=OuterRef("pk"))
+            .order_by("-date")
+            .values("daily_like_count")[:1]
+        )
+        posts = [
+            post
+            async for post in Post.objects.filter(user=user, is_active=True)
+            .annotate(likes=Subquery(latest_like_count))
+            .values("id", "post_uuid", "likes")
+        ]
+
+        async def fetch_by_day(post_uuid: str) -> dict[str, Any]:
+            async with self.semaphore:
+                await self.rate_limiter.acquire()
+                return await fetch_post_stats_by_day(
+                    session, post_uuid, access_token, refresh_token
+                )
+
+        results = await asyncio.gather(
+            *(fetch_by_day(str(post["post_uuid"])) for post in posts)
+        )
+
+        existing_days = {
+            (post_id, timezone.localtime(day).date())
+            async for post_id, day in PostDailyStatistics.objects.filter(
+                post_id__in=[post["id"] for post in posts]
+            ).values_list("post_id", "date")
+        }
+
+        today = get_local_now().date()
+        daily_stats = []
+        for post, result in zip(posts, results):
+            stats = (result.get("data") or {}).get("getStats") or {}
+            if not stats:
+                continue
+            # 오늘 통계는 일반 배치에서 기록하므로 어제까지만 채움
+            for day, view_count in self.cumulative_views_by_day(
+                stats.get("total", 0),
+                stats.get("count_by_day") or [],
+                until=today - timedelta(days=1),
+            ):
+                if (post["id"], day) in existing_days:
+                    continue
+                daily_stats.append(
+                    PostDailyStatistics(
+                        post_id=post["id"],
+                        date=timezone.make_aware(
+                            datetime.combine(day, datetime.min.time())
+                        ),
+                        daily_view_count=view_count,
+                        daily_like_count=post["likes"] or 0,
+                    )
+                )
+
+        @sync_to_async(thread_sensitive=True)  # type: ignore
+        def _bulk_insert() -> None:
+            PostDailyStatistics.objects.bulk_create(
+                daily_stats, ignore_conflicts=True, batch_size=1000
+            )
+
+        await _bulk_insert()
+        logger.info(
+            f"Backfilled {len(daily_stats)} daily statistics rows "
+            f"for {len(posts)} posts (user velog uuid: {user.velog_uuid})"
+        )
+        return len(daily_stats)
+
+    @staticmethod
+    def cumulative_views_by_day(
+        total: int,
+        count_by_day: list[dict[str, Any]],
+        until: date | None = None,
+    ) -> list[tuple[date, int]]:
+        """일별 조회수를 날짜별 누적 조회수로 변환, 최신 날짜부터 전체 조회수에서 차감
+
+        가장 이른 날짜부터 until(없으면 가장 최근 날짜)까지 하루도 빠짐없이 반환하며,
+        조회수가 없는 날짜는 직전 날짜의 누적 조회수를 그대로 사용
+        """
+        counts: dict[date, int] = {}
+        for item in count_by_day:
+            day = parse_date(str(item.get("day", ""))[:10])
+            if day is not None:
+                counts[day] = counts.get(day, 0) + int(item.get("count") or 0)
+        if not counts:
+            return []
+
+        end = until or max(counts)
+        # until 이후의 일별 조회수는 until 의 누적 조회수에 포함되지 않음
+        view_count = total - sum(
+            count for day, count in counts.items() if day > end
+        )
+        cumulative = []
+        day = end
+        while day >= min(counts):
+            cumulative.append((day, max(0, view_count)))
+            view_count -= counts.get(day, 0)
+            day -= timedelta(days=1)
+        return cumulative
 
-        logger.info(f"Finished target user scraping ({self.user_pk_list}).")
+
+class ScraperQueueWorker(Scraper):
+    """ScrapeJob 작업 큐에서 사용자 단위 작업을 가져와 처리하는 워커"""
+
+    def __init__(
+        self,
+        worker_id: str,
+        lease_seconds: int = 600,
+        max_connections: int = 40,
+        user_concurrency: int = 1,
+        stats_batch_size: int = 10,
+        rate_limiter: RateLimiter | None = None,
+        incremental: bool = False,
+        tiered_refresh: bool = False,
+        poll_seconds: float = 0,
+    ) -> None:
+        # 대상 사용자는 작업 큐에서 가져오고, 체크포인트는 처리 중인 작업의 run_id 로 기록 (get_checkpoint_run_id)
+        super().__init__(
+            group_range=range(0),
+            max_connections=max_connections,
+            user_concurrency=user_concurrency,
+            stats_batch_size=stats_batch_size,
+            rate_limiter=rate_limiter,
+            incremental=incremental,
+            tiered_refresh=tiered_refresh,
+        )
+        self.worker_id = worker_id
+        self.queue = ScrapeJobQueue(worker_id, lease_seconds=lease_seconds)
+        # 0 보다 크면 작업 큐가 비어도 종료하지 않고 poll_seconds 마다 새 작업 확인 (관리자 요청 처리용)
+        self.poll_seconds = poll_seconds
+        # 처리 중인 작업의 사용자 id 별 run_id
+        self.job_run_ids: dict[int, uuid.UUID] = {}
+
+    def get_checkpoint_run_id(self, user: User) -> uuid.UUID | None:
+        """작업 묶음(run_id) 별 진행 상황을 관리자 작업 상태 페이지에서 볼 수 있도록 작업의 run_id 사용"""
+        return self.job_run_ids.get(user.id)
+
+    async def keep_lease(self, job: ScrapeJob) -> None:
+        """작업을 처리하는 동안 lease 가 만료되지 않도록 주기적으로 연장"""
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            renewed = await sync_to_async(
+                self.queue.renew, thread_sensitive=True
+            )(job)
+            if not renewed:
+                logger.warning(
+                    f"Lost the lease of scrape job {job.id} "
+                    f"(worker: {self.worker_id})"
+                )
+                return
+
+    async def process_job(
+        self, job: ScrapeJob, session: aiohttp.ClientSession
+    ) -> bool:
+        """작업 하나를 처리하고 결과를 작업 큐에 반영"""
+        lease_task = asyncio.create_task(self.keep_lease(job))
+        self.job_run_ids[job.user_id] = job.run_id
+        error: str | None = None
+        try:
+            await self.process_user(job.user, session)
+        except Exception as e:
+            logger.error(
+                f"Failed to process scrape job {job.id}: {e} "
+                f"(user velog uuid: {job.user.velog_uuid})"
+            )
+            sentry_sdk.capture_exception(e)
+            error = str(e)
+        finally:
+            lease_task.cancel()
+            self.job_run_ids.pop(job.user_id, None)
+
+        if error is None:
+            await sync_to_async(self.queue.complete, thread_sensitive=True)(
+                job
+            )
+            return True
+        await sync_to_async(self.queue.fail, thread_sensitive=True)(job, error)
+        return False
+
+    async def work(self, session: aiohttp.ClientSession) -> int:
+        """작업 큐가 빌 때까지 작업을 하나씩 가져와 처리, 처리한 작업 수 반환
+
+        poll_seconds 가 있으면 작업 큐가 비어도 종료하지 않고 새 작업을 기다림
+        """
+        processed_count = 0
+        while True:
+            jobs = await sync_to_async(
+                self.queue.claim, thread_sensitive=True
+            )(1)
+            if not jobs:
+                if self.poll_seconds <= 0:
+                    return processed_count
+                await asyncio.sleep(self.poll_seconds)
+                continue
+            await self.process_job(jobs[0], session)
+            processed_count += 1
+
+    async def run(self) -> None:
+        """user_concurrency 개의 작업 루프를 돌며 작업 큐를 소진"""
+        logger.info(
+            f"Start scrape queue worker ({self.worker_id}) \n"
+            f"{get_local_now().isoformat()}"
+        )
+
+        async with self.create_session() as session, self.open_db_pool():
+            # 느린 사용자가 있어도 다른 루프는 계속 다음 작업을 가져감
+            processed_counts = await asyncio.gather(
+                *(self.work(session) for _ in range(self.user_concurrency))
+            )
+
+        logger.info(
+            f"Finished scrape queue worker ({self.worker_id}), "
+            f"processed {sum(processed_counts)} jobs. "
+            f"Connection stats: {self.connection_stats.summary()}, "
+            f"rate limit: {self.rate_limiter.current_rate:.2f} req/s"
+        )
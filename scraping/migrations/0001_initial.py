@@ -0,0 +1,118 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("users", "0013_user_thumbnail"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScrapeJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="생성 일시"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="수정 일시"
+                    ),
+                ),
+                (
+                    "run_id",
+                    models.UUIDField(
+                        db_index=True,
+                        help_text="같은 시점에 함께 등록된 작업 묶음의 ID 입니다.",
+                        verbose_name="실행 ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("running", "진행 중"),
+                            ("done", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                        verbose_name="상태",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="시도 횟수"
+                    ),
+                ),
+                (
+                    "lease_owner",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="작업을 가져간 워커의 ID 입니다.",
+                        max_length=255,
+                        verbose_name="워커 ID",
+                    ),
+                ),
+                (
+                    "lease_expires_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="lease 만료 시간"
+                    ),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="종료 시간"
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True,
+                        default="",
+                        verbose_name="마지막 오류 메시지",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scrape_jobs",
+                        to="users.user",
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "스크래핑 작업",
+                "verbose_name_plural": "스크래핑 작업 목록",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "lease_expires_at"],
+                        name="scraping_sc_status_035e44_idx",
+                    )
+                ],
+            },
+        ),
+    ]
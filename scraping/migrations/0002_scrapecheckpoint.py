@@ -0,0 +1,67 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("scraping", "0001_initial"),
+        ("users", "0013_user_thumbnail"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScrapeCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="생성 일시"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="수정 일시"
+                    ),
+                ),
+                ("run_id", models.UUIDField(verbose_name="실행 ID")),
+                (
+                    "step",
+                    models.CharField(
+                        choices=[
+                            ("user_info", "토큰, 사용자 정보 갱신"),
+                            ("posts", "게시글 목록 동기화"),
+                            ("done", "통계 갱신 완료"),
+                        ],
+                        max_length=16,
+                        verbose_name="마지막 완료 단계",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scrape_checkpoints",
+                        to="users.user",
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "스크래핑 체크포인트",
+                "verbose_name_plural": "스크래핑 체크포인트 목록",
+                "unique_together": {("run_id", "user")},
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("scraping", "0002_scrapecheckpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TrendingPostSample",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "bucket",
+                    models.DateTimeField(verbose_name="샘플 시간 구간"),
+                ),
+                ("post_uuid", models.UUIDField(verbose_name="게시글 UUID")),
+                (
+                    "rank",
+                    models.PositiveSmallIntegerField(verbose_name="인기 순위"),
+                ),
+                (
+                    "likes",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="좋아요 수"
+                    ),
+                ),
+                (
+                    "comments_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="댓글 수"
+                    ),
+                ),
+                (
+                    "views",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        help_text="작성자가 가입한 사용자인 경우에만 조회 가능합니다.",
+                        null=True,
+                        verbose_name="조회수",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "인기 게시글 샘플",
+                "verbose_name_plural": "인기 게시글 샘플 목록",
+                "indexes": [
+                    models.Index(
+                        fields=["bucket"], name="scraping_tr_bucket_83fe73_idx"
+                    )
+                ],
+                "unique_together": {("post_uuid", "bucket")},
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.6 on 2026-10-17 05:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("scraping", "0003_trendingpostsample"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RateLimitBudget",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=50, unique=True, verbose_name="예산 이름"
+                    ),
+                ),
+                (
+                    "tokens",
+                    models.FloatField(default=0, verbose_name="남은 토큰 수"),
+                ),
+                (
+                    "refilled_at",
+                    models.DateTimeField(verbose_name="마지막 충전 시간"),
+                ),
+            ],
+            options={
+                "verbose_name": "요청 예산",
+                "verbose_name_plural": "요청 예산 목록",
+            },
+        ),
+    ]
@@ -0,0 +1,156 @@
+from django.db import models
+
+from common.models import TimeStampedModel
+from users.models import User
+
+
+class ScrapeJob(TimeStampedModel):
+    """
+    사용자 단위 스크래핑 작업 큐
+    워커는 SELECT ... FOR UPDATE SKIP LOCKED 로 작업을 가져가고(lease),
+    lease 가 만료된 작업은 다른 워커가 다시 가져갈 수 있음
+    """
+
+    class Status(models.TextChoices):  # type: ignore
+        PENDING = "pending", "대기"
+        RUNNING = "running", "진행 중"
+        DONE = "done", "완료"
+        FAILED = "failed", "실패"
+
+    run_id = models.UUIDField(
+        db_index=True,
+        help_text="같은 시점에 함께 등록된 작업 묶음의 ID 입니다.",
+        verbose_name="실행 ID",
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="scrape_jobs",
+        verbose_name="사용자",
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="상태",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name="시도 횟수"
+    )
+    lease_owner = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="작업을 가져간 워커의 ID 입니다.",
+        verbose_name="워커 ID",
+    )
+    lease_expires_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="lease 만료 시간"
+    )
+    finished_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="종료 시간"
+    )
+    last_error = models.TextField(
+        blank=True, default="", verbose_name="마지막 오류 메시지"
+    )
+
+    class Meta:
+        verbose_name = "스크래핑 작업"
+        verbose_name_plural = "스크래핑 작업 목록"
+        indexes = [
+            # 워커가 가져갈 작업(대기 또는 lease 만료)을 찾는 조회용
+            models.Index(fields=["status", "lease_expires_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"[{self.pk}] {self.user_id} ({self.status})"
+
+
+class ScrapeCheckpoint(TimeStampedModel):
+    """
+    배치 실행(run) 단위 사용자별 진행 상황
+    배치가 중간에 종료되면 --resume <run-id> 로 완료된 사용자를 건너뛰고 재실행
+    """
+
+    class Step(models.TextChoices):  # type: ignore
+        USER_INFO = "user_info", "토큰, 사용자 정보 갱신"
+        POSTS = "posts", "게시글 목록 동기화"
+        DONE = "done", "통계 갱신 완료"
+
+    run_id = models.UUIDField(verbose_name="실행 ID")
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="scrape_checkpoints",
+        verbose_name="사용자",
+    )
+    step = models.CharField(
+        max_length=16,
+        choices=Step.choices,
+        verbose_name="마지막 완료 단계",
+    )
+
+    class Meta:
+        verbose_name = "스크래핑 체크포인트"
+        verbose_name_plural = "스크래핑 체크포인트 목록"
+        unique_together = ["run_id", "user"]
+
+    def __str__(self) -> str:
+        return f"[{self.run_id}] {self.user_id} ({self.step})"
+
+
+class TrendingPostSample(models.Model):  # type: ignore
+    """
+    인기 게시글 고빈도 샘플 (trending_sampler)
+    N 분 단위 bucket 마다 현재 인기 게시글의 순위, 좋아요, 조회수를 기록하고 RETENTION_DAYS 가 지나면 삭제
+    사용자 단위 야간 배치와는 별개로, 작성자가 가입하지 않은 게시글도 포함됨
+    """
+
+    # 샘플 보관 기간 (일)
+    RETENTION_DAYS = 7
+
+    bucket = models.DateTimeField(verbose_name="샘플 시간 구간")
+    post_uuid = models.UUIDField(verbose_name="게시글 UUID")
+    rank = models.PositiveSmallIntegerField(verbose_name="인기 순위")
+    likes = models.PositiveIntegerField(default=0, verbose_name="좋아요 수")
+    comments_count = models.PositiveIntegerField(
+        default=0, verbose_name="댓글 수"
+    )
+    views = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="작성자가 가입한 사용자인 경우에만 조회 가능합니다.",
+        verbose_name="조회수",
+    )
+
+    class Meta:
+        verbose_name = "인기 게시글 샘플"
+        verbose_name_plural = "인기 게시글 샘플 목록"
+        unique_together = ["post_uuid", "bucket"]
+        indexes = [
+            # 보관 기간 정리와 구간별 조회용
+            models.Index(fields=["bucket"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"[{self.bucket}] {self.post_uuid} (#{self.rank})"
+
+
+class RateLimitBudget(models.Model):  # type: ignore
+    """
+    여러 프로세스가 함께 쓰는 velog 요청 예산 (SharedRateBudget 의 token bucket)
+    야간 배치 워크플로들과 신규 사용자 우선 처리 레인이 같은 row 에서 토큰을 가져가므로 전체 요청 수가 함께 제한됨
+    """
+
+    name = models.CharField(
+        max_length=50, unique=True, verbose_name="예산 이름"
+    )
+    tokens = models.FloatField(default=0, verbose_name="남은 토큰 수")
+    refilled_at = models.DateTimeField(verbose_name="마지막 충전 시간")
+
+    class Meta:
+        verbose_name = "요청 예산"
+        verbose_name_plural = "요청 예산 목록"
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.tokens:.1f})"
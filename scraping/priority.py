@@ -0,0 +1,115 @@
+import asyncio
+import logging
+
+import sentry_sdk
+from asgiref.sync import sync_to_async
+
+from scraping.main import ScraperBackfill
+from scraping.rate_limiter import AdaptiveRateLimiter, SharedRateBudget
+from users.models import User, UserTokenHealth
+from utils.utils import get_local_now
+
+logger = logging.getLogger("scraping")
+
+
+class PriorityLane:
+    """
+    신규 사용자 우선 처리 레인
+    한 번도 처리되지 않은 사용자(토큰 상태 기록과 게시글이 없는 사용자)를 poll_seconds 마다 찾아
+    첫 동기화와 과거 통계 backfill(ScraperBackfill)을 바로 실행
+    rate limiter 는 poll 간에 유지되고 max_rate 로 상한을 낮게 잡으며, 야간 배치와 같은 요청 예산
+    (SharedRateBudget)에서 토큰을 받으므로 함께 실행돼도 전체 요청 수가 VELOG_SHARED_RATE_LIMIT 를 넘지 않음
+    """
+
+    def __init__(
+        self,
+        poll_seconds: int = 60,
+        batch_size: int = 20,
+        user_concurrency: int = 2,
+        max_rate: float = 2.0,
+    ) -> None:
+        self.poll_seconds = poll_seconds
+        self.batch_size = batch_size
+        self.user_concurrency = user_concurrency
+        self.rate_limiter = AdaptiveRateLimiter(
+            initial_rate=max_rate,
+            min_rate=min(1.0, max_rate),
+            max_rate=max_rate,
+            # 요청 수가 적으므로 토큰을 하나씩 받아 야간 배치 몫을 미리 가져가지 않음
+            shared_budget=SharedRateBudget.from_settings(lease_size=1),
+        )
+
+    def get_pending_user_pks(self) -> list[int]:
+        """아직 한 번도 처리되지 않은 신규 사용자, 먼저 가입한 순서"""
+        return list(
+            User.objects.filter(
+                is_active=True,
+                token_health__isnull=True,
+                posts__isnull=True,
+            )
+            .order_by("created_at")
+            .values_list("pk", flat=True)[: self.batch_size]
+        )
+
+    def mark_unprocessed_users(self, user_pk_list: list[int]) -> int:
+        """토큰 상태를 기록하지 못하고 끝난 사용자에게 실패 기록을 남겨 다음 poll 과 데몬 재시작 후에 다시 처리하지 않음
+
+        요청 실패처럼 토큰 문제가 아닐 수 있으므로 backoff 없이 기록만 하고, 야간 배치에서 다시 처리됨
+
+        Returns:
+            실패를 기록한 사용자 수
+        """
+        unprocessed_user_pks = User.objects.filter(
+            pk__in=user_pk_list, token_health__isnull=True
+        ).values_list("pk", flat=True)
+        now = get_local_now()
+        created = UserTokenHealth.objects.bulk_create(
+            [
+                UserTokenHealth(user_id=user_pk, last_failure_at=now)
+                for user_pk in unprocessed_user_pks
+            ],
+            ignore_conflicts=True,
+        )
+        if created:
+            logger.warning(
+                f"Priority lane failed to process users: "
+                f"{[health.user_id for health in created]}"
+            )
+        return len(created)
+
+    async def run_once(self) -> int:
+        """신규 사용자를 한 번 처리, 처리한 사용자 수 반환"""
+        user_pk_list = await sync_to_async(
+            self.get_pending_user_pks, thread_sensitive=True
+        )()
+        if not user_pk_list:
+            return 0
+
+        logger.info(f"Priority lane picked up new users: {user_pk_list}")
+        try:
+            await ScraperBackfill(
+                user_pk_list,
+                user_concurrency=self.user_concurrency,
+                rate_limiter=self.rate_limiter,
+            ).run()
+        finally:
+            await sync_to_async(
+                self.mark_unprocessed_users, thread_sensitive=True
+            )(user_pk_list)
+        return len(user_pk_list)
+
+    async def run(self, once: bool = False) -> None:
+        """poll_seconds 마다 신규 사용자를 처리, once 면 한 번만 실행"""
+        while True:
+            try:
+                processed_count = await self.run_once()
+            except Exception as e:
+                # 한 번의 실패로 데몬이 멈추지 않도록 다음 poll 에 다시 시도
+                logger.error(f"Failed to process priority lane: {e}")
+                sentry_sdk.capture_exception(e)
+                processed_count = 0
+            if once:
+                return
+            # 처리할 사용자가 남아 있을 수 있으면 바로 다음 묶음 처리
+            if processed_count < self.batch_size:
+                await asyncio.sleep(self.poll_seconds)
@@ -0,0 +1,75 @@
+"""
+[26.10.17] 신규 사용자 우선 처리 데몬
+- 신규 사용자는 랜덤 group_id 가 다음 aggregate_batch 실행 범위에 들어올 때까지 데이터가 없음
+- 한 번도 처리되지 않은 사용자를 poll 간격마다 찾아 첫 동기화와 과거 통계 backfill 을 바로 실행
+- 요청 속도 상한(--max-rate)을 낮게 유지하고 429/지연 응답에 맞춰 줄이므로 야간 배치와 함께 실행 가능
+- 야간 배치와 같은 velog 요청 예산(VELOG_SHARED_RATE_LIMIT)을 DB 로 공유해 전체 요청 수가 함께 제한됨
+- 처리하지 못한 신규 사용자는 토큰 상태에 실패를 기록해 재시작 후에도 다시 시도하지 않고 야간 배치에서 처리
+- 실행은 아래와 같은 커멘드 활용
+- poetry run python ./scraping/priority_daemon.py
+- poetry run python ./scraping/priority_daemon.py --poll-seconds 30 --max-rate 3
+- poetry run python ./scraping/priority_daemon.py --once
+- 운영에서는 run-priority-lane.yaml 워크플로가 5분마다 --once 로 실행
+"""
+
+import argparse
+import asyncio
+import warnings
+
+import setup_django  # noqa
+
+from scraping.priority import PriorityLane
+
+# Django에서 발생하는 RuntimeWarning 무시
+warnings.filterwarnings(
+    "ignore",
+    message=r"DateTimeField .* received a naive datetime",
+    category=RuntimeWarning,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--poll-seconds",
+        type=int,
+        default=60,
+        help="Seconds between checks for new users",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=20,
+        help="Maximum number of new users processed per poll",
+    )
+    parser.add_argument(
+        "--user-concurrency",
+        type=int,
+        default=2,
+        help="Number of users processed concurrently",
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        default=2.0,
+        help="Upper bound of velog requests per second",
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Process pending new users once and exit (for cron)",
+    )
+    args = parser.parse_args()
+
+    lane = PriorityLane(
+        poll_seconds=args.poll_seconds,
+        batch_size=args.batch_size,
+        user_concurrency=args.user_concurrency,
+        max_rate=args.max_rate,
+    )
+    asyncio.run(lane.run(once=args.once))
+
+
+# 실행
+if __name__ == "__main__":
+    main()
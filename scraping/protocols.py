@@ -25,3 +25,26 @@ class HttpSession(Protocol):
             비동기 컨텍스트 관리자 (async with에서 사용 가능)
         """
         ...
+
+
+class RateLimiter(Protocol):
+    """요청 속도를 제어하는 rate limiter 를 위한 프로토콜."""
+
+    @property
+    def current_rate(self) -> float:
+        """현재 허용 중인 초당 요청 수"""
+        ...
+
+    async def acquire(self) -> None:
+        """요청 하나를 보낼 수 있을 때까지 대기합니다."""
+        ...
+
+    def record(self, status: int | None, latency: float) -> None:
+        """
+        요청 결과를 반영해 요청 속도를 조절합니다.
+
+        Args:
+            status: 응답 상태 코드, 네트워크 오류나 타임아웃이면 None
+            latency: 요청부터 응답 헤더 수신까지 걸린 시간(초)
+        """
+        ...
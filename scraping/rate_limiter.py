@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+from aiohttp import (
+    TraceConfig,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceRequestStartParams,
+)
+from aiohttp.client import ClientSession
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from scraping.models import RateLimitBudget
+from scraping.protocols import RateLimiter
+
+logger = logging.getLogger("scraping")
+
+
+class SharedRateBudget:
+    """여러 프로세스가 함께 쓰는 초당 요청 예산, DB 의 RateLimitBudget row 를 token bucket 으로 사용
+
+    야간 배치는 여러 워크플로와 프로세스에서, 신규 사용자 우선 처리 레인은 별도 데몬에서 실행되므로
+    프로세스 안의 rate limiter 만으로는 전체 요청 수를 제한할 수 없음
+    DB 왕복을 줄이기 위해 토큰을 lease_size 개씩 가져와 프로세스 안에서 나눠 씀
+    """
+
+    # 야간 배치와 우선 처리 레인이 함께 쓰는 예산 이름
+    DEFAULT_NAME = "velog"
+    # 한 번에 가져올 최대 토큰 수
+    LEASE_SIZE = 10
+
+    def __init__(
+        self,
+        rate: float,
+        name: str = DEFAULT_NAME,
+        lease_size: int = LEASE_SIZE,
+    ) -> None:
+        """
+        Args:
+            rate: 모든 프로세스를 합친 초당 요청 수
+            name: 예산 이름, 같은 이름을 쓰는 프로세스끼리 예산을 공유
+            lease_size: 한 번에 가져올 최대 토큰 수
+        """
+        self.rate = rate
+        self.name = name
+        self.lease_size = max(1, lease_size)
+        self._tokens = 0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_settings(
+        cls, lease_size: int = LEASE_SIZE
+    ) -> "SharedRateBudget | None":
+        """VELOG_SHARED_RATE_LIMIT 설정으로 생성, 0 이면 공유 예산을 사용하지 않음"""
+        rate = float(getattr(settings, "VELOG_SHARED_RATE_LIMIT", 0))
+        if rate <= 0:
+            return None
+        return cls(rate, lease_size=lease_size)
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while self._tokens < 1:
+                granted, wait = await sync_to_async(
+                    self.lease, thread_sensitive=True
+                )()
+                self._tokens += granted
+                if not granted:
+                    await asyncio.sleep(wait)
+            self._tokens -= 1
+
+    def lease(self) -> tuple[int, float]:
+        """예산에서 최대 lease_size 개의 토큰을 가져옴
+
+        Returns:
+            (가져온 토큰 수, 가져오지 못했으면 다음 토큰까지 기다릴 시간(초))
+        """
+        # 버스트는 1초 분량의 요청까지만 허용
+        capacity = max(1.0, self.rate)
+        with transaction.atomic():
+            # 처음 사용하는 예산이면 row 생성, 동시에 생성해도 충돌하지 않음
+            RateLimitBudget.objects.bulk_create(
+                [
+                    RateLimitBudget(
+                        name=self.name,
+                        tokens=capacity,
+                        refilled_at=timezone.now(),
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+            budget = RateLimitBudget.objects.select_for_update().get(
+                name=self.name
+            )
+            # 락을 얻은 뒤의 시간으로 충전해야 먼저 충전한 프로세스보다 이전 시간이 기록되지 않음
+            now = timezone.now()
+            elapsed = max(0.0, (now - budget.refilled_at).total_seconds())
+            tokens = min(capacity, budget.tokens + elapsed * self.rate)
+            granted = min(self.lease_size, int(tokens))
+            budget.tokens = tokens - granted
+            budget.refilled_at = now
+            budget.save(update_fields=["tokens", "refilled_at"])
+
+        wait = 0.0 if granted else (1 - budget.tokens) / self.rate
+        return granted, wait
+
+
+class AdaptiveRateLimiter:
+    """AIMD 로 초당 요청 수를 조절하는 token bucket
+
+    빠른 200 응답이 이어지면 요청 속도를 선형으로 올리고,
+    429/5xx, 네트워크 오류 또는 응답 지연이 늘어나면 요청 속도를 배수로 줄임
+    shared_budget 이 있으면 다른 프로세스와 함께 쓰는 예산에서도 토큰을 받아야 요청함
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 10.0,
+        min_rate: float = 1.0,
+        max_rate: float = 100.0,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_threshold: float = 2.0,
+        decrease_cooldown: float = 1.0,
+        shared_budget: SharedRateBudget | None = None,
+    ) -> None:
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        # 평균 응답 지연(EWMA)이 이 값(초)을 넘으면 혼잡으로 판단
+        self.latency_threshold = latency_threshold
+        # 동시에 실패한 요청들로 속도가 연달아 줄어들지 않도록 하는 간격(초)
+        self.decrease_cooldown = decrease_cooldown
+        self.shared_budget = shared_budget
+
+        self._rate = min(max(initial_rate, min_rate), max_rate)
+        self._tokens = 1.0
+        self._updated_at = time.monotonic()
+        self._decreased_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+        self.latency_ewma: float | None = None
+        self.throttled_count = 0
+        self.decrease_count = 0
+
+    @property
+    def current_rate(self) -> float:
+        return self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        # 버스트는 1초 분량의 요청까지만 허용
+        burst = max(1.0, self._rate)
+        elapsed = now - self._updated_at
+        self._tokens = min(burst, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+        if self.shared_budget is not None:
+            await self.shared_budget.acquire()
+
+    def record(self, status: int | None, latency: float) -> None:
+        if status is None or status == 429 or status >= 500:
+            self.throttled_count += 1
+            self._decrease(f"status={status}")
+            return
+
+        self.latency_ewma = (
+            latency
+            if self.latency_ewma is None
+            else 0.8 * self.latency_ewma + 0.2 * latency
+        )
+        if self.latency_ewma > self.latency_threshold:
+            self._decrease(f"latency={self.latency_ewma:.2f}s")
+            return
+
+        # 응답 하나마다 step / rate 씩 올려 초당 약 step 만큼 증가
+        self._refill()
+        self._rate = min(
+            self.max_rate, self._rate + self.increase_step / self._rate
+        )
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._decreased_at < self.decrease_cooldown:
+            return
+        self._refill()
+        self._decreased_at = now
+        self.decrease_count += 1
+        self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+        logger.debug(
+            f"Rate limiter backed off to {self._rate:.2f} req/s ({reason})"
+        )
+
+    def summary(self) -> str:
+        latency = (
+            f"{self.latency_ewma:.3f}s"
+            if self.latency_ewma is not None
+            else "n/a"
+        )
+        return (
+            f"current_rate={self._rate:.2f}/s, "
+            f"latency_ewma={latency}, "
+            f"throttled={self.throttled_count}, "
+            f"decreases={self.decrease_count}"
+        )
+
+
+def create_rate_limit_trace_config(rate_limiter: RateLimiter) -> TraceConfig:
+    """aiohttp 세션의 모든 응답 상태와 지연 시간을 rate limiter 에 반영하는 TraceConfig 생성"""
+
+    async def on_request_start(
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ) -> None:
+        ctx.started_at = time.monotonic()
+
+    async def on_request_end(
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        rate_limiter.record(
+            params.response.status, time.monotonic() - ctx.started_at
+        )
+
+    async def on_request_exception(
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceRequestExceptionParams,
+    ) -> None:
+        rate_limiter.record(None, time.monotonic() - ctx.started_at)
+
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
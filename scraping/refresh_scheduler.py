@@ -0,0 +1,71 @@
+from datetime import date, datetime
+
+
+class StatsRefreshScheduler:
+    """
+    게시글 통계 갱신 주기(tier) 스케줄러
+    최근 하루 평균 조회수 증가량과 게시글 나이로 갱신 주기를 나누고,
+    주기가 긴 게시글은 게시글 id 로 갱신일을 분산해서 매일 요청 수가 고르게 유지되도록 함
+    주간 분석(UserWeeklyAnalyzer)은 7일 전과 오늘의 통계 차이를 사용하므로 BOUNDARY_WEEKDAY 에는 모든 게시글 갱신
+    """
+
+    # 조회수 증가량을 계산할 최근 기간
+    LOOKBACK_DAYS = 7
+    # 발행 후 이 기간 동안은 매일 갱신
+    NEW_POST_DAYS = 14
+    # 최근 하루 평균 조회수 증가량 기준
+    HOT_DAILY_VIEWS = 5
+    WARM_DAILY_VIEWS = 1
+    WARM_INTERVAL_DAYS = 2
+    COLD_INTERVAL_DAYS = 4
+    # 주간 분석 기준 요일 (월요일), 모든 게시글 갱신
+    BOUNDARY_WEEKDAY = 0
+
+    def __init__(self, today: date) -> None:
+        self.today = today
+
+    def refresh_interval(
+        self, daily_views: float | None, released_at: datetime | None
+    ) -> int:
+        """게시글의 갱신 주기(일), 최근 통계가 없거나 새 게시글이면 매일"""
+        if daily_views is None:
+            return 1
+        if (
+            released_at is not None
+            and (self.today - released_at.date()).days < self.NEW_POST_DAYS
+        ):
+            return 1
+        if daily_views >= self.HOT_DAILY_VIEWS:
+            return 1
+        if daily_views >= self.WARM_DAILY_VIEWS:
+            return self.WARM_INTERVAL_DAYS
+        return self.COLD_INTERVAL_DAYS
+
+    def is_due(self, post_id: int, interval: int) -> bool:
+        """오늘 통계를 갱신해야 하는지 여부"""
+        if interval <= 1 or self.today.weekday() == self.BOUNDARY_WEEKDAY:
+            return True
+        return (self.today.toordinal() + post_id) % interval == 0
+
+    @staticmethod
+    def daily_views(
+        min_views: int | None,
+        max_views: int | None,
+        first_date: date | None,
+        last_date: date | None,
+    ) -> float | None:
+        """최근 기간의 누적 조회수 최소/최대 값으로 하루 평균 증가량 계산
+
+        이틀 이상의 통계가 없으면 증가량을 알 수 없으므로 None
+        """
+        if (
+            min_views is None
+            or max_views is None
+            or first_date is None
+            or last_date is None
+        ):
+            return None
+        days = (last_date - first_date).days
+        if days < 1:
+            return None
+        return (max_views - min_views) / days
@@ -1,11 +1,31 @@
+import asyncio
 import uuid
 
 import pytest
+from asgiref.sync import sync_to_async
+from django.db import connections
 
 from scraping.main import Scraper
 from users.models import User
 
 
+@pytest.fixture(scope="session", autouse=True)
+def close_sync_to_async_connections(django_db_setup, django_db_blocker):
+    """비동기 테스트의 sync_to_async(thread_sensitive=True) 스레드에 남은 DB 커넥션을
+    테스트 DB 삭제 전에 닫음 (열려 있으면 "other session" 경고와 함께 DB 가 남음)"""
+    yield
+    with django_db_blocker.unblock():
+        asyncio.run(
+            sync_to_async(connections.close_all, thread_sensitive=True)()
+        )
+
+
+@pytest.fixture(autouse=True)
+def disable_shared_rate_budget(settings):
+    """DB 를 사용하지 않는 테스트에서도 rate limiter 를 쓸 수 있도록 공유 요청 예산은 끔"""
+    settings.VELOG_SHARED_RATE_LIMIT = 0
+
+
 @pytest.fixture
 def scraper():
     """Scraper 인스턴스 생성"""
@@ -76,3 +96,17 @@ def mock_posts_data():
 def mock_stats_data():
     """테스트용 통계 데이터"""
     return {"data": {"getStats": {"total": 150}}}
+
+
+@pytest.fixture
+def post_pages():
+    """iter_velog_posts 를 대체할 페이지 async generator 함수 생성"""
+
+    def _post_pages(*pages):
+        async def _iter_pages(*args, **kwargs):
+            for page in pages:
+                yield page
+
+        return _iter_pages
+
+    return _post_pages
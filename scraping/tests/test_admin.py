@@ -0,0 +1,89 @@
+import uuid
+
+import pytest
+from django.contrib.auth.models import User as DjangoUser
+from django.test import Client
+from django.urls import reverse
+
+from scraping.models import ScrapeCheckpoint, ScrapeJob
+from scraping.work_queue import ScrapeJobQueue
+from users.models import User
+
+
+@pytest.fixture
+def client_logged_in(db):
+    """Admin 유저로 로그인한 Django 테스트 클라이언트"""
+    admin_user = DjangoUser.objects.create_superuser(
+        username="admin", email="admin@example.com", password="adminpassword"
+    )
+    client = Client()
+    client.force_login(admin_user)
+    return client
+
+
+@pytest.fixture
+def users(db):
+    return [
+        User.objects.create(
+            velog_uuid=uuid.uuid4(),
+            access_token="encrypted-access-token",
+            refresh_token="encrypted-refresh-token",
+            group_id=1,
+            email=f"test{i}@example.com",
+        )
+        for i in range(3)
+    ]
+
+
+@pytest.mark.django_db
+class TestScrapeJobAdmin:
+    def test_run_progress_page(self, client_logged_in, users):
+        """run_id 로 들어오면 상태별 진행률과 사용자별 진행 단계를 보여주는지 테스트"""
+        run_id = ScrapeJobQueue.enqueue_users([user.id for user in users])
+        queue = ScrapeJobQueue("worker-a")
+        done_job, running_job = queue.claim(limit=2)
+        queue.complete(done_job)
+        ScrapeCheckpoint.objects.create(
+            run_id=run_id,
+            user=running_job.user,
+            step=ScrapeCheckpoint.Step.POSTS,
+        )
+
+        url = reverse("admin:scraping_scrapejob_changelist")
+        response = client_logged_in.get(f"{url}?run_id={run_id}")
+
+        assert response.status_code == 200
+        assert response.context["run_progress"] == {
+            "total": 3,
+            "pending": 1,
+            "running": 1,
+            "done": 1,
+            "failed": 0,
+            "percent": 33,
+        }
+        # 대기 또는 진행 중인 작업이 남아 있으면 자동 새로고침
+        assert response.context["refresh_seconds"] == 5
+        assert ScrapeCheckpoint.Step.POSTS.label in response.content.decode()
+
+    def test_finished_run_stops_refresh(self, client_logged_in, users):
+        run_id = ScrapeJobQueue.enqueue_users([users[0].id])
+        queue = ScrapeJobQueue("worker-a")
+        (job,) = queue.claim()
+        queue.complete(job)
+
+        url = reverse("admin:scraping_scrapejob_changelist")
+        response = client_logged_in.get(f"{url}?run_id={run_id}")
+
+        assert response.status_code == 200
+        assert response.context["run_progress"]["percent"] == 100
+        assert "refresh_seconds" not in response.context
+
+    def test_changelist_without_run_id(self, client_logged_in, users):
+        ScrapeJobQueue.enqueue_users([users[0].id])
+
+        url = reverse("admin:scraping_scrapejob_changelist")
+        response = client_logged_in.get(url)
+
+        assert response.status_code == 200
+        assert "run_progress" not in response.context
+        assert ScrapeJob.objects.count() == 1
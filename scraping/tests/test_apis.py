@@ -0,0 +1,293 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from scraping.apis import (
+    ConnectionStats,
+    build_posts_stats_batch_query,
+    create_trace_config,
+    fetch_all_velog_posts,
+    fetch_post_stats,
+    fetch_posts_stats_batch,
+    fetch_velog_user_chk,
+    iter_velog_posts,
+)
+
+
+@pytest_asyncio.fixture
+async def stats_server():
+    """getStats 응답을 흉내내는 로컬 GraphQL 서버"""
+
+    async def graphql(request: web.Request) -> web.Response:
+        payload = await request.json()
+        variables = payload["variables"]
+        if payload["operationName"] == "GetStatsBatch":
+            # 이름이 "missing" 인 게시글은 통계가 없는 것으로 응답
+            return web.json_response(
+                {
+                    "data": {
+                        f"stats_{name.removeprefix('post_id_')}": (
+                            None
+                            if post_id == "missing"
+                            else {"total": len(post_id)}
+                        )
+                        for name, post_id in variables.items()
+                    }
+                }
+            )
+        post_id = variables["post_id"]
+        return web.json_response(
+            {"data": {"getStats": {"total": len(post_id)}}}
+        )
+
+    app = web.Application()
+    app.router.add_post("/graphql", graphql)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+class TestFetchPostStats:
+    @pytest.mark.asyncio
+    async def test_fetch_post_stats_reuses_shared_session(self, stats_server):
+        """공유 세션을 사용하면 커넥션을 재사용하고 세션을 닫지 않는지 테스트"""
+        stats = ConnectionStats()
+        url = str(stats_server.make_url("/graphql"))
+
+        with patch("scraping.apis.V2_CDN_URL", url):
+            async with aiohttp.ClientSession(
+                trace_configs=[create_trace_config(stats)]
+            ) as session:
+                results = [
+                    await fetch_post_stats(
+                        post_id, "access", "refresh", session=session
+                    )
+                    for post_id in ["a", "bb", "ccc"]
+                ]
+                assert not session.closed
+
+        assert [r["data"]["getStats"]["total"] for r in results] == [1, 2, 3]
+        assert stats.requests == 3
+        assert stats.connections_created == 1
+        assert stats.connections_reused == 2
+        assert stats.reuse_ratio == pytest.approx(2 / 3)
+
+    @pytest.mark.asyncio
+    async def test_fetch_post_stats_without_session(self, stats_server):
+        """세션 없이 호출하면 기존처럼 자체 세션으로 요청하는지 테스트"""
+        url = str(stats_server.make_url("/graphql"))
+
+        with patch("scraping.apis.V2_CDN_URL", url):
+            result = await fetch_post_stats("post-1", "access", "refresh")
+
+        assert result == {"data": {"getStats": {"total": 6}}}
+
+
+class TestFetchPostsStatsBatch:
+    def test_build_posts_stats_batch_query(self):
+        """alias 와 변수가 게시글 수만큼 생성되는지 테스트"""
+        query = build_posts_stats_batch_query(2)
+
+        assert "query GetStatsBatch($post_id_0: ID!, $post_id_1: ID!)" in query
+        assert "stats_0: getStats(post_id: $post_id_0)" in query
+        assert "stats_1: getStats(post_id: $post_id_1)" in query
+
+    @pytest.mark.asyncio
+    async def test_fetch_posts_stats_batch(self, stats_server):
+        """batch 응답을 post_id 별 단건 응답 형태로 풀어내는지 테스트"""
+        stats = ConnectionStats()
+        url = str(stats_server.make_url("/graphql"))
+
+        with patch("scraping.apis.V2_CDN_URL", url):
+            async with aiohttp.ClientSession(
+                trace_configs=[create_trace_config(stats)]
+            ) as session:
+                result = await fetch_posts_stats_batch(
+                    session, ["a", "missing", "ccc"], "access", "refresh"
+                )
+
+        assert result == {
+            "a": {"data": {"getStats": {"total": 1}}},
+            "ccc": {"data": {"getStats": {"total": 3}}},
+        }
+        assert stats.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_posts_stats_batch_rejected(self):
+        """엔드포인트가 batch 요청을 거부하면 None 을 반환하는지 테스트"""
+
+        async def graphql(request: web.Request) -> web.Response:
+            return web.json_response(
+                {"errors": [{"message": "Unknown operation"}]}, status=400
+            )
+
+        app = web.Application()
+        app.router.add_post("/graphql", graphql)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            url = str(server.make_url("/graphql"))
+            with patch("scraping.apis.V2_CDN_URL", url):
+                async with aiohttp.ClientSession() as session:
+                    result = await fetch_posts_stats_batch(
+                        session, ["a", "bb"], "access", "refresh"
+                    )
+        finally:
+            await server.close()
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "status, body, expected",
+        [
+            # data 없이 errors 만 있으면 batch 쿼리를 지원하지 않는 것으로 판단
+            (200, {"errors": [{"message": "Unknown operation"}]}, None),
+            # 일시적인 실패는 빈 dict 로 해당 게시글만 단건 요청으로 대체
+            (429, {"message": "Too Many Requests"}, {}),
+            (503, {"message": "Service Unavailable"}, {}),
+            (200, {"data": None}, {}),
+        ],
+    )
+    async def test_fetch_posts_stats_batch_failure(
+        self, status, body, expected
+    ):
+        """batch 거부와 일시적인 실패를 구분하는지 테스트"""
+
+        async def graphql(request: web.Request) -> web.Response:
+            return web.json_response(body, status=status)
+
+        app = web.Application()
+        app.router.add_post("/graphql", graphql)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            url = str(server.make_url("/graphql"))
+            with patch("scraping.apis.V2_CDN_URL", url):
+                async with aiohttp.ClientSession() as session:
+                    result = await fetch_posts_stats_batch(
+                        session, ["a", "bb"], "access", "refresh"
+                    )
+        finally:
+            await server.close()
+
+        assert result == expected
+
+
+class TestFetchVelogUserChk:
+    @pytest_asyncio.fixture
+    async def user_server(self):
+        """currentUser 응답을 흉내내는 로컬 GraphQL 서버, 응답 방식은 request.app["mode"] 로 결정"""
+
+        async def graphql(request: web.Request) -> web.Response:
+            mode = request.app["mode"]
+            if mode == "unavailable":
+                return web.Response(text="Service Unavailable", status=503)
+            if mode == "timeout":
+                await asyncio.sleep(1)
+            if mode == "invalid":
+                return web.json_response({"data": {"currentUser": None}})
+            return web.json_response(
+                {"data": {"currentUser": {"username": "tester"}}}
+            )
+
+        app = web.Application()
+        app["mode"] = "valid"
+        app.router.add_post("/graphql", graphql)
+        server = TestServer(app)
+        await server.start_server()
+        yield server
+        await server.close()
+
+    async def fetch(self, server, mode, timeout=None):
+        server.app["mode"] = mode
+        url = str(server.make_url("/graphql"))
+        with patch("scraping.apis.V3_URL", url):
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                return await fetch_velog_user_chk(session, "access", "refresh")
+
+    @pytest.mark.asyncio
+    async def test_fetch_velog_user_chk_invalid_token(self, user_server):
+        """토큰이 유효하지 않으면 currentUser 가 null 인 응답을 그대로 반환하는지 테스트"""
+        _, data = await self.fetch(user_server, "invalid")
+
+        assert data == {"data": {"currentUser": None}}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["unavailable", "timeout"])
+    async def test_fetch_velog_user_chk_request_failure(
+        self, user_server, mode
+    ):
+        """503 이나 timeout 은 토큰 실패와 구분되도록 빈 응답을 반환하는지 테스트"""
+        result = await self.fetch(
+            user_server, mode, timeout=aiohttp.ClientTimeout(total=0.1)
+        )
+
+        assert result == ({}, {})
+
+
+class TestFetchAllVelogPosts:
+    @pytest.mark.asyncio
+    async def test_fetch_all_velog_posts(self):
+        """빈 페이지가 나올 때까지 모든 페이지를 가져오는지 테스트"""
+        pages = [[{"id": "1"}, {"id": "2"}], [{"id": "3"}], []]
+
+        with patch(
+            "scraping.apis.fetch_velog_posts",
+            new_callable=AsyncMock,
+            side_effect=pages,
+        ) as mock_fetch:
+            posts = await fetch_all_velog_posts(
+                None, "tester", "access", "refresh"
+            )
+
+        assert [post["id"] for post in posts] == ["1", "2", "3"]
+        assert mock_fetch.call_count == 3
+        assert mock_fetch.call_args_list[1].args[-1] == "2"
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_velog_posts_stops_at_unchanged(self):
+        """증분 동기화는 저장된 게시글이 나온 페이지에서 멈추는지 테스트"""
+        pages = [[{"id": "1"}, {"id": "2"}], [{"id": "3"}], []]
+
+        with patch(
+            "scraping.apis.fetch_velog_posts",
+            new_callable=AsyncMock,
+            side_effect=pages,
+        ) as mock_fetch:
+            posts = await fetch_all_velog_posts(
+                None,
+                "tester",
+                "access",
+                "refresh",
+                is_unchanged=lambda post: post["id"] == "2",
+            )
+
+        assert [post["id"] for post in posts] == ["1", "2"]
+        mock_fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_iter_velog_posts_prefetches_next_page(self):
+        """페이지를 넘겨주기 전에 다음 페이지를 미리 요청하는지 테스트"""
+        pages = [[{"id": "1"}, {"id": "2"}], [{"id": "3"}], []]
+
+        with patch(
+            "scraping.apis.fetch_velog_posts",
+            new_callable=AsyncMock,
+            side_effect=pages,
+        ) as mock_fetch:
+            iterator = iter_velog_posts(None, "tester", "access", "refresh")
+            first_page = await anext(iterator)
+            # 호출한 쪽이 첫 페이지를 처리하는 동안 다음 페이지 요청이 진행됨
+            await asyncio.sleep(0)
+            assert mock_fetch.call_count == 2
+            assert first_page == pages[0]
+            await iterator.aclose()
+
+        assert mock_fetch.call_args_list[1].args[-1] == "2"
@@ -0,0 +1,154 @@
+import uuid
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from asgiref.sync import sync_to_async
+
+from posts.models import Post, PostDailyStatistics
+from scraping.main import ScraperBackfill
+from users.models import User
+from utils.utils import get_local_date, get_local_now
+
+
+@pytest.fixture
+def backfill_scraper():
+    return ScraperBackfill([], max_connections=10)
+
+
+class TestScraperBackfill:
+    def test_cumulative_views_by_day(self):
+        """일별 조회수가 최신 날짜부터 전체 조회수에서 차감되어 누적 조회수가 되는지 테스트"""
+        cumulative = ScraperBackfill.cumulative_views_by_day(
+            100,
+            [
+                {"day": "2026-10-15T00:00:00.000Z", "count": 20},
+                {"day": "2026-10-17", "count": 5},
+                {"day": "2026-10-16", "count": 10},
+                {"day": None, "count": 1},
+            ],
+        )
+
+        assert [(day.isoformat(), views) for day, views in cumulative] == [
+            ("2026-10-17", 100),
+            ("2026-10-16", 95),
+            ("2026-10-15", 85),
+        ]
+
+    def test_cumulative_views_by_day_fills_gaps(self):
+        """조회수가 없는 날짜도 직전 누적 조회수로 채워 until 까지 하루 단위로 반환하는지 테스트"""
+        cumulative = ScraperBackfill.cumulative_views_by_day(
+            100,
+            [
+                {"day": "2026-10-18", "count": 3},
+                {"day": "2026-10-15", "count": 10},
+                {"day": "2026-10-12", "count": 20},
+            ],
+            until=date(2026, 10, 17),
+        )
+
+        assert [(day.isoformat(), views) for day, views in cumulative] == [
+            ("2026-10-17", 97),
+            ("2026-10-16", 97),
+            ("2026-10-15", 97),
+            ("2026-10-14", 87),
+            ("2026-10-13", 87),
+            ("2026-10-12", 87),
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_backfill_user_statistics(self, backfill_scraper):
+        """fake 서버의 일별 조회수로 과거 통계를 채우고 기존 통계는 유지하는지 테스트"""
+        test_user = await sync_to_async(User.objects.create)(
+            velog_uuid=uuid.uuid4(),
+            access_token="test-access-token",
+            refresh_token="test-refresh-token",
+            group_id=1,
+            email="test@example.com",
+        )
+        posts = [
+            await sync_to_async(Post.objects.create)(
+                post_uuid=uuid.uuid4(),
+                title=f"Test Post {i}",
+                user=test_user,
+                slug=f"test-post-{i}",
+                released_at=get_local_now(),
+            )
+            for i in range(2)
+        ]
+        # 오늘 통계(좋아요 수)와 이미 있는 어제 통계
+        for days_ago, view_count in [(0, 100), (1, 999)]:
+            await sync_to_async(PostDailyStatistics.objects.create)(
+                post=posts[0],
+                date=get_local_date() - timedelta(days=days_ago),
+                daily_view_count=view_count,
+                daily_like_count=4,
+            )
+
+        today = get_local_now().date()
+        requested_post_ids = []
+
+        async def graphql(request: web.Request) -> web.Response:
+            payload = await request.json()
+            post_id = payload["variables"]["post_id"]
+            requested_post_ids.append(post_id)
+            if post_id != str(posts[0].post_uuid):
+                return web.json_response({"data": {"getStats": None}})
+            return web.json_response(
+                {
+                    "data": {
+                        "getStats": {
+                            "total": 100,
+                            "count_by_day": [
+                                {
+                                    "day": (
+                                        today - timedelta(days=n)
+                                    ).isoformat(),
+                                    "count": count,
+                                }
+                                for n, count in enumerate([5, 10, 20, 30])
+                            ],
+                        }
+                    }
+                }
+            )
+
+        app = web.Application()
+        app.router.add_post("/graphql", graphql)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            with (
+                patch(
+                    "scraping.apis.V2_CDN_URL",
+                    str(server.make_url("/graphql")),
+                ),
+                patch("scraping.main.AESEncryption") as mock_aes,
+            ):
+                mock_aes.return_value.decrypt.side_effect = lambda token: token
+                async with aiohttp.ClientSession() as session:
+                    backfilled = (
+                        await backfill_scraper.backfill_user_statistics(
+                            test_user, session
+                        )
+                    )
+        finally:
+            await server.close()
+
+        assert sorted(requested_post_ids) == sorted(
+            str(post.post_uuid) for post in posts
+        )
+        assert backfilled == 2
+        stats = await sync_to_async(
+            lambda: list(
+                PostDailyStatistics.objects.filter(post=posts[0])
+                .order_by("-date")
+                .values_list("daily_view_count", "daily_like_count")
+            )
+        )()
+        # 오늘, 어제(기존 유지), 2일 전, 3일 전
+        assert stats == [(100, 4), (999, 4), (85, 4), (65, 4)]
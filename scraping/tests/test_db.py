@@ -0,0 +1,173 @@
+import asyncio
+import uuid
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from posts.models import Post, PostDailyStatistics
+from scraping.db import AsyncPostgresPool
+from scraping.models import ScrapeCheckpoint
+from users.models import User
+from utils.utils import get_local_date, get_local_now
+
+pytestmark = pytest.mark.skipif(
+    not AsyncPostgresPool.is_supported(),
+    reason="비동기 커넥션 풀은 Postgres 에서만 사용",
+)
+
+
+class TestAsyncPostgresPool:
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_pool_reuses_connections(self):
+        """동시에 실행된 쿼리가 max_size 이하의 커넥션을 재사용하는지 테스트"""
+        pool = AsyncPostgresPool.from_django_settings(max_size=2)
+        try:
+            results = await asyncio.gather(
+                *(pool.fetch_all("SELECT %s::int", [i]) for i in range(5))
+            )
+            assert [rows[0][0] for rows in results] == list(range(5))
+            assert len(pool._idle) <= 2
+        finally:
+            await pool.close()
+
+        assert pool._idle == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_close_closes_checked_out_connections(self):
+        """close 가 사용 중인 커넥션까지 닫아 열린 커넥션이 남지 않는지 테스트"""
+        pool = AsyncPostgresPool.from_django_settings(max_size=2)
+        checked_out = asyncio.Event()
+        release = asyncio.Event()
+        opened = []
+
+        async def hold_connection():
+            async with pool.connection() as conn:
+                opened.append(conn)
+                checked_out.set()
+                await release.wait()
+
+        holder = asyncio.create_task(hold_connection())
+        await checked_out.wait()
+        await pool.fetch_all("SELECT 1", [])
+        opened.extend(pool._idle)
+
+        await pool.close()
+        release.set()
+        await holder
+
+        assert len(opened) == 2
+        assert all(conn.closed for conn in opened)
+        assert pool._connections == set()
+        with pytest.raises(RuntimeError):
+            await pool.fetch_all("SELECT 1", [])
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_bulk_update_daily_statistics_with_pool(self, scraper):
+        """커넥션 풀 경로의 통계 upsert 가 ORM 경로와 같은 결과를 내는지 테스트"""
+        test_user = await sync_to_async(User.objects.create)(
+            velog_uuid=uuid.uuid4(),
+            access_token="test-access-token",
+            refresh_token="test-refresh-token",
+            group_id=1,
+            email="test@example.com",
+        )
+        post_uuids = [str(uuid.uuid4()) for _ in range(3)]
+        for i, post_uuid in enumerate(post_uuids):
+            await sync_to_async(Post.objects.create)(
+                post_uuid=post_uuid,
+                title=f"Test Post {i}",
+                user=test_user,
+                slug=f"test-post-{i}",
+                released_at=get_local_now(),
+            )
+        # carry forward 로 기록된 오늘 통계는 갱신되면 표시가 해제되어야 함
+        await scraper.save_carried_statistics(
+            [
+                (
+                    {"id": post_uuids[0], "likes": 0},
+                    {"data": {"getStats": {"total": 50}}},
+                )
+            ]
+        )
+
+        async with scraper.open_db_pool():
+            assert scraper.db_pool is not None
+            # 게시글별 upsert 를 동시에 실행
+            upserted = await asyncio.gather(
+                *(
+                    scraper.bulk_update_daily_statistics(
+                        [
+                            (
+                                {"id": post_uuid, "likes": i},
+                                {"data": {"getStats": {"total": 100 + i}}},
+                            )
+                        ]
+                    )
+                    for i, post_uuid in enumerate(post_uuids)
+                ),
+                scraper.bulk_update_daily_statistics(
+                    [
+                        (
+                            {"id": str(uuid.uuid4()), "likes": 1},
+                            {"data": {"getStats": {"total": 1}}},
+                        )
+                    ]
+                ),
+            )
+            assert upserted == [1, 1, 1, 0]
+
+            # 같은 날짜로 다시 upsert 하면 새 row 없이 값만 갱신
+            assert (
+                await scraper.bulk_update_daily_statistics(
+                    [
+                        (
+                            {"id": post_uuids[0], "likes": 7},
+                            {"data": {"getStats": {"total": 500}}},
+                        )
+                    ]
+                )
+                == 1
+            )
+        assert scraper.db_pool is None
+
+        stats = await sync_to_async(
+            lambda: {
+                str(stat.post.post_uuid): stat
+                for stat in PostDailyStatistics.objects.filter(
+                    post__post_uuid__in=post_uuids
+                ).select_related("post")
+            }
+        )()
+        assert len(stats) == 3
+        assert stats[post_uuids[0]].daily_view_count == 500
+        assert stats[post_uuids[0]].daily_like_count == 7
+        assert stats[post_uuids[2]].daily_view_count == 102
+        assert all(stat.date == get_local_date() for stat in stats.values())
+        assert not any(stat.is_carried for stat in stats.values())
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_write_daily_statistics_checkpoints_with_pool(self, scraper):
+        """커넥션 풀 경로도 완료된 사용자의 DONE 체크포인트를 기록하는지 테스트"""
+        test_user = await sync_to_async(User.objects.create)(
+            velog_uuid=uuid.uuid4(),
+            access_token="test-access-token",
+            refresh_token="test-refresh-token",
+            group_id=1,
+            email="test@example.com",
+        )
+        scraper.run_id = uuid.uuid4()
+
+        async with scraper.open_db_pool():
+            upserted = await scraper.write_daily_statistics(
+                {str(uuid.uuid4()): (1, 1)}, [test_user.id]
+            )
+
+        assert upserted == 0
+        checkpoint = await sync_to_async(ScrapeCheckpoint.objects.get)(
+            run_id=scraper.run_id, user=test_user
+        )
+        assert checkpoint.step == ScrapeCheckpoint.Step.DONE
@@ -1,10 +1,11 @@
 import uuid
-from unittest.mock import AsyncMock, patch
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from asgiref.sync import sync_to_async
 
-from posts.models import Post
+from posts.models import Post, PostDailyStatistics
 from users.models import User
 from utils.utils import get_local_now
 
@@ -25,7 +26,10 @@ class TestScraperPosts:
 
         # _upsert_batch 메서드만 모킹
         with patch.object(
-            scraper, "_upsert_batch", new_callable=AsyncMock
+            scraper,
+            "_upsert_batch",
+            new_callable=AsyncMock,
+            return_value={"inserted": 10, "updated": 0, "unchanged": 0},
         ) as mock_upsert:
             with patch("asyncio.sleep", new_callable=AsyncMock):
                 result = await scraper.bulk_upsert_posts(
@@ -115,7 +119,8 @@ class TestScraperPosts:
         ]
 
         # _upsert_batch 호출
-        await scraper._upsert_batch(test_user, batch_posts)
+        counts = await scraper._upsert_batch(test_user, batch_posts)
+        assert counts == {"inserted": 1, "updated": 1, "unchanged": 0}
 
         # 기존 게시물 업데이트 확인 (sync_to_async 사용)
         updated_post = await sync_to_async(Post.objects.get)(
@@ -199,7 +204,10 @@ class TestScraperPosts:
         current_post_ids = {post_uuid1, post_uuid3}
 
         # sync_post_active_status 메서드 호출
-        await scraper.sync_post_active_status(test_user, current_post_ids)
+        changes = await scraper.sync_post_active_status(
+            test_user, current_post_ids
+        )
+        assert changes == (1, 1)
 
         # 결과 확인: post1 = 활성 유지, post2 = 비활성으로 변경, post3 = 활성화로 변경, post4 = 비활성 유지
         post1 = await sync_to_async(Post.objects.get)(post_uuid=post_uuid1)
@@ -246,7 +254,10 @@ class TestScraperPosts:
         current_post_ids = {post_uuids[0], post_uuids[1]}
 
         # sync_post_active_status 메서드 호출
-        await scraper.sync_post_active_status(test_user, current_post_ids)
+        changes = await scraper.sync_post_active_status(
+            test_user, current_post_ids
+        )
+        assert changes == (0, 0)
 
         # 모든 게시물이 여전히 활성 상태여야 함 (안전 임계값으로 인해 작업이 수행되지 않음)
         for post_uuid in post_uuids:
@@ -254,3 +265,153 @@ class TestScraperPosts:
             assert (
                 post.is_active is True
             ), f"Post {post_uuid} should remain active due to safety threshold"
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_upsert_batch_skips_unchanged_posts(self, scraper):
+        """변경이 없는 게시글은 UPDATE 하지 않고 변경된 게시글만 업데이트하는지 테스트"""
+        test_user = await sync_to_async(User.objects.create)(
+            velog_uuid=uuid.uuid4(),
+            access_token="test-access-token",
+            refresh_token="test-refresh-token",
+            group_id=1,
+            email="test@example.com",
+        )
+        posts = [
+            await sync_to_async(Post.objects.create)(
+                post_uuid=uuid.uuid4(),
+                title=f"Title {i}",
+                user=test_user,
+                slug=f"slug-{i}",
+                released_at="2024-01-01T00:00:00Z",
+            )
+            for i in range(2)
+        ]
+        batch_posts = [
+            {
+                "id": str(post.post_uuid),
+                "title": post.title,
+                "url_slug": post.slug,
+                "released_at": "2024-01-01T00:00:00.000Z",
+            }
+            for post in posts
+        ]
+        batch_posts[1]["title"] = "Edited"
+
+        counts = await scraper._upsert_batch(test_user, batch_posts)
+
+        assert counts == {"inserted": 0, "updated": 1, "unchanged": 1}
+        unchanged_post = await sync_to_async(Post.objects.get)(id=posts[0].id)
+        edited_post = await sync_to_async(Post.objects.get)(id=posts[1].id)
+        assert unchanged_post.updated_at == posts[0].updated_at
+        assert edited_post.title == "Edited"
+        assert edited_post.updated_at > posts[1].updated_at
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_get_stored_posts_and_is_unchanged_post(self, scraper):
+        """저장된 게시글 조회(마지막 좋아요 수 포함)와 변경 여부 비교 테스트"""
+        test_user = await sync_to_async(User.objects.create)(
+            velog_uuid=uuid.uuid4(),
+            access_token="test-access-token",
+            refresh_token="test-refresh-token",
+            group_id=1,
+            email="test@example.com",
+        )
+        post_uuid = str(uuid.uuid4())
+        post = await sync_to_async(Post.objects.create)(
+            post_uuid=post_uuid,
+            title="Title",
+            user=test_user,
+            slug="slug",
+            released_at="2024-01-01T00:00:00.000Z",
+        )
+        today = get_local_now()
+        for days_ago, like_count in [(1, 3), (0, 5)]:
+            await sync_to_async(PostDailyStatistics.objects.create)(
+                post=post,
+                date=today - timedelta(days=days_ago),
+                daily_view_count=10,
+                daily_like_count=like_count,
+            )
+
+        stored_posts = await scraper.get_stored_posts(test_user)
+
+        assert list(stored_posts) == [post_uuid]
+        assert stored_posts[post_uuid]["likes"] == 5
+        velog_post = {
+            "id": post_uuid,
+            "title": "Title",
+            "url_slug": "slug",
+            "released_at": "2024-01-01T00:00:00.000Z",
+        }
+        assert scraper.is_unchanged_post(velog_post, stored_posts[post_uuid])
+        assert not scraper.is_unchanged_post(
+            {**velog_post, "title": "Edited"}, stored_posts[post_uuid]
+        )
+        assert not scraper.is_unchanged_post(velog_post, None)
+
+    @patch("scraping.main.fetch_velog_user_chk")
+    @patch("scraping.main.iter_velog_posts")
+    @patch("scraping.main.AESEncryption")
+    @pytest.mark.asyncio
+    async def test_process_user_incremental_sync(
+        self,
+        mock_aes,
+        mock_fetch_posts,
+        mock_fetch_user_chk,
+        scraper,
+        user,
+        mock_user_data,
+        mock_posts_data,
+        mock_stats_data,
+        post_pages,
+    ):
+        """증분 동기화는 상태 동기화를 건너뛰고 저장된 게시글도 통계를 갱신하는지 테스트"""
+        mock_fetch_user_chk.return_value = ({}, mock_user_data)
+        mock_fetch_posts.side_effect = post_pages(mock_posts_data[:1])
+        stored_post = {**mock_posts_data[1], "likes": 7}
+        scraper.incremental = True
+
+        with (
+            patch.object(scraper, "is_full_sync", return_value=False),
+            patch.object(
+                scraper,
+                "get_stored_posts",
+                new_callable=AsyncMock,
+                return_value={stored_post["id"]: stored_post},
+            ),
+            patch.object(
+                scraper, "update_token_health", new_callable=AsyncMock
+            ),
+            patch.object(
+                scraper,
+                "update_old_user_info",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch.object(
+                scraper, "bulk_upsert_posts", new_callable=AsyncMock
+            ) as mock_bulk_upsert,
+            patch.object(
+                scraper, "sync_post_active_status", new_callable=AsyncMock
+            ) as mock_sync_status,
+            patch.object(
+                scraper,
+                "fetch_chunk_stats",
+                new_callable=AsyncMock,
+                return_value=[mock_stats_data, mock_stats_data],
+            ) as mock_chunk_stats,
+            patch.object(
+                scraper, "bulk_update_daily_statistics", new_callable=AsyncMock
+            ),
+        ):
+            await scraper.process_user(user, MagicMock())
+
+        assert mock_fetch_posts.call_args.kwargs["is_unchanged"] is not None
+        mock_bulk_upsert.assert_called_once_with(user, mock_posts_data[:1])
+        mock_sync_status.assert_not_called()
+        assert mock_chunk_stats.call_args.args[0] == [
+            mock_posts_data[0],
+            stored_post,
+        ]
@@ -1,35 +1,44 @@
 import uuid
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from asgiref.sync import sync_to_async
 
 from posts.models import Post, PostDailyStatistics
+from scraping.models import ScrapeCheckpoint
 from users.models import User
-from utils.utils import get_local_now
+from utils.utils import get_local_date, get_local_now
 
 
 class TestScraperStatistics:
     @pytest.mark.asyncio
-    async def test_update_daily_statistics_success(self, scraper):
-        """데일리 통계 업데이트 또는 생성 성공 테스트"""
+    @pytest.mark.parametrize(
+        "stats_data",
+        [{}, {"data": {}}, {"data": {"getStats": None}}],
+    )
+    async def test_bulk_update_daily_statistics_skips_invalid_stats(
+        self, scraper, stats_data
+    ):
+        """통계 데이터가 없거나 잘못된 게시글은 DB 에 쓰지 않는지 테스트"""
         post_data = {"id": "post-123", "likes": 10}
-        stats_data = {"data": {"getStats": {"total": 100}}}
 
-        with patch(
-            "scraping.main.sync_to_async", new_callable=MagicMock
-        ) as mock_sync_to_async:
-            mock_async_func = AsyncMock()
-            mock_sync_to_async.return_value = mock_async_func
-
-            await scraper.update_daily_statistics(post_data, stats_data)
+        with patch.object(
+            scraper, "write_daily_statistics", new_callable=AsyncMock
+        ) as mock_write:
+            upserted = await scraper.bulk_update_daily_statistics(
+                [(post_data, stats_data)]
+            )
 
-            mock_sync_to_async.assert_called()
-            mock_async_func.assert_called_once()
+        assert upserted == 0
+        mock_write.assert_not_called()
 
     @pytest.mark.asyncio
     @pytest.mark.django_db
-    async def test_update_daily_statistics_integration(self, scraper):
+    async def test_bulk_update_daily_statistics_integration(self, scraper):
         """데일리 통계 업데이트 통합 테스트"""
         # 테스트 사용자 및 게시물 생성
         test_user = await sync_to_async(User.objects.create)(
@@ -55,8 +64,8 @@ class TestScraperStatistics:
         post_data = {"id": post_uuid, "likes": 25}
         stats_data = {"data": {"getStats": {"total": 150}}}
 
-        # update_daily_statistics 호출
-        await scraper.update_daily_statistics(post_data, stats_data)
+        # bulk_update_daily_statistics 호출
+        await scraper.bulk_update_daily_statistics([(post_data, stats_data)])
 
         # 결과 확인
         today = get_local_now().replace(
@@ -68,3 +77,376 @@ class TestScraperStatistics:
 
         assert stats.daily_view_count == 150
         assert stats.daily_like_count == 25
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_bulk_update_daily_statistics_upsert(self, scraper):
+        """청크 단위 통계 upsert 가 생성과 갱신을 한 번에 처리하는지 테스트"""
+        test_user = await sync_to_async(User.objects.create)(
+            velog_uuid=uuid.uuid4(),
+            access_token="test-access-token",
+            refresh_token="test-refresh-token",
+            group_id=1,
+            email="test@example.com",
+            is_active=True,
+        )
+
+        post_uuids = [str(uuid.uuid4()) for _ in range(3)]
+        for i, post_uuid in enumerate(post_uuids):
+            await sync_to_async(Post.objects.create)(
+                post_uuid=post_uuid,
+                title=f"Test Post {i}",
+                user=test_user,
+                slug=f"test-post-{i}",
+                released_at=get_local_now(),
+            )
+
+        posts_with_stats = [
+            (
+                {"id": post_uuid, "likes": i},
+                {"data": {"getStats": {"total": 100 + i}}},
+            )
+            for i, post_uuid in enumerate(post_uuids)
+        ]
+        # 존재하지 않는 게시글과 잘못된 통계는 건너뜀
+        posts_with_stats.append(({"id": str(uuid.uuid4()), "likes": 1}, {}))
+        posts_with_stats.append(
+            ({"id": post_uuids[0], "likes": 1}, {"data": {"getStats": None}})
+        )
+
+        upserted = await scraper.bulk_update_daily_statistics(
+            posts_with_stats[:4]
+        )
+        assert upserted == 3
+
+        # 같은 날짜로 다시 upsert 하면 새 row 없이 값만 갱신
+        upserted = await scraper.bulk_update_daily_statistics(
+            [
+                (
+                    {"id": post_uuids[0], "likes": 7},
+                    {"data": {"getStats": {"total": 500}}},
+                )
+            ]
+        )
+        assert upserted == 1
+
+        stats_count = await sync_to_async(
+            PostDailyStatistics.objects.filter(
+                post__post_uuid__in=post_uuids
+            ).count
+        )()
+        assert stats_count == 3
+
+        updated = await sync_to_async(PostDailyStatistics.objects.get)(
+            post__post_uuid=post_uuids[0]
+        )
+        assert updated.daily_view_count == 500
+        assert updated.daily_like_count == 7
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_stats_batches_and_falls_back(self, scraper):
+        """batch 로 받지 못한 게시글만 단건 요청으로 대체하는지 테스트"""
+        scraper.stats_batch_size = 2
+        posts = [{"id": f"post-{i}"} for i in range(3)]
+        stats = {"data": {"getStats": {"total": 1}}}
+
+        with (
+            patch.object(
+                scraper,
+                "fetch_posts_stats_batch_limited",
+                new_callable=AsyncMock,
+                side_effect=[{"post-0": stats, "post-1": stats}, {}],
+            ) as mock_batch,
+            patch.object(
+                scraper,
+                "fetch_post_stats_limited",
+                new_callable=AsyncMock,
+                return_value=stats,
+            ) as mock_single,
+        ):
+            results = await scraper.fetch_chunk_stats(
+                posts, "access", "refresh", MagicMock()
+            )
+
+        assert results == [stats, stats, stats]
+        assert mock_batch.call_count == 2
+        assert mock_batch.call_args_list[0].args[0] == ["post-0", "post-1"]
+        mock_single.assert_called_once()
+        assert mock_single.call_args.args[0] == "post-2"
+        assert scraper.stats_batch_supported
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [429, 503])
+    async def test_fetch_chunk_stats_keeps_batch_on_transient_failure(
+        self, scraper, status
+    ):
+        """batch 요청이 일시적으로 실패하면 해당 청크만 단건 요청으로 대체하고 batch 는 계속 사용하는지 테스트"""
+        scraper.stats_batch_size = 2
+        posts = [{"id": "post-0"}, {"id": "post-1"}]
+        stats = {"data": {"getStats": {"total": 1}}}
+
+        async def graphql(request: web.Request) -> web.Response:
+            return web.Response(text="Try again later", status=status)
+
+        app = web.Application()
+        app.router.add_post("/graphql", graphql)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            url = str(server.make_url("/graphql"))
+            with (
+                patch("scraping.apis.V2_CDN_URL", url),
+                patch.object(
+                    scraper,
+                    "fetch_post_stats_limited",
+                    new_callable=AsyncMock,
+                    return_value=stats,
+                ) as mock_single,
+            ):
+                async with aiohttp.ClientSession() as session:
+                    results = await scraper.fetch_chunk_stats(
+                        posts, "access", "refresh", session
+                    )
+        finally:
+            await server.close()
+
+        assert results == [stats, stats]
+        assert mock_single.call_count == 2
+        assert scraper.stats_batch_supported
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_stats_disables_rejected_batch(self, scraper):
+        """batch 요청이 거부되면 이후 청크부터 단건 요청만 사용하는지 테스트"""
+        scraper.stats_batch_size = 2
+        posts = [{"id": "post-0"}, {"id": "post-1"}]
+
+        with (
+            patch.object(
+                scraper,
+                "fetch_posts_stats_batch_limited",
+                new_callable=AsyncMock,
+                return_value=None,
+            ) as mock_batch,
+            patch.object(
+                scraper,
+                "fetch_post_stats_limited",
+                new_callable=AsyncMock,
+                side_effect=[{"data": {"getStats": {"total": 1}}}, None] * 2,
+            ),
+        ):
+            results = await scraper.fetch_chunk_stats(
+                posts, "access", "refresh", MagicMock()
+            )
+            assert not scraper.stats_batch_supported
+            await scraper.fetch_chunk_stats(
+                posts, "access", "refresh", MagicMock()
+            )
+
+        assert results == [{"data": {"getStats": {"total": 1}}}, None]
+        mock_batch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_retry_dead_letter_stats(self, scraper):
+        """dead-letter 게시글을 재시도해 복구한 통계만 반환하는지 테스트"""
+        posts = [{"id": "post-0"}, {"id": "post-1"}]
+        stats = {"data": {"getStats": {"total": 1}}}
+
+        with patch.object(
+            scraper,
+            "fetch_post_stats_limited",
+            new_callable=AsyncMock,
+            # 1차: post-0 성공, post-1 실패 / 2차: post-1 실패
+            side_effect=[stats, None, None],
+        ) as mock_fetch:
+            recovered = await scraper.retry_dead_letter_stats(
+                posts, "access", "refresh", MagicMock()
+            )
+
+        assert recovered == [(posts[0], stats)]
+        assert mock_fetch.call_count == 1 + scraper.DEAD_LETTER_ATTEMPTS
+        # 재시도는 공유 세마포어가 아닌 별도의 세마포어 사용
+        retry_semaphore = mock_fetch.call_args.kwargs["semaphore"]
+        assert retry_semaphore is not scraper.semaphore
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_write_daily_statistics_records_checkpoints(self, scraper):
+        """통계와 완료된 사용자의 DONE 체크포인트를 함께 기록하는지 테스트"""
+        test_user = await sync_to_async(User.objects.create)(
+            velog_uuid=uuid.uuid4(),
+            access_token="test-access-token",
+            refresh_token="test-refresh-token",
+            group_id=1,
+            email="test@example.com",
+        )
+        post_uuid = str(uuid.uuid4())
+        await sync_to_async(Post.objects.create)(
+            post_uuid=post_uuid,
+            title="Test Post",
+            user=test_user,
+            slug="test-post",
+            released_at=get_local_now(),
+        )
+        scraper.run_id = uuid.uuid4()
+        await sync_to_async(ScrapeCheckpoint.objects.create)(
+            run_id=scraper.run_id,
+            user=test_user,
+            step=ScrapeCheckpoint.Step.POSTS,
+        )
+
+        upserted = await scraper.write_daily_statistics(
+            {post_uuid: (100, 5)}, [test_user.id]
+        )
+
+        assert upserted == 1
+        checkpoint = await sync_to_async(ScrapeCheckpoint.objects.get)(
+            run_id=scraper.run_id, user=test_user
+        )
+        assert checkpoint.step == ScrapeCheckpoint.Step.DONE
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_split_posts_by_refresh_tier(self, scraper):
+        """조회수 변화가 적은 게시글은 건너뛰고 마지막 조회수를 carry forward 하는지 테스트"""
+        test_user = await sync_to_async(User.objects.create)(
+            velog_uuid=uuid.uuid4(),
+            access_token="test-access-token",
+            refresh_token="test-refresh-token",
+            group_id=1,
+            email="test@example.com",
+        )
+        views_by_day = {
+            "hot": [100, 300],
+            "cold": [50, 50],
+            "untracked": [],
+        }
+        posts = []
+        for name, views in views_by_day.items():
+            post = await sync_to_async(Post.objects.create)(
+                post_uuid=uuid.uuid4(),
+                title=name,
+                user=test_user,
+                slug=name,
+                released_at="2023-01-01T00:00:00Z",
+            )
+            for days_ago, view_count in zip([3, 1], views):
+                await sync_to_async(PostDailyStatistics.objects.create)(
+                    post=post,
+                    date=get_local_date() - timedelta(days=days_ago),
+                    daily_view_count=view_count,
+                    daily_like_count=0,
+                )
+            posts.append(
+                {"id": str(post.post_uuid), "title": name, "likes": 3}
+            )
+
+        with patch(
+            "scraping.main.StatsRefreshScheduler.is_due",
+            side_effect=lambda post_id, interval: interval <= 1,
+        ):
+            (
+                due_posts,
+                carried_posts,
+            ) = await scraper.split_posts_by_refresh_tier(test_user, posts)
+
+        assert [post["title"] for post in due_posts] == ["hot", "untracked"]
+        assert carried_posts == [
+            (posts[1], {"data": {"getStats": {"total": 50}}})
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_tiered_refresh_writes_today_row_for_every_post(
+        self, scraper, mock_user_data, post_pages
+    ):
+        """건너뛴 게시글도 is_carried 로 표시된 오늘 통계가 기록되고, 갱신된 통계는 덮어쓰지 않는지 테스트"""
+        scraper.tiered_refresh = True
+        test_user = await sync_to_async(User.objects.create)(
+            velog_uuid=uuid.uuid4(),
+            access_token="test-access-token",
+            refresh_token="test-refresh-token",
+            group_id=1,
+            email="test@example.com",
+        )
+        views_by_day = {"hot": [100, 300], "cold": [50, 50]}
+        posts = []
+        for name, views in views_by_day.items():
+            post = await sync_to_async(Post.objects.create)(
+                post_uuid=uuid.uuid4(),
+                title=name,
+                user=test_user,
+                slug=name,
+                released_at="2023-01-01T00:00:00Z",
+            )
+            for days_ago, view_count in zip([3, 1], views):
+                await sync_to_async(PostDailyStatistics.objects.create)(
+                    post=post,
+                    date=get_local_date() - timedelta(days=days_ago),
+                    daily_view_count=view_count,
+                    daily_like_count=0,
+                )
+            posts.append(
+                {"id": str(post.post_uuid), "title": name, "likes": 3}
+            )
+
+        async def fetch_chunk_stats(chunk_posts, *args):
+            return [
+                {"data": {"getStats": {"total": 400}}} for _ in chunk_posts
+            ]
+
+        with (
+            patch("scraping.main.AESEncryption"),
+            patch(
+                "scraping.main.fetch_velog_user_chk",
+                new_callable=AsyncMock,
+                return_value=({}, mock_user_data),
+            ),
+            patch("scraping.main.iter_velog_posts", post_pages(posts)),
+            # 경계 요일이 아닌 날처럼 갱신 주기가 1일인 게시글만 갱신
+            patch(
+                "scraping.main.StatsRefreshScheduler.is_due",
+                side_effect=lambda post_id, interval: interval <= 1,
+            ),
+            patch.object(
+                scraper,
+                "update_old_user_info",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch.object(scraper, "bulk_upsert_posts", new_callable=AsyncMock),
+            patch.object(
+                scraper, "sync_post_active_status", new_callable=AsyncMock
+            ),
+            patch.object(
+                scraper, "fetch_chunk_stats", side_effect=fetch_chunk_stats
+            ) as mock_fetch_chunk_stats,
+        ):
+            await scraper.process_user(test_user, AsyncMock())
+
+        assert mock_fetch_chunk_stats.call_args.args[0] == [posts[0]]
+        # 모든 활성 게시글에 오늘 통계가 있고, 건너뛴 게시글은 마지막 조회수로 표시됨
+        today_stats = await sync_to_async(
+            lambda: sorted(
+                PostDailyStatistics.objects.filter(
+                    post__user=test_user,
+                    post__is_active=True,
+                    date=get_local_date(),
+                ).values_list("post__title", "daily_view_count", "is_carried")
+            )
+        )()
+        assert today_stats == [("cold", 50, True), ("hot", 400, False)]
+
+        # 같은 날 다시 갱신된 통계는 carry forward 로 덮어쓰지 않고, 갱신되면 표시를 해제
+        await scraper.save_carried_statistics(
+            [(posts[0], {"data": {"getStats": {"total": 1}}})]
+        )
+        await scraper.bulk_update_daily_statistics(
+            [(posts[1], {"data": {"getStats": {"total": 60}}})]
+        )
+        assert await sync_to_async(
+            lambda: sorted(
+                PostDailyStatistics.objects.filter(
+                    post__user=test_user, date=get_local_date()
+                ).values_list("post__title", "daily_view_count", "is_carried")
+            )
+        )() == [("cold", 60, False), ("hot", 400, False)]
@@ -1,11 +1,13 @@
+import asyncio
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from asgiref.sync import sync_to_async
 
-from scraping.main import ScraperTargetUser
-from users.models import User
+from scraping.main import Scraper, ScraperTargetUser
+from scraping.models import ScrapeCheckpoint
+from users.models import User, UserTokenHealth
 
 
 class TestScraperTokenAndUserInfoAndProcessing:
@@ -123,33 +125,16 @@ class TestScraperTokenAndUserInfoAndProcessing:
 
         assert result is not None
         assert result["data"]["getStats"]["total"] == 150
-        mock_fetch.assert_called_once_with("post-123", "token-1", "token-2")
-
-    @patch("scraping.main.fetch_post_stats")
-    @pytest.mark.asyncio
-    async def test_fetch_post_stats_limited_retry_success(
-        self, mock_fetch, scraper, mock_stats_data
-    ):
-        """fetch_post_stats 재시도 성공 테스트"""
-        mock_fetch.side_effect = [
-            None,  # 첫 번째 시도 실패
-            mock_stats_data,  # 두 번째 시도 성공
-        ]
-
-        result = await scraper.fetch_post_stats_limited(
-            "post-123", "token-1", "token-2"
+        mock_fetch.assert_called_once_with(
+            "post-123", "token-1", "token-2", session=None, retry_attempts=1
         )
 
-        assert result is not None
-        assert result["data"]["getStats"]["total"] == 150
-        assert mock_fetch.call_count == 2
-
     @patch("scraping.main.fetch_post_stats")
     @pytest.mark.asyncio
-    async def test_fetch_post_stats_limited_max_retries(
+    async def test_fetch_post_stats_limited_failure_without_retry(
         self, mock_fetch, scraper
     ):
-        """최대 재시도 횟수 초과 테스트"""
+        """실패하면 재시도 없이 None 을 반환하는지 테스트 (재시도는 dead-letter 패스)"""
         mock_fetch.return_value = None
 
         result = await scraper.fetch_post_stats_limited(
@@ -157,10 +142,10 @@ class TestScraperTokenAndUserInfoAndProcessing:
         )
 
         assert result is None
-        assert mock_fetch.call_count == 3  # 최대 3번 재시도
+        mock_fetch.assert_called_once()
 
     @patch("scraping.main.fetch_velog_user_chk")
-    @patch("scraping.main.fetch_all_velog_posts")
+    @patch("scraping.main.iter_velog_posts")
     @patch("scraping.main.AESEncryption")
     @pytest.mark.asyncio
     async def test_process_user_success(
@@ -173,6 +158,7 @@ class TestScraperTokenAndUserInfoAndProcessing:
         mock_user_data,
         mock_posts_data,
         mock_stats_data,
+        post_pages,
     ):
         """유저 데이터 전체 처리 성공 테스트"""
         # AES 암호화 모킹
@@ -192,7 +178,10 @@ class TestScraperTokenAndUserInfoAndProcessing:
             },
             mock_user_data,
         )
-        mock_fetch_posts.return_value = mock_posts_data
+        # 게시물 목록은 페이지 단위로 도착
+        mock_fetch_posts.side_effect = post_pages(
+            mock_posts_data[:1], mock_posts_data[1:]
+        )
 
         # 내부 메서드 모킹 - 성공 케이스로 설정
         with (
@@ -214,14 +203,20 @@ class TestScraperTokenAndUserInfoAndProcessing:
             patch.object(
                 scraper, "sync_post_active_status", new_callable=AsyncMock
             ) as mock_sync_status,
+            patch.object(
+                scraper,
+                "fetch_posts_stats_batch_limited",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
             patch.object(
                 scraper, "fetch_post_stats_limited", new_callable=AsyncMock
             ) as mock_fetch_stats,
             patch.object(
-                scraper, "update_daily_statistics", new_callable=AsyncMock
+                scraper, "bulk_update_daily_statistics", new_callable=AsyncMock
             ) as mock_update_stats,
         ):
-            # 통계 데이터 모킹
+            # 통계 데이터 모킹, batch 요청은 거부되어 단건 요청으로 대체
             mock_fetch_stats.return_value = mock_stats_data
 
             # 테스트 실행
@@ -235,11 +230,21 @@ class TestScraperTokenAndUserInfoAndProcessing:
         args, kwargs = mock_update_user_info.call_args
         assert args[1] == mock_user_data["data"]["currentUser"]
 
-        mock_bulk_upsert.assert_called_once()
+        # 페이지가 도착할 때마다 upsert
+        assert [call.args[1] for call in mock_bulk_upsert.call_args_list] == [
+            mock_posts_data[:1],
+            mock_posts_data[1:],
+        ]
         mock_sync_status.assert_called_once()
+        assert mock_sync_status.call_args.args[1] == {
+            post["id"] for post in mock_posts_data
+        }
         # 게시물 개수만큼 호출되어야 함
         assert mock_fetch_stats.call_count == len(mock_posts_data)
-        assert mock_update_stats.call_count == len(mock_posts_data)
+        # 통계 upsert 는 청크 단위로 한 번에 호출되어야 함
+        mock_update_stats.assert_called_once()
+        (posts_with_stats,) = mock_update_stats.call_args.args
+        assert [post for post, _ in posts_with_stats] == mock_posts_data
 
     @patch("scraping.main.fetch_velog_user_chk")
     @patch("scraping.main.AESEncryption")
@@ -322,11 +327,11 @@ class TestScraperTokenAndUserInfoAndProcessing:
 
         # User.objects.filter 모킹
         with patch("users.models.User.objects.filter") as mock_filter:
-            # 비동기 이터레이터를 반환하도록 설정
-            mock_filter.return_value = async_mock_filter()
+            # 비동기 이터레이터를 반환하도록 설정 (backoff 사용자 exclude 이후)
+            mock_filter.return_value.exclude.return_value = async_mock_filter()
 
-            # aiohttp.ClientSession 모킹
-            with patch("aiohttp.ClientSession") as mock_session:
+            # run 이 사용하는 create_session 모킹
+            with patch.object(scraper, "create_session") as mock_session:
                 mock_session_instance = MagicMock()
                 mock_session.return_value.__aenter__.return_value = (
                     mock_session_instance
@@ -343,6 +348,52 @@ class TestScraperTokenAndUserInfoAndProcessing:
         assert mock_logger.info.call_count >= 2  # 시작과 종료 로그
         mock_process.assert_called_once_with(test_user, mock_session_instance)
 
+    @pytest.mark.asyncio
+    async def test_process_users_respects_user_concurrency(self):
+        """process_users 가 user_concurrency 이상 동시에 실행하지 않는지 테스트"""
+        concurrent_scraper = Scraper(
+            group_range=range(1, 10), max_connections=10, user_concurrency=3
+        )
+        users = [MagicMock(velog_uuid=uuid.uuid4()) for _ in range(10)]
+        running = 0
+        max_running = 0
+
+        async def fake_process_user(user, session):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        with patch.object(
+            concurrent_scraper, "process_user", side_effect=fake_process_user
+        ) as mock_process:
+            await concurrent_scraper.process_users(users, MagicMock())
+
+        assert mock_process.call_count == len(users)
+        assert max_running == 3
+
+    @pytest.mark.asyncio
+    async def test_process_users_isolates_user_failure(self):
+        """한 사용자의 처리 실패가 다른 사용자 처리를 멈추지 않는지 테스트"""
+        concurrent_scraper = Scraper(
+            group_range=range(1, 10), max_connections=10, user_concurrency=2
+        )
+        users = [MagicMock(velog_uuid=uuid.uuid4()) for _ in range(3)]
+        processed = []
+
+        async def fake_process_user(user, session):
+            if user is users[0]:
+                raise Exception("Failed to update tokens, Check the logs")
+            processed.append(user)
+
+        with patch.object(
+            concurrent_scraper, "process_user", side_effect=fake_process_user
+        ):
+            await concurrent_scraper.process_users(users, MagicMock())
+
+        assert processed == users[1:]
+
     @pytest.mark.asyncio
     @pytest.mark.django_db
     async def test_scraper_target_user_run(self):
@@ -368,8 +419,10 @@ class TestScraperTokenAndUserInfoAndProcessing:
         with patch.object(
             target_scraper, "process_user", new_callable=AsyncMock
         ) as mock_process:
-            # aiohttp.ClientSession 모킹
-            with patch("aiohttp.ClientSession") as mock_session:
+            # run 이 사용하는 create_session 모킹
+            with patch.object(
+                target_scraper, "create_session"
+            ) as mock_session:
                 mock_session_instance = MagicMock()
                 mock_session.return_value.__aenter__.return_value = (
                     mock_session_instance
@@ -381,6 +434,120 @@ class TestScraperTokenAndUserInfoAndProcessing:
         # process_user 호출 확인
         mock_process.assert_called_once()
 
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_update_token_health(self, scraper, user):
+        """토큰 검증 실패가 이어지면 backoff 가 늘어나고 성공하면 초기화되는지 테스트"""
+        await scraper.update_token_health(user, is_valid=False)
+        await scraper.update_token_health(user, is_valid=False)
+
+        health = await sync_to_async(UserTokenHealth.objects.get)(user=user)
+        assert health.consecutive_failures == 2
+        assert health.next_retry_at - health.last_failure_at == (
+            UserTokenHealth.backoff_delay(2)
+        )
+        assert health.failed_token_digest == UserTokenHealth.token_digest(
+            user.access_token
+        )
+
+        await scraper.update_token_health(user, is_valid=True)
+
+        await sync_to_async(health.refresh_from_db)()
+        assert health.consecutive_failures == 0
+        assert health.next_retry_at is None
+        assert health.last_success_at is not None
+
+    @patch("scraping.main.fetch_velog_user_chk")
+    @patch("scraping.main.AESEncryption")
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.parametrize(
+        "user_chk_result, expected_failures",
+        [
+            # 503, timeout 등 요청 실패
+            (({}, {}), 1),
+            # GraphQL 오류로 data 가 없는 응답
+            (
+                (
+                    {},
+                    {"errors": [{"message": "Internal error"}], "data": None},
+                ),
+                1,
+            ),
+            # 토큰이 유효하지 않은 응답
+            (({}, {"data": {"currentUser": None}}), 2),
+        ],
+    )
+    async def test_process_user_token_check_failure(
+        self,
+        mock_aes,
+        mock_fetch_user_chk,
+        scraper,
+        user,
+        user_chk_result,
+        expected_failures,
+    ):
+        """currentUser 가 null 인 응답만 토큰 실패로 기록하고 요청 실패는 건너뛰는지 테스트"""
+        await scraper.update_token_health(user, is_valid=False)
+        health = await sync_to_async(UserTokenHealth.objects.get)(user=user)
+        next_retry_at = health.next_retry_at
+        mock_fetch_user_chk.return_value = user_chk_result
+
+        with patch.object(
+            scraper, "update_old_user_info", new_callable=AsyncMock
+        ) as mock_update_user_info:
+            await scraper.process_user(user, AsyncMock())
+
+        mock_update_user_info.assert_not_called()
+        await sync_to_async(health.refresh_from_db)()
+        assert health.consecutive_failures == expected_failures
+        if expected_failures == 1:
+            assert health.next_retry_at == next_retry_at
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_scraper_target_user_run_resume(self):
+        """--resume 으로 재실행하면 완료 체크포인트가 있는 사용자를 건너뛰는지 테스트"""
+        users = [
+            await sync_to_async(User.objects.create)(
+                velog_uuid=uuid.uuid4(),
+                access_token="test-access-token",
+                refresh_token="test-refresh-token",
+                group_id=1,
+                email=f"test{i}@example.com",
+            )
+            for i in range(2)
+        ]
+        run_id = uuid.uuid4()
+        target_scraper = ScraperTargetUser(
+            user_pk_list=[user.id for user in users], run_id=run_id
+        )
+        await target_scraper.save_checkpoint(
+            users[0], ScrapeCheckpoint.Step.DONE
+        )
+        await target_scraper.save_checkpoint(
+            users[1], ScrapeCheckpoint.Step.POSTS
+        )
+
+        with patch.object(
+            target_scraper, "process_user", new_callable=AsyncMock
+        ) as mock_process:
+            await target_scraper.run()
+
+        mock_process.assert_called_once()
+        assert mock_process.call_args.args[0].id == users[1].id
+        checkpoints = await sync_to_async(
+            lambda: dict(
+                ScrapeCheckpoint.objects.filter(run_id=run_id).values_list(
+                    "user_id", "step"
+                )
+            )
+        )()
+        assert checkpoints == {
+            users[0].id: ScrapeCheckpoint.Step.DONE,
+            users[1].id: ScrapeCheckpoint.Step.POSTS,
+        }
+
     @patch("scraping.main.AESEncryption")
     @pytest.mark.asyncio
     async def test_update_old_user_info_success(self, mock_aes, scraper, user):
@@ -0,0 +1,82 @@
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from posts.models import Post
+from scraping.priority import PriorityLane
+from users.models import User, UserTokenHealth
+from utils.utils import get_local_now
+
+
+def create_user(**kwargs) -> User:
+    return User.objects.create(
+        velog_uuid=uuid.uuid4(),
+        access_token="encrypted-access-token",
+        refresh_token="encrypted-refresh-token",
+        group_id=1,
+        email=f"{uuid.uuid4()}@example.com",
+        **kwargs,
+    )
+
+
+class TestPriorityLane:
+    def test_get_pending_user_pks(self, db):
+        """한 번도 처리되지 않은 활성 사용자만 신규 사용자로 찾는지 테스트"""
+        new_user = create_user()
+        processed_user = create_user()
+        UserTokenHealth.objects.create(
+            user=processed_user, last_success_at=get_local_now()
+        )
+        user_with_posts = create_user()
+        Post.objects.create(
+            post_uuid=uuid.uuid4(),
+            title="Title",
+            user=user_with_posts,
+            released_at=get_local_now(),
+        )
+        inactive_user = create_user(is_active=False)
+
+        pending = PriorityLane().get_pending_user_pks()
+
+        assert new_user.pk in pending
+        assert not {
+            processed_user.pk,
+            user_with_posts.pk,
+            inactive_user.pk,
+        } & set(pending)
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_run_once_shares_rate_limiter(self):
+        """신규 사용자를 backfill 스크래퍼로 처리하고 rate limiter 를 poll 간에 공유하는지 테스트"""
+        new_user = await sync_to_async(create_user)()
+        lane = PriorityLane(max_rate=3.0)
+
+        with patch("scraping.priority.ScraperBackfill") as mock_scraper:
+            mock_scraper.return_value.run = AsyncMock()
+            assert await lane.run_once() >= 1
+            # 처리하지 못한 사용자는 데몬을 다시 시작해도 다시 처리하지 않음
+            assert (
+                new_user.pk
+                not in await sync_to_async(
+                    PriorityLane().get_pending_user_pks
+                )()
+            )
+
+        # 토큰 실패가 아닐 수 있으므로 backoff 없이 실패 시간만 기록
+        health = await sync_to_async(UserTokenHealth.objects.get)(
+            user=new_user
+        )
+        assert health.last_failure_at is not None
+        assert health.consecutive_failures == 0
+        assert health.next_retry_at is None
+
+        user_pk_list = mock_scraper.call_args.args[0]
+        assert new_user.pk in user_pk_list
+        assert (
+            mock_scraper.call_args.kwargs["rate_limiter"] is lane.rate_limiter
+        )
+        mock_scraper.return_value.run.assert_awaited_once()
+        assert lane.rate_limiter.current_rate == pytest.approx(3.0)
@@ -0,0 +1,155 @@
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from scraping.models import RateLimitBudget
+from scraping.rate_limiter import (
+    AdaptiveRateLimiter,
+    SharedRateBudget,
+    create_rate_limit_trace_config,
+)
+
+
+class TestAdaptiveRateLimiter:
+    def test_increase_on_fast_success(self):
+        """빠른 200 응답이 이어지면 요청 속도가 올라가는지 테스트"""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, max_rate=12.0)
+
+        for _ in range(100):
+            limiter.record(200, 0.05)
+
+        assert limiter.current_rate == pytest.approx(12.0)
+
+    @pytest.mark.parametrize("status", [429, 500, 503, None])
+    def test_decrease_on_throttle_or_error(self, status):
+        """429/5xx/네트워크 오류면 요청 속도가 배수로 줄어드는지 테스트"""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0)
+
+        limiter.record(status, 0.05)
+
+        assert limiter.current_rate == pytest.approx(5.0)
+        assert limiter.throttled_count == 1
+
+    def test_decrease_cooldown(self):
+        """동시에 실패한 응답들로 속도가 연달아 줄어들지 않는지 테스트"""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, min_rate=1.0)
+
+        for _ in range(5):
+            limiter.record(429, 0.05)
+
+        assert limiter.current_rate == pytest.approx(5.0)
+        assert limiter.decrease_count == 1
+
+    def test_decrease_on_rising_latency(self):
+        """응답 지연이 임계치를 넘으면 속도가 줄어드는지 테스트"""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, latency_threshold=1.0)
+
+        limiter.record(200, 3.0)
+
+        assert limiter.current_rate == pytest.approx(5.0)
+        assert limiter.throttled_count == 0
+
+    def test_rate_bounds(self):
+        """요청 속도가 min_rate 아래로 내려가지 않는지 테스트"""
+        limiter = AdaptiveRateLimiter(
+            initial_rate=2.0, min_rate=1.5, decrease_cooldown=0
+        )
+
+        for _ in range(5):
+            limiter.record(503, 0.05)
+
+        assert limiter.current_rate == pytest.approx(1.5)
+
+    @pytest.mark.asyncio
+    async def test_acquire_paces_requests(self):
+        """토큰이 없으면 현재 속도에 맞춰 대기하는지 테스트"""
+        limiter = AdaptiveRateLimiter(initial_rate=20.0, max_rate=20.0)
+
+        started_at = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+        elapsed = time.monotonic() - started_at
+
+        # 첫 요청은 바로, 이후 3개는 0.05초 간격
+        assert elapsed >= 0.14
+
+
+class TestSharedRateBudget:
+    def test_lease_shared_between_instances(self, db):
+        """같은 이름의 예산을 쓰는 인스턴스끼리 초당 요청 수를 나눠 쓰는지 테스트"""
+        batch = SharedRateBudget(rate=5.0, name="test", lease_size=4)
+        lane = SharedRateBudget(rate=5.0, name="test", lease_size=4)
+
+        assert batch.lease()[0] == 4
+        granted, wait = lane.lease()
+        # 1초 분량(5개) 중 남은 1개만 가져감
+        assert granted == 1
+        granted, wait = batch.lease()
+        assert granted == 0
+        assert 0 < wait <= 0.2
+        assert RateLimitBudget.objects.filter(name="test").count() == 1
+
+    def test_from_settings(self, settings):
+        """설정값이 0 이면 공유 예산을 사용하지 않는지 테스트"""
+        assert SharedRateBudget.from_settings() is None
+
+        settings.VELOG_SHARED_RATE_LIMIT = 30.0
+        budget = SharedRateBudget.from_settings(lease_size=1)
+
+        assert budget is not None
+        assert budget.rate == pytest.approx(30.0)
+        assert budget.lease_size == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_limiter_consults_shared_budget(self):
+        """프로세스 안의 속도보다 공유 예산이 작으면 공유 예산에 맞춰 대기하는지 테스트"""
+        limiter = AdaptiveRateLimiter(
+            initial_rate=100.0,
+            max_rate=100.0,
+            shared_budget=SharedRateBudget(
+                rate=20.0, name="test", lease_size=1
+            ),
+        )
+
+        started_at = time.monotonic()
+        for _ in range(24):
+            await limiter.acquire()
+        elapsed = time.monotonic() - started_at
+
+        # 처음 20개는 버스트로, 이후 4개는 0.05초 간격
+        assert elapsed >= 0.15
+
+
+class TestRateLimitTraceConfig:
+    @pytest.mark.asyncio
+    async def test_trace_config_records_responses(self):
+        """세션 응답 상태가 rate limiter 에 반영되는지 테스트"""
+        statuses = iter([200, 429])
+
+        async def graphql(request: web.Request) -> web.Response:
+            return web.json_response({}, status=next(statuses))
+
+        app = web.Application()
+        app.router.add_post("/graphql", graphql)
+        server = TestServer(app)
+        await server.start_server()
+
+        limiter = AdaptiveRateLimiter(initial_rate=10.0)
+        try:
+            async with aiohttp.ClientSession(
+                trace_configs=[create_rate_limit_trace_config(limiter)]
+            ) as session:
+                for _ in range(2):
+                    async with session.post(server.make_url("/graphql")):
+                        pass
+        finally:
+            await server.close()
+
+        # 200 으로 10.1 까지 올라갔다가 429 로 절반
+        assert limiter.current_rate == pytest.approx(10.1 / 2)
+        assert limiter.throttled_count == 1
+        assert limiter.latency_ewma is not None
@@ -0,0 +1,69 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from scraping.refresh_scheduler import StatsRefreshScheduler
+
+# 2026-10-20 은 화요일 (주간 기준 요일 아님)
+TUESDAY = date(2026, 10, 20)
+OLD_RELEASED_AT = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+class TestStatsRefreshScheduler:
+    @pytest.mark.parametrize(
+        "daily_views, released_at, expected",
+        [
+            (None, OLD_RELEASED_AT, 1),
+            (0, datetime(2026, 10, 15, tzinfo=timezone.utc), 1),
+            (10, OLD_RELEASED_AT, 1),
+            (2, OLD_RELEASED_AT, 2),
+            (0.1, OLD_RELEASED_AT, 4),
+            (0, None, 4),
+        ],
+    )
+    def test_refresh_interval(self, daily_views, released_at, expected):
+        """최근 조회수 증가량과 게시글 나이로 갱신 주기를 나누는지 테스트"""
+        scheduler = StatsRefreshScheduler(TUESDAY)
+
+        assert scheduler.refresh_interval(daily_views, released_at) == expected
+
+    def test_is_due_staggers_posts(self):
+        """주기가 긴 게시글은 주기 동안 한 번씩 날짜가 분산되어 갱신되는지 테스트"""
+        due_days = {
+            post_id: [
+                day
+                for day in range(4)
+                if StatsRefreshScheduler(TUESDAY + timedelta(days=day)).is_due(
+                    post_id, 4
+                )
+            ]
+            for post_id in range(4)
+        }
+
+        # 화~금 동안 게시글마다 정확히 하루씩, 서로 다른 날에 갱신
+        assert all(len(days) == 1 for days in due_days.values())
+        assert len({days[0] for days in due_days.values()}) == 4
+
+    def test_is_due_on_boundary_weekday(self):
+        """주간 기준 요일에는 모든 게시글을 갱신하는지 테스트"""
+        monday = TUESDAY - timedelta(days=1)
+        scheduler = StatsRefreshScheduler(monday)
+
+        assert all(scheduler.is_due(post_id, 4) for post_id in range(8))
+
+    def test_daily_views(self):
+        start = datetime(2026, 10, 13, tzinfo=timezone.utc)
+
+        assert (
+            StatsRefreshScheduler.daily_views(
+                100, 170, start, start + timedelta(days=7)
+            )
+            == 10
+        )
+        # 하루치 통계만 있으면 증가량을 알 수 없음
+        assert (
+            StatsRefreshScheduler.daily_views(100, 100, start, start) is None
+        )
+        assert (
+            StatsRefreshScheduler.daily_views(None, None, None, None) is None
+        )
@@ -0,0 +1,111 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from scraping.models import TrendingPostSample
+from scraping.trending import TrendingSampler
+from scraping.velog.schemas import Post as VelogPost
+from scraping.velog.schemas import PostStats
+from scraping.velog.schemas import User as VelogUser
+from scraping.velog.service import VelogService
+from users.models import User
+from utils.utils import get_local_now
+
+
+class TestTrendingSampler:
+    def test_get_bucket(self):
+        """샘플 시간이 interval_minutes 단위로 내림되는지 테스트"""
+        sampler = TrendingSampler(interval_minutes=15)
+        now = datetime(2026, 10, 17, 13, 44, 59, 123, tzinfo=timezone.utc)
+
+        assert sampler.get_bucket(now) == datetime(
+            2026, 10, 17, 13, 30, tzinfo=timezone.utc
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_sample_once(self):
+        """인기 게시글을 기록하고, 가입한 작성자의 게시글만 조회수를 가져오는지 테스트"""
+        author = await sync_to_async(User.objects.create)(
+            velog_uuid=uuid.uuid4(),
+            access_token="encrypted-access-token",
+            refresh_token="encrypted-refresh-token",
+            group_id=1,
+            email="author@example.com",
+        )
+        posts = [
+            VelogPost(
+                id=str(uuid.uuid4()),
+                title="registered author",
+                short_description="",
+                likes=10,
+                comments_count=2,
+                user=VelogUser(id=str(author.velog_uuid), username="author"),
+            ),
+            VelogPost(
+                id=str(uuid.uuid4()),
+                title="unknown author",
+                short_description="",
+                likes=5,
+                user=VelogUser(id=str(uuid.uuid4()), username="unknown"),
+            ),
+        ]
+        expired_sample = await sync_to_async(
+            TrendingPostSample.objects.create
+        )(
+            bucket=get_local_now()
+            - timedelta(days=TrendingPostSample.RETENTION_DAYS + 1),
+            post_uuid=uuid.uuid4(),
+            rank=1,
+        )
+        sampler = TrendingSampler(interval_minutes=10)
+
+        with (
+            patch("scraping.trending.AESEncryption") as mock_aes,
+            patch.object(
+                VelogService,
+                "get_trending_posts",
+                new_callable=AsyncMock,
+                return_value=posts,
+            ),
+            patch.object(
+                VelogService,
+                "get_post_stats",
+                new_callable=AsyncMock,
+                return_value=PostStats(id=posts[0].id, likes=10, views=42),
+            ) as mock_get_post_stats,
+        ):
+            mock_aes.return_value.decrypt.side_effect = lambda token: token
+            sampled = await sampler.sample_once(MagicMock())
+
+        assert sampled == 2
+        mock_get_post_stats.assert_called_once_with(posts[0].id)
+        samples = await sync_to_async(
+            lambda: list(
+                TrendingPostSample.objects.order_by("rank").values(
+                    "post_uuid", "rank", "likes", "comments_count", "views"
+                )
+            )
+        )()
+        assert samples == [
+            {
+                "post_uuid": uuid.UUID(posts[0].id),
+                "rank": 1,
+                "likes": 10,
+                "comments_count": 2,
+                "views": 42,
+            },
+            {
+                "post_uuid": uuid.UUID(posts[1].id),
+                "rank": 2,
+                "likes": 5,
+                "comments_count": 0,
+                "views": None,
+            },
+        ]
+        assert not await sync_to_async(
+            TrendingPostSample.objects.filter(id=expired_sample.id).exists
+        )()
@@ -0,0 +1,179 @@
+import uuid
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from scraping.main import ScraperQueueWorker
+from scraping.models import ScrapeCheckpoint, ScrapeJob
+from scraping.work_queue import ScrapeJobQueue
+from users.models import User
+from utils.utils import get_local_now
+
+
+@pytest.fixture
+def users(db):
+    return [
+        User.objects.create(
+            velog_uuid=uuid.uuid4(),
+            access_token="encrypted-access-token",
+            refresh_token="encrypted-refresh-token",
+            group_id=1,
+            email=f"test{i}@example.com",
+        )
+        for i in range(3)
+    ]
+
+
+class TestScrapeJobQueue:
+    def test_enqueue_skips_active_jobs(self, users):
+        """이미 대기 중이거나 진행 중인 사용자는 다시 등록하지 않는지 테스트"""
+        first_run_id = ScrapeJobQueue.enqueue_users([users[0].id])
+
+        run_id = ScrapeJobQueue.enqueue_users([user.id for user in users])
+
+        assert run_id != first_run_id
+        assert ScrapeJob.objects.filter(run_id=run_id).count() == 2
+        assert ScrapeJob.objects.filter(user=users[0]).count() == 1
+
+    def test_claim_leases_jobs(self, users):
+        """가져간 작업은 lease 가 걸려 다른 워커가 가져가지 못하는지 테스트"""
+        ScrapeJobQueue.enqueue_users([user.id for user in users])
+        worker_a = ScrapeJobQueue("worker-a")
+        worker_b = ScrapeJobQueue("worker-b")
+
+        claimed_a = worker_a.claim(limit=2)
+        claimed_b = worker_b.claim(limit=2)
+
+        assert len(claimed_a) == 2
+        assert len(claimed_b) == 1
+        assert {job.id for job in claimed_a}.isdisjoint(
+            job.id for job in claimed_b
+        )
+        assert all(
+            job.status == ScrapeJob.Status.RUNNING
+            and job.lease_owner == "worker-a"
+            and job.attempts == 1
+            for job in claimed_a
+        )
+        assert worker_b.claim() == []
+
+    def test_claim_reclaims_expired_lease(self, users):
+        """lease 가 만료된 작업은 다른 워커가 다시 가져가는지 테스트"""
+        ScrapeJobQueue.enqueue_users([users[0].id])
+        (job,) = ScrapeJobQueue("worker-a").claim()
+        ScrapeJob.objects.filter(id=job.id).update(
+            lease_expires_at=get_local_now() - timedelta(seconds=1)
+        )
+
+        (reclaimed,) = ScrapeJobQueue("worker-b").claim()
+
+        assert reclaimed.id == job.id
+        assert reclaimed.lease_owner == "worker-b"
+        assert reclaimed.attempts == 2
+        # 이전 워커는 더 이상 lease 를 연장할 수 없음
+        assert not ScrapeJobQueue("worker-a").renew(job)
+
+    def test_claim_fails_exhausted_expired_jobs(self, users):
+        """재시도 횟수를 모두 쓴 만료 작업은 실패 처리되는지 테스트"""
+        ScrapeJobQueue.enqueue_users([users[0].id])
+        (job,) = ScrapeJobQueue("worker-a").claim()
+        ScrapeJob.objects.filter(id=job.id).update(
+            attempts=3,
+            lease_expires_at=get_local_now() - timedelta(seconds=1),
+        )
+
+        assert ScrapeJobQueue("worker-b").claim() == []
+
+        job.refresh_from_db()
+        assert job.status == ScrapeJob.Status.FAILED
+        assert job.finished_at is not None
+
+    def test_fail_requeues_until_max_attempts(self, users):
+        """실패한 작업은 재시도 횟수가 남아 있으면 다시 대기 상태가 되는지 테스트"""
+        ScrapeJobQueue.enqueue_users([users[0].id])
+        queue = ScrapeJobQueue("worker-a", max_attempts=2)
+
+        (job,) = queue.claim()
+        queue.fail(job, "boom")
+        job.refresh_from_db()
+        assert job.status == ScrapeJob.Status.PENDING
+
+        (job,) = queue.claim()
+        queue.fail(job, "boom")
+        job.refresh_from_db()
+        assert job.status == ScrapeJob.Status.FAILED
+        assert job.last_error == "boom"
+
+    def test_complete(self, users):
+        ScrapeJobQueue.enqueue_users([users[0].id])
+        queue = ScrapeJobQueue("worker-a")
+        (job,) = queue.claim()
+
+        queue.complete(job)
+
+        job.refresh_from_db()
+        assert job.status == ScrapeJob.Status.DONE
+        assert job.lease_expires_at is None
+        assert job.finished_at is not None
+
+
+class TestScraperQueueWorker:
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_run_drains_queue(self, users):
+        """워커가 작업 큐를 모두 소진하고 성공/실패를 반영하는지 테스트"""
+        await sync_to_async(ScrapeJobQueue.enqueue_users)(
+            [user.id for user in users]
+        )
+        worker = ScraperQueueWorker("worker-a", user_concurrency=2)
+
+        async def process_user(user, session):
+            if user.id == users[0].id:
+                raise Exception("boom")
+
+        with patch.object(
+            worker,
+            "process_user",
+            new_callable=AsyncMock,
+            side_effect=process_user,
+        ) as mock_process_user:
+            await worker.run()
+
+        # 실패한 작업은 재시도 횟수(3회)만큼 다시 처리됨
+        assert mock_process_user.call_count == 2 + 3
+        statuses = await sync_to_async(
+            lambda: dict(ScrapeJob.objects.values_list("user_id", "status"))
+        )()
+        assert statuses == {
+            users[0].id: ScrapeJob.Status.FAILED,
+            users[1].id: ScrapeJob.Status.DONE,
+            users[2].id: ScrapeJob.Status.DONE,
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_process_job_saves_checkpoint_with_job_run_id(self, users):
+        """작업 처리 중 진행 단계가 작업의 run_id 로 기록되는지 테스트"""
+        run_id = await sync_to_async(ScrapeJobQueue.enqueue_users)(
+            [users[0].id]
+        )
+        worker = ScraperQueueWorker("worker-a")
+        (job,) = await sync_to_async(worker.queue.claim)(1)
+
+        async def process_user(user, session):
+            await worker.save_checkpoint(user, ScrapeCheckpoint.Step.POSTS)
+
+        with patch.object(
+            worker,
+            "process_user",
+            new_callable=AsyncMock,
+            side_effect=process_user,
+        ):
+            await worker.process_job(job, AsyncMock())
+
+        checkpoint = await ScrapeCheckpoint.objects.aget(user=users[0])
+        assert checkpoint.run_id == run_id
+        assert checkpoint.step == ScrapeCheckpoint.Step.POSTS
+        assert worker.job_run_ids == {}
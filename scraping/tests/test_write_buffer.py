@@ -0,0 +1,72 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from scraping.write_buffer import DailyStatisticsBuffer
+
+
+class TestDailyStatisticsBuffer:
+    @pytest.mark.asyncio
+    async def test_flush_when_max_rows_reached(self):
+        """여러 사용자의 통계가 max_rows 만큼 쌓이면 한 번에 flush 하는지 테스트"""
+        writer = AsyncMock(return_value=4)
+        buffer = DailyStatisticsBuffer(writer, max_rows=3)
+
+        await buffer.add(1, {"a": (1, 1), "b": (2, 2)})
+        writer.assert_not_called()
+        await buffer.add(2, {"c": (3, 3), "d": (4, 4)})
+
+        writer.assert_called_once_with(
+            {"a": (1, 1), "b": (2, 2), "c": (3, 3), "d": (4, 4)}, set()
+        )
+        assert buffer.pending_rows == 0
+        assert buffer.flush_count == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_when_interval_elapsed(self):
+        """max_interval 이 지나면 row 수와 관계없이 flush 하는지 테스트"""
+        writer = AsyncMock(return_value=1)
+        buffer = DailyStatisticsBuffer(writer, max_rows=100, max_interval=0)
+
+        await buffer.add(1, {"a": (1, 1)})
+
+        writer.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_completed_users_flushed_with_statistics(self):
+        """완료된 사용자는 통계와 같은 flush 에서 체크포인트 대상으로 전달되는지 테스트"""
+        writer = AsyncMock(return_value=1)
+        buffer = DailyStatisticsBuffer(writer, max_rows=100)
+
+        await buffer.add(1, {"a": (1, 1)})
+        await buffer.mark_completed(1)
+        await buffer.add(2, {"b": (2, 2)})
+        await buffer.flush()
+
+        writer.assert_called_once_with({"a": (1, 1), "b": (2, 2)}, {1})
+        # 비어 있으면 다시 기록하지 않음
+        await buffer.flush()
+        writer.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_isolated_per_user(self):
+        """묶음 기록이 실패하면 사용자 단위로 다시 기록해 실패를 격리하는지 테스트"""
+
+        async def writer(counts, completed_user_ids):
+            if "bad" in counts:
+                raise Exception("boom")
+            return len(counts)
+
+        mock_writer = AsyncMock(side_effect=writer)
+        buffer = DailyStatisticsBuffer(mock_writer, max_rows=100)
+
+        await buffer.add(1, {"a": (1, 1)})
+        await buffer.mark_completed(1)
+        await buffer.add(2, {"bad": (2, 2)})
+        await buffer.mark_completed(2)
+        await buffer.flush()
+
+        assert mock_writer.call_count == 3
+        mock_writer.assert_any_call({"a": (1, 1)}, [1])
+        mock_writer.assert_any_call({"bad": (2, 2)}, [2])
+        assert buffer.failed_user_ids == {2}
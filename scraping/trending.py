@@ -0,0 +1,172 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+import aiohttp
+import environ
+import sentry_sdk
+from asgiref.sync import sync_to_async
+
+from modules.token_encryption.aes_encryption import AESEncryption
+from scraping.models import TrendingPostSample
+from scraping.velog.exceptions import VelogError
+from scraping.velog.schemas import Post as VelogPost
+from scraping.velog.service import VelogService
+from users.models import User
+from utils.utils import get_local_now
+
+logger = logging.getLogger("scraping")
+
+
+class TrendingSampler:
+    """
+    인기 게시글 고빈도 샘플러
+    interval_minutes 마다 현재 인기 게시글 목록(get_trending_posts)을 가져와 TrendingPostSample 에 기록
+    getStats 는 작성자 본인 토큰으로만 조회되므로, 조회수는 작성자가 가입한 사용자인 게시글만 기록
+    """
+
+    def __init__(
+        self,
+        interval_minutes: int = 10,
+        limit: int = 20,
+        timeframe: str = "day",
+        stats_concurrency: int = 5,
+    ) -> None:
+        self.env = environ.Env()
+        self.interval_minutes = max(1, interval_minutes)
+        self.limit = limit
+        self.timeframe = timeframe
+        self.stats_semaphore = asyncio.Semaphore(stats_concurrency)
+
+    def get_bucket(self, now: datetime) -> datetime:
+        """interval_minutes 단위로 내림한 샘플 시간 구간"""
+        minutes = (now.hour * 60 + now.minute) // self.interval_minutes
+        minutes *= self.interval_minutes
+        return now.replace(
+            hour=minutes // 60, minute=minutes % 60, second=0, microsecond=0
+        )
+
+    async def get_author_tokens(
+        self, posts: list[VelogPost]
+    ) -> dict[str, tuple[str, str]]:
+        """가입한 작성자의 velog user id 별 복호화된 (access_token, refresh_token)"""
+        author_ids = {post.user.id for post in posts if post.user}
+
+        @sync_to_async(thread_sensitive=True)  # type: ignore
+        def _get_authors() -> list[User]:
+            return list(
+                User.objects.filter(velog_uuid__in=author_ids, is_active=True)
+            )
+
+        tokens = {}
+        for user in await _get_authors():
+            aes_key_index = (user.group_id % 100) % 10
+            aes_key = self.env(f"AES_KEY_{aes_key_index}").encode()
+            aes_encryption = AESEncryption(aes_key)
+            tokens[str(user.velog_uuid)] = (
+                aes_encryption.decrypt(user.access_token),
+                aes_encryption.decrypt(user.refresh_token),
+            )
+        return tokens
+
+    async def fetch_views(
+        self,
+        session: aiohttp.ClientSession,
+        post: VelogPost,
+        tokens: tuple[str, str] | None,
+    ) -> int | None:
+        if tokens is None:
+            return None
+
+        async with self.stats_semaphore:
+            try:
+                stats = await VelogService(session, *tokens).get_post_stats(
+                    post.id
+                )
+            except VelogError as e:
+                logger.warning(f"Failed to fetch trending post stats: {e}")
+                return None
+        return stats.views if stats else None
+
+    async def sample_once(self, session: aiohttp.ClientSession) -> int:
+        """현재 인기 게시글 목록을 한 번 샘플링, 기록한 게시글 수 반환"""
+        now = get_local_now()
+        bucket = self.get_bucket(now)
+
+        # 인기 게시글 목록은 공개 API 라 토큰 값은 사용되지 않음
+        trending_service = VelogService(
+            session, "dummy_access_token", "dummy_refresh_token"
+        )
+        posts = await trending_service.get_trending_posts(
+            limit=self.limit, timeframe=self.timeframe
+        )
+        if not posts:
+            logger.warning("No trending posts to sample")
+            return 0
+
+        tokens_by_author = await self.get_author_tokens(posts)
+        views = await asyncio.gather(
+            *(
+                self.fetch_views(
+                    session,
+                    post,
+                    tokens_by_author.get(post.user.id) if post.user else None,
+                )
+                for post in posts
+            )
+        )
+
+        samples = [
+            TrendingPostSample(
+                bucket=bucket,
+                post_uuid=post.id,
+                rank=rank,
+                likes=post.likes,
+                comments_count=post.comments_count,
+                views=post_views,
+            )
+            for rank, (post, post_views) in enumerate(
+                zip(posts, views), start=1
+            )
+        ]
+
+        @sync_to_async(thread_sensitive=True)  # type: ignore
+        def _save_samples() -> int:
+            TrendingPostSample.objects.bulk_create(
+                samples,
+                update_conflicts=True,
+                unique_fields=["post_uuid", "bucket"],
+                update_fields=["rank", "likes", "comments_count", "views"],
+            )
+            expired_count, _ = TrendingPostSample.objects.filter(
+                bucket__lt=now
+                - timedelta(days=TrendingPostSample.RETENTION_DAYS)
+            ).delete()
+            return int(expired_count)
+
+        expired_count = await _save_samples()
+        logger.info(
+            f"Sampled {len(samples)} trending posts at {bucket.isoformat()} "
+            f"(with views: {sum(v is not None for v in views)}, "
+            f"expired: {expired_count})"
+        )
+        return len(samples)
+
+    async def run(self, once: bool = False) -> None:
+        """interval_minutes 마다 샘플링, once 면 한 번만 실행"""
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    await self.sample_once(session)
+                except Exception as e:
+                    # 한 번의 실패로 샘플러가 멈추지 않도록 다음 구간에 다시 시도
+                    logger.error(f"Failed to sample trending posts: {e}")
+                    sentry_sdk.capture_exception(e)
+                if once:
+                    return
+
+                now = get_local_now()
+                next_bucket = self.get_bucket(now) + timedelta(
+                    minutes=self.interval_minutes
+                )
+                await asyncio.sleep((next_bucket - now).total_seconds())
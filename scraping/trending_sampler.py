@@ -0,0 +1,66 @@
+"""
+[26.10.17] 인기 게시글 고빈도 샘플링 배치
+- 하루 한 번 실행되는 사용자 단위 배치(aggregate_batch)와 별개로 현재 인기 게시글만 N 분마다 샘플링
+- 샘플은 TrendingPostSample 에 N 분 단위 bucket 으로 기록되며 7일이 지나면 삭제
+- 조회수는 작성자가 가입한 사용자인 게시글만 기록 (getStats 는 작성자 토큰 필요)
+- 실행은 아래와 같은 커멘드 활용
+- poetry run python ./scraping/trending_sampler.py
+- poetry run python ./scraping/trending_sampler.py --interval-minutes 5 --limit 50
+- poetry run python ./scraping/trending_sampler.py --once
+- 운영에서는 run-trending-sampler.yaml 워크플로가 10분마다 --once 로 실행
+"""
+
+import argparse
+import asyncio
+import warnings
+
+import setup_django  # noqa
+
+from scraping.trending import TrendingSampler
+
+# Django에서 발생하는 RuntimeWarning 무시
+warnings.filterwarnings(
+    "ignore",
+    message=r"DateTimeField .* received a naive datetime",
+    category=RuntimeWarning,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--interval-minutes",
+        type=int,
+        default=10,
+        help="Minutes between trending post samples",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Number of trending posts sampled each time",
+    )
+    parser.add_argument(
+        "--timeframe",
+        choices=["day", "week", "month", "year"],
+        default="day",
+        help="Trending timeframe",
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Sample once and exit (for cron)",
+    )
+    args = parser.parse_args()
+
+    sampler = TrendingSampler(
+        interval_minutes=args.interval_minutes,
+        limit=args.limit,
+        timeframe=args.timeframe,
+    )
+    asyncio.run(sampler.run(once=args.once))
+
+
+# 실행
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from datetime import datetime
+
+from scraping.velog.schemas import Post, User
+
+
+class PostBodyCache:
+    """
+    Velog 게시물 상세(본문 포함) 로컬 디스크 캐시 (sqlite)
+    게시물 id 와 updated_at 이 같으면 내용도 같으므로, 재실행이나 다른 분석에서 같은 게시물을 다시 요청하지 않음
+    저장된 크기의 합이 max_bytes 를 넘으면 가장 오래 사용하지 않은 게시물부터 삭제 (LRU)
+    """
+
+    # 캐시 파일 최대 크기 (본문 기준)
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+    # updated_at 없이 id 로만 조회할 때 캐시를 그대로 사용하는 기간 (초)
+    UNVERSIONED_MAX_AGE = 24 * 60 * 60
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        unversioned_max_age: float = UNVERSIONED_MAX_AGE,
+    ) -> None:
+        """
+        Args:
+            path: sqlite 파일 경로 (":memory:" 면 프로세스 메모리에만 유지)
+            max_bytes: 저장할 게시물 데이터 크기 합의 최대값
+            unversioned_max_age: updated_at 없이 조회할 때 캐시를 사용하는 기간 (초)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.unversioned_max_age = unversioned_max_age
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 로컬 sqlite 조회는 짧으므로 이벤트 루프에서 바로 실행, 스레드 간 공유는 lock 으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS velog_post_cache (
+                post_id TEXT PRIMARY KEY,
+                updated_at TEXT,
+                data TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                cached_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS velog_post_cache_last_used_at "
+            "ON velog_post_cache (last_used_at)"
+        )
+
+    def get(
+        self,
+        post_id: str,
+        updated_at: str | None = None,
+        changed_at: datetime | None = None,
+    ) -> Post | None:
+        """
+        캐시된 게시물을 조회합니다.
+
+        Args:
+            post_id: 게시물 ID (UUID 형식)
+            updated_at: 게시물 목록에서 알고 있는 수정 시간, 다르면 캐시를 사용하지 않음
+            changed_at: DB 에 기록된 게시글의 마지막 변경 시간, 이후에 저장된 캐시만 사용
+                둘 다 None 이면 unversioned_max_age 이내에 저장된 캐시만 사용
+
+        Returns:
+            Post | None: 캐시된 게시물 객체, 없으면 None
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated_at, data, cached_at FROM velog_post_cache "
+                "WHERE post_id = ?",
+                (post_id,),
+            ).fetchone()
+            if row is None or not self._is_fresh(
+                row, updated_at, changed_at, now
+            ):
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE velog_post_cache SET last_used_at = ? WHERE post_id = ?",
+                (now, post_id),
+            )
+            self.hits += 1
+
+        return self._load(row[1])
+
+    def set(self, post: Post) -> None:
+        """게시물을 저장하고, 전체 크기가 max_bytes 를 넘으면 오래 사용하지 않은 게시물부터 삭제"""
+        data = json.dumps(asdict(post), ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO velog_post_cache "
+                "(post_id, updated_at, data, size, cached_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    post.id,
+                    post.updated_at,
+                    data,
+                    len(data.encode()),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+
+    def summary(self) -> str:
+        return (
+            f"hits: {self.hits}, misses: {self.misses}, "
+            f"evictions: {self.evictions}"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _is_fresh(
+        self,
+        row: tuple[str | None, str, float],
+        updated_at: str | None,
+        changed_at: datetime | None,
+        now: float,
+    ) -> bool:
+        cached_updated_at, _, cached_at = row
+        if updated_at is not None:
+            return cached_updated_at == updated_at
+        if changed_at is not None:
+            return cached_at >= changed_at.timestamp()
+        return now - cached_at <= self.unversioned_max_age
+
+    def _evict(self) -> None:
+        """max_bytes 를 넘는 만큼 last_used_at 이 오래된 게시물 삭제, lock 안에서 호출"""
+        (total_bytes,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM velog_post_cache"
+        ).fetchone()
+        if total_bytes <= self.max_bytes:
+            return
+
+        evicted_ids = []
+        for post_id, size in self._conn.execute(
+            "SELECT post_id, size FROM velog_post_cache ORDER BY last_used_at"
+        ).fetchall():
+            if total_bytes <= self.max_bytes:
+                break
+            evicted_ids.append((post_id,))
+            total_bytes -= size
+
+        self._conn.executemany(
+            "DELETE FROM velog_post_cache WHERE post_id = ?", evicted_ids
+        )
+        self.evictions += len(evicted_ids)
+
+    @staticmethod
+    def _load(data: str) -> Post:
+        post_data = json.loads(data)
+        user_data = post_data.pop("user", None)
+        return Post(**post_data, user=User(**user_data) if user_data else None)
@@ -1,6 +1,8 @@
-from typing import TYPE_CHECKING, Any
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from scraping.protocols import HttpSession
+from scraping.velog.cache import PostBodyCache
 from scraping.velog.schemas import Post, PostStats, User
 
 
@@ -23,6 +25,7 @@ class VelogClient:
     _session: HttpSession | None = None
     _access_token: str | None = None
     _refresh_token: str | None = None
+    _post_cache: PostBodyCache | None = None
 
     def __init__(
         self, session: HttpSession, access_token: str, refresh_token: str
@@ -102,6 +105,20 @@ class VelogClient:
             self._service.access_token = access_token
             self._service.refresh_token = refresh_token
 
+    def set_post_cache(self, post_cache: PostBodyCache | None) -> None:
+        """
+        게시물 상세(본문) 캐시를 설정합니다.
+
+        Args:
+            post_cache: 게시물 캐시, None 이면 캐시를 사용하지 않음
+
+        Returns:
+            None
+        """
+        VelogClient._post_cache = post_cache
+        if self._service:
+            self._service.post_cache = post_cache
+
     @property
     def service(self) -> "VelogService":
         """
@@ -123,7 +140,10 @@ class VelogClient:
             from scraping.velog.service import VelogService
 
             self._service = VelogService(
-                self._session, self._access_token, self._refresh_token
+                self._session,
+                self._access_token,
+                self._refresh_token,
+                self._post_cache,
             )
         return self._service
 
@@ -190,6 +210,25 @@ class VelogClient:
         """
         return await self.service.get_all_posts(username)
 
+    def iter_posts(
+        self, username: str, max_pages: int = 100
+    ) -> AsyncIterator[list[Post]]:
+        """
+        사용자의 게시물을 페이지 단위로 반환합니다.
+        호출자가 현재 페이지를 처리하는 동안 다음 페이지를 미리 받아옵니다.
+
+        Args:
+            username: 사용자 아이디
+            max_pages: 최대 페이지 수 (기본값: 100, 페이지 당 50개)
+
+        Returns:
+            AsyncIterator[list[Post]]: 한 페이지의 게시물 객체 리스트
+
+        Raises:
+            VelogError: API 요청 중 오류가 발생한 경우
+        """
+        return self.service.iter_posts(username, max_pages)
+
     async def get_post_stats(self, post_id: str) -> PostStats | None:
         """
         특정 게시물의 통계 정보를 조회합니다.
@@ -205,12 +244,20 @@ class VelogClient:
         """
         return await self.service.get_post_stats(post_id)
 
-    async def get_post(self, post_uuid: str) -> Post | None:
+    async def get_post(
+        self,
+        post_uuid: str,
+        updated_at: str | None = None,
+        changed_at: datetime | None = None,
+    ) -> Post | None:
         """
         특정 게시물의 상세 정보를 조회합니다.
+        게시물 캐시가 설정되어 있으면 캐시된 게시물을 먼저 확인합니다.
 
         Args:
             post_uuid: 게시물 ID (UUID 형식)
+            updated_at: 게시물 목록에서 알고 있는 수정 시간, 캐시된 게시물과 다르면 다시 조회
+            changed_at: DB 에 기록된 게시글의 마지막 변경 시간, 캐시가 이보다 오래됐으면 다시 조회
 
         Returns:
             Post | None: 게시물 상세 정보 객체, 조회 실패 시 None
@@ -218,7 +265,7 @@ class VelogClient:
         Raises:
             VelogError: API 요청 중 오류가 발생한 경우
         """
-        return await self.service.get_post(post_uuid)
+        return await self.service.get_post(post_uuid, updated_at, changed_at)
 
     async def get_trending_posts(
         self, limit: int = 20, offset: int = 0, timeframe: str = "week"
@@ -241,13 +288,15 @@ class VelogClient:
         return await self.service.get_trending_posts(limit, offset, timeframe)
 
     async def get_user_posts_with_stats(
-        self, username: str
+        self, username: str, concurrency: int = 10
     ) -> list[dict[str, Any]]:
         """
         사용자의 모든 게시물과 각 게시물의 통계 정보를 함께 조회합니다.
+        게시물 통계는 최대 concurrency 개씩 동시에 조회하며, 결과는 게시물 순서를 유지합니다.
 
         Args:
             username: 사용자 아이디
+            concurrency: 동시에 조회할 최대 게시물 통계 수 (기본값: 10)
 
         Returns:
             list[dict[str, Any]]: 게시물 정보와 통계가 포함된 딕셔너리 리스트
@@ -268,7 +317,27 @@ class VelogClient:
         Raises:
             VelogError: API 요청 중 오류가 발생한 경우
         """
-        return await self.service.get_user_posts_with_stats(username)
+        return await self.service.get_user_posts_with_stats(
+            username, concurrency
+        )
+
+    def iter_user_posts_with_stats(
+        self, username: str, concurrency: int = 10
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        사용자의 모든 게시물과 통계 정보를 조회가 끝나는 순서대로 반환합니다.
+
+        Args:
+            username: 사용자 아이디
+            concurrency: 동시에 조회할 최대 게시물 통계 수 (기본값: 10)
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: get_user_posts_with_stats 와 같은 구조의 딕셔너리
+
+        Raises:
+            VelogError: 게시물 목록 조회 중 오류가 발생한 경우
+        """
+        return self.service.iter_user_posts_with_stats(username, concurrency)
 
     @classmethod
     def reset_client(cls) -> None:
@@ -287,3 +356,4 @@ class VelogClient:
         cls._access_token = None
         cls._refresh_token = None
         cls._service = None
+        cls._post_cache = None
@@ -0,0 +1,128 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+
+class RequestCoalescer:
+    """
+    같은 GraphQL 요청 합치기 (single-flight) 와 짧은 TTL 메모
+    키(URL, 쿼리, 변수, 토큰)가 같은 요청이 진행 중이면 새로 보내지 않고 진행 중인 요청의 결과를 함께 받고,
+    조회(query) 요청의 결과는 memo_ttl 초 동안 재사용
+    결과 딕셔너리는 여러 호출자가 공유하므로 읽기 전용으로 사용해야 함
+    """
+
+    # 조회 결과를 재사용할 기간 (초)
+    MEMO_TTL = 10.0
+    # 메모할 최대 결과 수, 넘으면 오래된 결과부터 삭제
+    MAX_MEMO_ENTRIES = 1024
+
+    def __init__(
+        self,
+        memo_ttl: float = MEMO_TTL,
+        max_memo_entries: int = MAX_MEMO_ENTRIES,
+    ) -> None:
+        self.memo_ttl = memo_ttl
+        self.max_memo_entries = max_memo_entries
+        self.requests = 0
+        self.coalesced = 0
+        self.memo_hits = 0
+        self._in_flight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._memo: OrderedDict[str, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def make_key(
+        url: str,
+        query: str,
+        variables: dict[str, Any] | None,
+        operation_name: str | None,
+        access_token: str,
+    ) -> str:
+        """요청 키, 토큰에 따라 응답이 다를 수 있으므로 토큰 해시도 포함"""
+        payload = json.dumps(
+            [
+                url,
+                query,
+                variables or {},
+                operation_name,
+                hashlib.sha256(access_token.encode()).hexdigest(),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def is_idempotent(query: str) -> bool:
+        """mutation 이 아닌 GraphQL 조회 요청인지 여부"""
+        return not query.lstrip().startswith("mutation")
+
+    async def run(
+        self,
+        key: str,
+        request: Callable[[], Awaitable[dict[str, Any]]],
+        memoize: bool = True,
+    ) -> dict[str, Any]:
+        """
+        같은 키의 요청을 한 번만 보내고 결과를 함께 받습니다.
+
+        Args:
+            key: make_key 로 만든 요청 키
+            request: 실제 요청을 보내는 함수
+            memoize: 결과를 memo_ttl 동안 재사용할지 여부
+
+        Returns:
+            dict[str, Any]: 요청 결과 (여러 호출자가 공유)
+
+        Raises:
+            요청 중 발생한 예외는 기다리던 모든 호출자에게 전달되며 메모하지 않음
+        """
+        memo = self._memo.get(key)
+        if memo is not None:
+            expires_at, result = memo
+            if expires_at > time.monotonic():
+                self.memo_hits += 1
+                return result
+            del self._memo[key]
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            self.requests += 1
+            future = asyncio.ensure_future(request())
+            self._in_flight[key] = future
+            future.add_done_callback(
+                lambda done: self._on_done(key, done, memoize)
+            )
+
+        # 한 호출자가 취소되어도 같은 요청을 기다리는 다른 호출자를 위해 요청은 계속 진행
+        return await asyncio.shield(future)
+
+    def summary(self) -> str:
+        return (
+            f"requests: {self.requests}, coalesced: {self.coalesced}, "
+            f"memo hits: {self.memo_hits}"
+        )
+
+    def _on_done(
+        self,
+        key: str,
+        future: asyncio.Future[dict[str, Any]],
+        memoize: bool,
+    ) -> None:
+        self._in_flight.pop(key, None)
+        # 기다리는 호출자가 없어도 예외가 처리되지 않았다는 경고가 나지 않도록 확인
+        if future.cancelled() or future.exception() is not None:
+            return
+        if not memoize or self.memo_ttl <= 0:
+            return
+
+        self._memo[key] = (time.monotonic() + self.memo_ttl, future.result())
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.max_memo_entries:
+            self._memo.popitem(last=False)
@@ -0,0 +1,154 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import AsyncIterator
+
+from scraping.protocols import HttpSession, RateLimiter
+from scraping.velog.cache import PostBodyCache
+from scraping.velog.coalescer import RequestCoalescer
+from scraping.velog.service import VelogService
+
+
+class RequestLimiter:
+    """
+    요청 하나를 감싸는 동시성 제한 (VelogService.request_limiter)
+    사용자별 semaphore 를 먼저 얻고 전체 semaphore 를 얻어서, 한 사용자의 대기 요청이 전체 슬롯을 차지하지 않도록 함
+    여러 요청이 같은 인스턴스로 동시에 async with 를 사용할 수 있음
+    """
+
+    def __init__(
+        self,
+        user_semaphore: asyncio.Semaphore,
+        global_semaphore: asyncio.Semaphore,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self.user_semaphore = user_semaphore
+        self.global_semaphore = global_semaphore
+        self.rate_limiter = rate_limiter
+
+    async def __aenter__(self) -> None:
+        await self.user_semaphore.acquire()
+        try:
+            await self.global_semaphore.acquire()
+        except BaseException:
+            self.user_semaphore.release()
+            raise
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+        except BaseException:
+            self.global_semaphore.release()
+            self.user_semaphore.release()
+            raise
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.global_semaphore.release()
+        self.user_semaphore.release()
+
+
+class VelogClientPool:
+    """
+    여러 사용자가 함께 사용하는 Velog 클라이언트 풀
+    VelogClient 는 프로세스 당 토큰 한 쌍만 가지는 싱글톤이라 사용자 단위 동시 스크래핑에 쓸 수 없으므로,
+    하나의 세션(커넥션 풀)을 공유하고 사용자별 토큰만 다른 가벼운 VelogService 를 만들어 사용
+    요청 수는 전체(max_concurrency)와 사용자별(per_user_concurrency)로 제한
+    """
+
+    # 전체 동시 요청 수
+    DEFAULT_MAX_CONCURRENCY = 40
+    # 한 사용자의 동시 요청 수
+    DEFAULT_PER_USER_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        session: HttpSession,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        per_user_concurrency: int = DEFAULT_PER_USER_CONCURRENCY,
+        rate_limiter: RateLimiter | None = None,
+        post_cache: PostBodyCache | None = None,
+    ) -> None:
+        """
+        Args:
+            session: 모든 사용자가 공유할 HTTP 세션 (aiohttp.ClientSession 등)
+            max_concurrency: 전체 동시 요청 수
+            per_user_concurrency: 한 사용자의 동시 요청 수
+            rate_limiter: 모든 요청이 공유할 rate limiter (선택)
+            post_cache: 모든 사용자가 공유할 게시물 상세 캐시 (선택)
+        """
+        self.session = session
+        self.per_user_concurrency = max(1, per_user_concurrency)
+        self.global_semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self.rate_limiter = rate_limiter
+        self.post_cache = post_cache
+        # 같은 요청 합치기는 사용자 간에도 공유 (토큰이 키에 포함되므로 응답이 섞이지 않음)
+        self.coalescer = RequestCoalescer()
+        # 사용자 키 별 요청 제한, 같은 사용자의 서비스는 같은 제한을 공유
+        self._user_limiters: dict[str, RequestLimiter] = {}
+        # 사용자 키 별로 release 되지 않은 서비스 수, 0 이 되면 요청 제한 정리
+        self._user_refs: dict[str, int] = {}
+
+    def get_service(
+        self, user_key: str, access_token: str, refresh_token: str
+    ) -> VelogService:
+        """
+        사용자의 토큰으로 요청하는 VelogService 를 반환합니다.
+        세션, 전체 요청 제한, 캐시, 요청 합치기는 풀과 공유하고 사용자별 요청 제한은 user_key 로 공유합니다.
+        사용이 끝나면 release(user_key) 를 호출해야 합니다. (user_service 는 자동으로 호출)
+
+        Args:
+            user_key: 사용자 구분 키 (velog uuid 등)
+            access_token: 사용자의 Velog 액세스 토큰
+            refresh_token: 사용자의 Velog 리프레시 토큰
+
+        Returns:
+            VelogService: 사용자 전용 서비스 인스턴스
+        """
+        limiter = self._user_limiters.get(user_key)
+        if limiter is None:
+            limiter = RequestLimiter(
+                asyncio.Semaphore(self.per_user_concurrency),
+                self.global_semaphore,
+                self.rate_limiter,
+            )
+            self._user_limiters[user_key] = limiter
+        self._user_refs[user_key] = self._user_refs.get(user_key, 0) + 1
+
+        return VelogService(
+            self.session,
+            access_token,
+            refresh_token,
+            post_cache=self.post_cache,
+            request_limiter=limiter,
+            coalescer=self.coalescer,
+        )
+
+    def release(self, user_key: str) -> None:
+        """
+        get_service 로 받은 서비스 사용이 끝났음을 알립니다.
+        같은 사용자의 서비스가 모두 release 되어야 사용자별 요청 제한을 정리합니다.
+        """
+        refs = self._user_refs.get(user_key, 0) - 1
+        if refs > 0:
+            self._user_refs[user_key] = refs
+            return
+        self._user_refs.pop(user_key, None)
+        self._user_limiters.pop(user_key, None)
+
+    @asynccontextmanager
+    async def user_service(
+        self, user_key: str, access_token: str, refresh_token: str
+    ) -> AsyncIterator[VelogService]:
+        """사용자 처리 동안 사용할 VelogService, 끝나면 release"""
+        try:
+            yield self.get_service(user_key, access_token, refresh_token)
+        finally:
+            self.release(user_key)
+
+    @property
+    def active_users(self) -> int:
+        return len(self._user_limiters)
@@ -1,6 +1,11 @@
-from typing import Any
+import asyncio
+from contextlib import AbstractAsyncContextManager, nullcontext
+from datetime import datetime
+from typing import Any, AsyncIterator
 
 from scraping.protocols import HttpSession
+from scraping.velog.cache import PostBodyCache
+from scraping.velog.coalescer import RequestCoalescer
 from scraping.velog.constants import (
     CURRENT_USER_QUERY,
     GET_POST_QUERY,
@@ -25,15 +30,27 @@ class VelogService:
     VelogClient를 사용하여 도메인 로직 구현
     """
 
+    # 게시물 통계를 동시에 조회할 기본 최대 요청 수
+    STATS_CONCURRENCY = 10
+
     def __init__(
         self,
         session: HttpSession,
         access_token: str,
         refresh_token: str,
+        post_cache: PostBodyCache | None = None,
+        request_limiter: AbstractAsyncContextManager[Any] | None = None,
+        coalescer: RequestCoalescer | None = None,
     ):
         self.session = session
         self.access_token = access_token
         self.refresh_token = refresh_token
+        # 게시물 상세(본문) 캐시, None 이면 항상 요청
+        self.post_cache = post_cache
+        # 요청 하나(응답 본문까지)를 감싸는 동시성 제한, VelogClientPool 에서 사용자별로 설정
+        self.request_limiter = request_limiter
+        # 같은 요청 합치기와 짧은 TTL 메모, VelogClientPool 에서는 모든 사용자가 공유
+        self.coalescer = coalescer or RequestCoalescer()
 
         # API URLs
         self.v3_url = V3_URL
@@ -72,6 +89,8 @@ class VelogService:
     ) -> dict[str, Any]:
         """
         GraphQL 쿼리를 실행합니다.
+        URL, 쿼리, 변수, 토큰이 같은 요청이 진행 중이면 새로 보내지 않고 그 결과를 함께 받으며,
+        조회 결과는 coalescer 의 memo_ttl 동안 재사용합니다. (반환값은 읽기 전용으로 사용)
         Args:
             url: GraphQL 엔드포인트 URL
             query: GraphQL 쿼리 문자열
@@ -90,21 +109,35 @@ class VelogService:
             payload["operationName"] = operation_name
 
         headers = self._get_headers()
-        try:
-            response = await self.session.post(
-                url, json=payload, headers=headers
-            )
-            res_http_status = (
-                response.status
-                if hasattr(response, "status")
-                else response.status_code
-            )
-
-            if res_http_status != 200:
-                error_text = await response.text()
-                raise VelogApiError(res_http_status, error_text)
+        key = RequestCoalescer.make_key(
+            url, query, variables, operation_name, self.access_token
+        )
+        return await self.coalescer.run(
+            key,
+            lambda: self._send_query(url, payload, headers),
+            memoize=RequestCoalescer.is_idempotent(query),
+        )
 
-            result = await response.json()
+    async def _send_query(
+        self, url: str, payload: dict[str, Any], headers: dict[str, str]
+    ) -> dict[str, Any]:
+        """GraphQL 요청을 실제로 보내고 응답의 data 를 반환합니다."""
+        try:
+            async with self.request_limiter or nullcontext():
+                response = await self.session.post(
+                    url, json=payload, headers=headers
+                )
+                res_http_status = (
+                    response.status
+                    if hasattr(response, "status")
+                    else response.status_code
+                )
+
+                if res_http_status != 200:
+                    error_text = await response.text()
+                    raise VelogApiError(res_http_status, error_text)
+
+                result = await response.json()
             data = result.get("data")
             return data if isinstance(data, dict) else {}
         except (VelogApiError, VelogResponseError):
@@ -205,10 +238,49 @@ class VelogService:
             for post in response["posts"]
         ]
 
+    async def iter_posts(
+        self, username: str, max_pages: int = 100
+    ) -> AsyncIterator[list[Post]]:
+        """
+        사용자의 게시물을 페이지 단위로 반환합니다.
+        페이지를 반환하기 전에 다음 페이지를 미리 요청하므로, 호출자가 현재 페이지를 처리하는 동안
+        다음 페이지를 받아오며 메모리에는 한 번에 한두 페이지만 유지됩니다.
+
+        Args:
+            username: 사용자 아이디
+            max_pages: 최대 페이지 수 (기본값: 100, 페이지 당 50개)
+
+        Yields:
+            list[Post]: 한 페이지의 게시물 객체 리스트
+
+        Raises:
+            VelogError: API 요청 중 오류가 발생한 경우
+        """
+        if max_pages <= 0:
+            return
+
+        next_page = asyncio.ensure_future(self.get_posts(username))
+        try:
+            for page in range(1, max_pages + 1):
+                posts = await next_page
+                if not posts:
+                    return
+                has_next = page < max_pages and hasattr(posts[-1], "id")
+                if has_next:
+                    next_page = asyncio.ensure_future(
+                        self.get_posts(username, posts[-1].id)
+                    )
+                yield posts
+                if not has_next:
+                    return
+        finally:
+            # 호출자가 중간에 반복을 멈추면 미리 요청한 페이지는 취소
+            next_page.cancel()
+
     async def get_all_posts(self, username: str) -> list[Post]:
         """
         사용자의 모든 게시물을 조회합니다.
-        페이지네이션을 자동으로 처리하여 모든 게시물을 가져옵니다.
+        페이지네이션을 자동으로 처리하여 모든 게시물을 가져옵니다. (iter_posts 의 모든 페이지를 합침)
 
         Args:
             username: 사용자 아이디
@@ -219,26 +291,10 @@ class VelogService:
         Raises:
             VelogError: API 요청 중 오류가 발생한 경우
         """
-        cursor = ""
         all_posts = []
-        max_iterations = 100  # 안전장치, 누가 게시글 5000개를 쓰겠어?!
-
-        while True:
-            if max_iterations <= 0:
-                break
-
-            posts = await self.get_posts(username, cursor)
-            max_iterations -= 1
-            if not posts:
-                break
-
+        # 안전장치, 누가 게시글 5000개를 쓰겠어?!
+        async for posts in self.iter_posts(username, max_pages=100):
             all_posts.extend(posts)
-
-            if posts and hasattr(posts[-1], "id"):
-                cursor = posts[-1].id
-            else:
-                break
-
         return all_posts
 
     async def get_post_stats(self, post_id: str) -> PostStats | None:
@@ -270,12 +326,20 @@ class VelogService:
             views=stats_data.get("views", 0),
         )
 
-    async def get_post(self, post_uuid: str) -> Post | None:
+    async def get_post(
+        self,
+        post_uuid: str,
+        updated_at: str | None = None,
+        changed_at: datetime | None = None,
+    ) -> Post | None:
         """
         특정 게시물의 상세 정보를 조회합니다.
+        post_cache 가 있으면 캐시된 게시물을 먼저 확인하고, 조회한 게시물은 캐시에 저장합니다.
 
         Args:
             post_uuid: 게시물 ID (UUID 형식)
+            updated_at: 게시물 목록에서 알고 있는 수정 시간, 캐시된 게시물과 다르면 다시 조회
+            changed_at: DB 에 기록된 게시글의 마지막 변경 시간, 캐시가 이보다 오래됐으면 다시 조회
 
         Returns:
             Post | None: 게시물 상세 정보 객체, 조회 실패 시 None
@@ -283,6 +347,13 @@ class VelogService:
         Raises:
             VelogError: API 요청 중 오류가 발생한 경우
         """
+        if self.post_cache is not None:
+            cached_post = self.post_cache.get(
+                post_uuid, updated_at, changed_at
+            )
+            if cached_post is not None:
+                return cached_post
+
         variables = {"id": post_uuid}
 
         response = await self._execute_query(
@@ -293,7 +364,7 @@ class VelogService:
             return None
 
         post_data = response["post"]
-        return Post(
+        post = Post(
             id=post_data.get("id", ""),
             title=post_data.get("title", ""),
             short_description=post_data.get("short_description", ""),
@@ -317,6 +388,9 @@ class VelogService:
             comments_count=post_data.get("comments_count", 0),
             liked=post_data.get("liked", False),
         )
+        if self.post_cache is not None:
+            self.post_cache.set(post)
+        return post
 
     async def get_trending_posts(
         self, limit: int = 20, offset: int = 0, timeframe: str = "week"
@@ -368,14 +442,48 @@ class VelogService:
             for post in response["trendingPosts"]
         ]
 
+    @staticmethod
+    def _build_post_with_stats(
+        post: Post, stats: PostStats | None
+    ) -> dict[str, Any]:
+        """게시물과 통계 정보를 get_user_posts_with_stats 의 딕셔너리 구조로 변환"""
+        return {
+            "id": post.id,
+            "title": post.title,
+            "short_description": post.short_description,
+            "url_slug": post.url_slug,
+            "released_at": post.released_at,
+            "updated_at": post.updated_at,
+            "stats": {
+                "likes": stats.likes if stats else 0,
+                "views": stats.views if stats else 0,
+            },
+        }
+
+    async def _get_post_with_stats(
+        self, post: Post, semaphore: asyncio.Semaphore
+    ) -> dict[str, Any]:
+        """
+        semaphore 안에서 게시물 통계를 조회합니다.
+        통계 조회에 실패한 게시물은 통계를 0으로 채웁니다.
+        """
+        async with semaphore:
+            try:
+                stats = await self.get_post_stats(post.id)
+            except VelogError:
+                stats = None
+        return self._build_post_with_stats(post, stats)
+
     async def get_user_posts_with_stats(
-        self, username: str
+        self, username: str, concurrency: int = STATS_CONCURRENCY
     ) -> list[dict[str, Any]]:
         """
         사용자의 모든 게시물과 각 게시물의 통계 정보를 함께 조회합니다.
+        게시물 통계는 최대 concurrency 개씩 동시에 조회하며, 결과는 게시물 순서를 유지합니다.
 
         Args:
             username: 사용자 아이디
+            concurrency: 동시에 조회할 최대 게시물 통계 수 (기본값: 10)
 
         Returns:
             list[dict[str, Any]]: 게시물 정보와 통계가 포함된 딕셔너리 리스트
@@ -397,34 +505,41 @@ class VelogService:
             VelogError: API 요청 중 오류가 발생한 경우
         """
         posts = await self.get_all_posts(username)
-        result = []
+        semaphore = asyncio.Semaphore(max(1, concurrency))
 
-        for post in posts:
-            try:
-                stats = await self.get_post_stats(post.id)
-                post_data = {
-                    "id": post.id,
-                    "title": post.title,
-                    "short_description": post.short_description,
-                    "url_slug": post.url_slug,
-                    "released_at": post.released_at,
-                    "updated_at": post.updated_at,
-                    "stats": {
-                        "likes": stats.likes if stats else 0,
-                        "views": stats.views if stats else 0,
-                    },
-                }
-                result.append(post_data)
-            except VelogError:
-                post_data = {
-                    "id": post.id,
-                    "title": post.title,
-                    "short_description": post.short_description,
-                    "url_slug": post.url_slug,
-                    "released_at": post.released_at,
-                    "updated_at": post.updated_at,
-                    "stats": {"likes": 0, "views": 0},
-                }
-                result.append(post_data)
+        return list(
+            await asyncio.gather(
+                *(self._get_post_with_stats(post, semaphore) for post in posts)
+            )
+        )
+
+    async def iter_user_posts_with_stats(
+        self, username: str, concurrency: int = STATS_CONCURRENCY
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        사용자의 모든 게시물과 통계 정보를 조회가 끝나는 순서대로 반환합니다.
+        전체 결과를 기다리지 않고 도착한 게시물부터 처리할 때 사용하며, 순서는 보장하지 않습니다.
+
+        Args:
+            username: 사용자 아이디
+            concurrency: 동시에 조회할 최대 게시물 통계 수 (기본값: 10)
+
+        Yields:
+            dict[str, Any]: get_user_posts_with_stats 와 같은 구조의 딕셔너리
 
-        return result
+        Raises:
+            VelogError: 게시물 목록 조회 중 오류가 발생한 경우
+        """
+        posts = await self.get_all_posts(username)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        tasks = [
+            asyncio.ensure_future(self._get_post_with_stats(post, semaphore))
+            for post in posts
+        ]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            # 호출자가 중간에 반복을 멈추면 남은 통계 요청은 취소
+            for task in tasks:
+                task.cancel()
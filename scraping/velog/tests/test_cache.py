@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from scraping.velog.cache import PostBodyCache
+from scraping.velog.schemas import Post, User
+
+
+def make_post(post_id: str, updated_at: str = "2026-10-01", body: str = ""):
+    return Post(
+        id=post_id,
+        title=f"title {post_id}",
+        short_description="",
+        body=body,
+        updated_at=updated_at,
+        tags=["python"],
+        user=User(id="user-1", username="nuung", email=""),
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    post_cache = PostBodyCache(str(tmp_path / "cache" / "posts.sqlite3"))
+    yield post_cache
+    post_cache.close()
+
+
+class TestPostBodyCache:
+    def test_get_by_updated_at(self, cache):
+        """같은 updated_at 이면 캐시를 사용하고, 바뀌었으면 다시 요청하도록 miss"""
+        post = make_post("post-1", body="# 본문")
+        cache.set(post)
+
+        assert cache.get("post-1", "2026-10-01") == post
+        assert cache.get("post-1", "2026-10-02") is None
+        assert cache.get("post-2") is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_get_without_updated_at_uses_max_age(self, tmp_path):
+        """updated_at 없이 조회하면 unversioned_max_age 이내의 캐시만 사용"""
+        cache = PostBodyCache(
+            str(tmp_path / "posts.sqlite3"), unversioned_max_age=60
+        )
+        with patch("scraping.velog.cache.time.time", return_value=1000.0):
+            cache.set(make_post("post-1"))
+        with patch("scraping.velog.cache.time.time", return_value=1050.0):
+            assert cache.get("post-1") is not None
+        with patch("scraping.velog.cache.time.time", return_value=1100.0):
+            assert cache.get("post-1") is None
+        cache.close()
+
+    def test_get_by_changed_at(self, cache):
+        """DB 에 기록된 변경 시간 이후에 저장된 캐시만 사용"""
+        with patch("scraping.velog.cache.time.time", return_value=1000.0):
+            cache.set(make_post("post-1"))
+
+        changed_before = datetime.fromtimestamp(900, tz=timezone.utc)
+        changed_after = datetime.fromtimestamp(1100, tz=timezone.utc)
+        assert cache.get("post-1", changed_at=changed_before) is not None
+        assert cache.get("post-1", changed_at=changed_after) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        """재실행(새 인스턴스)에서도 저장된 게시물을 사용"""
+        path = str(tmp_path / "posts.sqlite3")
+        first = PostBodyCache(path)
+        first.set(make_post("post-1", body="본문"))
+        first.close()
+
+        second = PostBodyCache(path)
+        assert second.get("post-1", "2026-10-01").body == "본문"
+        second.close()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """크기 합이 max_bytes 를 넘으면 가장 오래 사용하지 않은 게시물부터 삭제"""
+        cache = PostBodyCache(str(tmp_path / "posts.sqlite3"), max_bytes=2000)
+        with patch("scraping.velog.cache.time.time", side_effect=range(1, 10)):
+            cache.set(make_post("post-1", body="a" * 500))
+            cache.set(make_post("post-2", body="b" * 500))
+            # post-1 을 사용해서 post-2 가 가장 오래 사용하지 않은 게시물이 됨
+            assert cache.get("post-1", "2026-10-01") is not None
+            cache.set(make_post("post-3", body="c" * 500))
+
+        assert cache.evictions == 1
+        assert cache.get("post-2", "2026-10-01") is None
+        assert cache.get("post-1", "2026-10-01") is not None
+        assert cache.get("post-3", "2026-10-01") is not None
+        cache.close()
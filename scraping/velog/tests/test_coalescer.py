@@ -0,0 +1,113 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from scraping.velog.coalescer import RequestCoalescer
+
+
+class TestRequestCoalescer:
+    def test_make_key(self):
+        """변수 순서와 상관없이 같은 키, 토큰이 다르면 다른 키"""
+        key = RequestCoalescer.make_key(
+            "url", "query", {"a": 1, "b": 2}, None, "token-1"
+        )
+
+        assert key == RequestCoalescer.make_key(
+            "url", "query", {"b": 2, "a": 1}, None, "token-1"
+        )
+        assert key != RequestCoalescer.make_key(
+            "url", "query", {"a": 1, "b": 2}, None, "token-2"
+        )
+        assert RequestCoalescer.is_idempotent("\n query GetStats { }")
+        assert not RequestCoalescer.is_idempotent("mutation Logout { }")
+
+    @pytest.mark.asyncio
+    async def test_coalesces_in_flight_requests(self):
+        """진행 중인 같은 요청은 한 번만 보내고 결과를 함께 받는지 테스트"""
+        coalescer = RequestCoalescer()
+
+        async def send():
+            await asyncio.sleep(0.01)
+            return {"views": 1}
+
+        request = AsyncMock(side_effect=send)
+        results = await asyncio.gather(
+            *(coalescer.run("key", request) for _ in range(5))
+        )
+
+        assert request.await_count == 1
+        assert all(result == {"views": 1} for result in results)
+        assert (coalescer.requests, coalescer.coalesced) == (1, 4)
+
+    @pytest.mark.asyncio
+    async def test_memo_ttl(self):
+        """조회 결과는 memo_ttl 동안만 재사용하는지 테스트"""
+        coalescer = RequestCoalescer(memo_ttl=10)
+        request = AsyncMock(return_value={"views": 1})
+
+        with patch(
+            "scraping.velog.coalescer.time.monotonic", return_value=100.0
+        ):
+            await coalescer.run("key", request)
+            await coalescer.run("key", request)
+            # mutation 등 메모하지 않는 요청
+            await coalescer.run("other", request, memoize=False)
+            await coalescer.run("other", request, memoize=False)
+        with patch(
+            "scraping.velog.coalescer.time.monotonic", return_value=111.0
+        ):
+            await coalescer.run("key", request)
+
+        assert request.await_count == 4
+        assert coalescer.memo_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_and_not_memoized(self):
+        """실패한 요청은 기다리던 모든 호출자에게 전달되고 메모하지 않는지 테스트"""
+        coalescer = RequestCoalescer()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        request = AsyncMock(side_effect=fail)
+        results = await asyncio.gather(
+            coalescer.run("key", request),
+            coalescer.run("key", request),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        request.side_effect = None
+        request.return_value = {"views": 1}
+        assert await coalescer.run("key", request) == {"views": 1}
+        assert request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        coalescer = RequestCoalescer()
+
+        async def send():
+            await asyncio.sleep(0.01)
+            return {"views": 1}
+
+        request = AsyncMock(side_effect=send)
+        first = asyncio.ensure_future(coalescer.run("key", request))
+        second = asyncio.ensure_future(coalescer.run("key", request))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == {"views": 1}
+        assert first.cancelled()
+
+    def test_memo_is_bounded(self):
+        coalescer = RequestCoalescer(max_memo_entries=2)
+
+        async def run_all():
+            for key in ["a", "b", "c"]:
+                await coalescer.run(key, AsyncMock(return_value={}))
+
+        asyncio.run(run_all())
+
+        assert list(coalescer._memo) == ["b", "c"]
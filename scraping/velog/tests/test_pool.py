@@ -0,0 +1,117 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from scraping.velog.pool import VelogClientPool
+
+
+class FakeResponse:
+    status = 200
+
+    async def json(self):
+        return {"data": {"getStats": {"id": "post", "likes": 1, "views": 1}}}
+
+    async def text(self):
+        return ""
+
+
+class FakeSession:
+    """동시에 진행 중인 요청 수를 사용자(쿠키) 별로 기록하는 세션"""
+
+    def __init__(self):
+        self.in_flight: dict[str, int] = {}
+        self.max_in_flight: dict[str, int] = {}
+        self.max_total = 0
+
+    async def post(self, url, json=None, headers=None, cookies=None):
+        user = headers["cookie"]
+        self.in_flight[user] = self.in_flight.get(user, 0) + 1
+        self.max_in_flight[user] = max(
+            self.max_in_flight.get(user, 0), self.in_flight[user]
+        )
+        self.max_total = max(self.max_total, sum(self.in_flight.values()))
+        await asyncio.sleep(0.01)
+        self.in_flight[user] -= 1
+        return FakeResponse()
+
+
+class TestVelogClientPool:
+    @pytest.mark.asyncio
+    async def test_bounds_per_user_and_total(self):
+        """사용자별, 전체 동시 요청 수가 제한되는지 테스트"""
+        session = FakeSession()
+        pool = VelogClientPool(
+            session, max_concurrency=3, per_user_concurrency=2
+        )
+        services = [
+            pool.get_service(f"user-{i}", f"access-{i}", f"refresh-{i}")
+            for i in range(3)
+        ]
+
+        await asyncio.gather(
+            *(
+                service.get_post_stats(f"post-{j}")
+                for service in services
+                for j in range(5)
+            )
+        )
+
+        assert session.max_total == 3
+        assert len(session.max_in_flight) == 3
+        assert all(count <= 2 for count in session.max_in_flight.values())
+
+    @pytest.mark.asyncio
+    async def test_services_share_session_and_user_limit(self):
+        """같은 사용자의 서비스는 요청 제한을 공유하고, 토큰은 사용자별로 분리"""
+        session = MagicMock()
+        cache = MagicMock()
+        pool = VelogClientPool(session, post_cache=cache)
+
+        first = pool.get_service("user-1", "access-1", "refresh-1")
+        second = pool.get_service("user-1", "access-1", "refresh-1")
+        other = pool.get_service("user-2", "access-2", "refresh-2")
+
+        assert first.session is other.session is session
+        assert first.post_cache is cache
+        assert first.request_limiter is second.request_limiter
+        assert first.request_limiter is not other.request_limiter
+        assert other.access_token == "access-2"
+
+    @pytest.mark.asyncio
+    async def test_user_service_releases_limiter(self):
+        pool = VelogClientPool(MagicMock())
+
+        async with pool.user_service("user-1", "access", "refresh"):
+            assert pool.active_users == 1
+
+        assert pool.active_users == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_is_shared(self):
+        rate_limiter = MagicMock(acquire=AsyncMock())
+        pool = VelogClientPool(FakeSession(), rate_limiter=rate_limiter)
+
+        await pool.get_service("user-1", "a", "r").get_post_stats("post-1")
+        await pool.get_service("user-2", "a", "r").get_post_stats("post-2")
+
+        assert rate_limiter.acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_overlapping_user_services_keep_limiter(self):
+        """같은 사용자의 user_service 가 겹치면 모두 끝날 때까지 요청 제한을 유지하는지 테스트"""
+        pool = VelogClientPool(MagicMock())
+
+        async with pool.user_service("user-1", "access", "refresh") as first:
+            async with pool.user_service(
+                "user-1", "access", "refresh"
+            ) as second:
+                assert first.request_limiter is second.request_limiter
+
+            # 먼저 끝난 context 가 아직 사용 중인 요청 제한을 정리하지 않음
+            assert pool.active_users == 1
+            third = pool.get_service("user-1", "access", "refresh")
+            assert third.request_limiter is first.request_limiter
+            pool.release("user-1")
+
+        assert pool.active_users == 0
@@ -0,0 +1,206 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from scraping.velog.cache import PostBodyCache
+from scraping.velog.exceptions import VelogError
+from scraping.velog.schemas import Post, PostStats
+from scraping.velog.service import VelogService
+
+
+@pytest.fixture
+def service():
+    return VelogService(MagicMock(), "access-token", "refresh-token")
+
+
+@pytest.fixture
+def posts():
+    return [
+        Post(id=f"post-{i}", title=f"title {i}", short_description="")
+        for i in range(6)
+    ]
+
+
+class TestUserPostsWithStats:
+    @pytest.mark.asyncio
+    async def test_bounded_fan_out_keeps_order(self, service, posts):
+        """통계를 최대 concurrency 개씩 동시에 조회하고 게시물 순서를 유지하는지 테스트"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_post_stats(post_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # 뒤쪽 게시물이 먼저 끝나도록 지연
+            await asyncio.sleep(0.01 * (10 - int(post_id.split("-")[1])))
+            in_flight -= 1
+            if post_id == "post-2":
+                raise VelogError("boom")
+            return PostStats(id=post_id, likes=1, views=int(post_id[-1]))
+
+        with (
+            patch.object(
+                service, "get_all_posts", AsyncMock(return_value=posts)
+            ),
+            patch.object(
+                service, "get_post_stats", side_effect=get_post_stats
+            ),
+        ):
+            result = await service.get_user_posts_with_stats(
+                "nuung", concurrency=3
+            )
+
+        assert max_in_flight == 3
+        assert [post["id"] for post in result] == [post.id for post in posts]
+        # 통계 조회에 실패한 게시물은 0으로 채움
+        assert result[2]["stats"] == {"likes": 0, "views": 0}
+        assert result[5]["stats"] == {"likes": 1, "views": 5}
+
+    @pytest.mark.asyncio
+    async def test_iter_yields_as_completed(self, service, posts):
+        """조회가 끝난 게시물부터 반환하는지 테스트"""
+
+        async def get_post_stats(post_id):
+            await asyncio.sleep(0.01 * (10 - int(post_id.split("-")[1])))
+            return PostStats(id=post_id, likes=1, views=1)
+
+        with (
+            patch.object(
+                service, "get_all_posts", AsyncMock(return_value=posts)
+            ),
+            patch.object(
+                service, "get_post_stats", side_effect=get_post_stats
+            ),
+        ):
+            result = [
+                post
+                async for post in service.iter_user_posts_with_stats(
+                    "nuung", concurrency=len(posts)
+                )
+            ]
+
+        assert [post["id"] for post in result] == [
+            post.id for post in reversed(posts)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_iter_cancels_remaining_on_break(self, service, posts):
+        """반복을 중간에 멈추면 남은 통계 요청이 취소되는지 테스트"""
+        completed = []
+
+        async def get_post_stats(post_id):
+            await asyncio.sleep(0 if post_id == "post-0" else 1)
+            completed.append(post_id)
+            return PostStats(id=post_id, likes=1, views=1)
+
+        with (
+            patch.object(
+                service, "get_all_posts", AsyncMock(return_value=posts)
+            ),
+            patch.object(
+                service, "get_post_stats", side_effect=get_post_stats
+            ),
+        ):
+            iterator = service.iter_user_posts_with_stats("nuung")
+            async for post in iterator:
+                assert post["id"] == "post-0"
+                break
+            await iterator.aclose()
+            await asyncio.sleep(0)
+
+        assert completed == ["post-0"]
+
+
+class TestIterPosts:
+    @pytest.mark.asyncio
+    async def test_iter_posts_yields_pages(self, service, posts):
+        """페이지 단위로 반환하고 빈 페이지에서 멈추는지 테스트"""
+        pages = [posts[:3], posts[3:], []]
+
+        with patch.object(
+            service, "get_posts", AsyncMock(side_effect=pages)
+        ) as mock_get_posts:
+            result = [page async for page in service.iter_posts("nuung")]
+
+        assert result == pages[:2]
+        assert mock_get_posts.call_args_list[1].args == ("nuung", "post-2")
+
+    @pytest.mark.asyncio
+    async def test_iter_posts_prefetches_next_page(self, service, posts):
+        """페이지를 반환하기 전에 다음 페이지를 미리 요청하는지 테스트"""
+        with patch.object(
+            service,
+            "get_posts",
+            AsyncMock(side_effect=[posts[:3], posts[3:], []]),
+        ) as mock_get_posts:
+            iterator = service.iter_posts("nuung")
+            await anext(iterator)
+            await asyncio.sleep(0)
+            assert mock_get_posts.call_count == 2
+            await iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_iter_posts_respects_max_pages(self, service, posts):
+        with patch.object(
+            service, "get_posts", AsyncMock(return_value=posts)
+        ) as mock_get_posts:
+            result = [
+                page async for page in service.iter_posts("nuung", max_pages=2)
+            ]
+
+        assert len(result) == 2
+        assert mock_get_posts.call_count == 2
+
+
+class TestGetPostCache:
+    @pytest.mark.asyncio
+    async def test_get_post_uses_cache(self, service, tmp_path):
+        """캐시된 게시물은 다시 요청하지 않고, 수정된 게시물만 다시 요청"""
+        service.post_cache = PostBodyCache(str(tmp_path / "posts.sqlite3"))
+        response = {
+            "post": {
+                "id": "post-1",
+                "title": "title",
+                "body": "본문",
+                "updated_at": "2026-10-01",
+                "user": {"id": "user-1", "username": "nuung"},
+            }
+        }
+
+        with patch.object(
+            service, "_execute_query", AsyncMock(return_value=response)
+        ) as mock_execute_query:
+            first = await service.get_post("post-1", "2026-10-01")
+            cached = await service.get_post("post-1", "2026-10-01")
+            unversioned = await service.get_post("post-1")
+            await service.get_post("post-1", "2026-10-02")
+
+        assert first == cached == unversioned
+        assert cached.body == "본문"
+        assert mock_execute_query.call_count == 2
+        service.post_cache.close()
+
+
+class TestExecuteQueryCoalescing:
+    @pytest.mark.asyncio
+    async def test_identical_queries_share_one_request(self, service):
+        """같은 게시물 통계를 동시에 여러 번 요청하면 한 번만 보내는지 테스트"""
+
+        async def send_query(url, payload, headers):
+            await asyncio.sleep(0.01)
+            return {"getStats": {"id": "post-1", "likes": 1, "views": 3}}
+
+        with patch.object(
+            service, "_send_query", side_effect=send_query
+        ) as mock_send_query:
+            results = await asyncio.gather(
+                service.get_post_stats("post-1"),
+                service.get_post_stats("post-1"),
+                service.get_post_stats("post-2"),
+            )
+
+        assert mock_send_query.call_count == 2
+        assert results[0] == results[1]
+        assert results[0].views == 3
@@ -0,0 +1,154 @@
+import logging
+import uuid
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.db.models import F, Q
+
+from scraping.models import ScrapeJob
+from utils.utils import get_local_now
+
+logger = logging.getLogger("scraping")
+
+
+class ScrapeJobQueue:
+    """
+    ScrapeJob 테이블 기반 작업 큐
+    여러 호스트의 워커가 SELECT ... FOR UPDATE SKIP LOCKED 로 서로 겹치지 않게 작업을 가져가며,
+    lease 가 만료된 작업(워커 비정상 종료 등)은 다음 claim 때 자동으로 다시 가져감
+    """
+
+    def __init__(
+        self,
+        worker_id: str,
+        lease_seconds: int = 600,
+        max_attempts: int = 3,
+    ) -> None:
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    @staticmethod
+    def enqueue_users(user_ids: list[int]) -> uuid.UUID:
+        """사용자 단위 작업 등록, 이미 대기 중이거나 진행 중인 사용자는 건너뜀"""
+        run_id = uuid.uuid4()
+        active_user_ids = set(
+            ScrapeJob.objects.filter(
+                user_id__in=user_ids,
+                status__in=[
+                    ScrapeJob.Status.PENDING,
+                    ScrapeJob.Status.RUNNING,
+                ],
+            ).values_list("user_id", flat=True)
+        )
+        jobs = [
+            ScrapeJob(run_id=run_id, user_id=user_id)
+            for user_id in dict.fromkeys(user_ids)
+            if user_id not in active_user_ids
+        ]
+        ScrapeJob.objects.bulk_create(jobs, batch_size=1000)
+
+        logger.info(
+            f"Enqueued {len(jobs)} scrape jobs "
+            f"(run_id: {run_id}, skipped: {len(user_ids) - len(jobs)})"
+        )
+        return run_id
+
+    def claim(self, limit: int = 1) -> list[ScrapeJob]:
+        """대기 중이거나 lease 가 만료된 작업을 최대 limit 개 가져감"""
+        now = get_local_now()
+        with transaction.atomic():
+            self._fail_exhausted(now)
+            job_ids = list(
+                ScrapeJob.objects.select_for_update(skip_locked=True)
+                .filter(
+                    Q(status=ScrapeJob.Status.PENDING)
+                    | Q(
+                        status=ScrapeJob.Status.RUNNING,
+                        lease_expires_at__lt=now,
+                    )
+                )
+                .order_by("id")
+                .values_list("id", flat=True)[:limit]
+            )
+            if not job_ids:
+                return []
+
+            ScrapeJob.objects.filter(id__in=job_ids).update(
+                status=ScrapeJob.Status.RUNNING,
+                lease_owner=self.worker_id,
+                lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                attempts=F("attempts") + 1,
+                updated_at=now,
+            )
+
+        return list(
+            ScrapeJob.objects.filter(id__in=job_ids)
+            .select_related("user")
+            .order_by("id")
+        )
+
+    def _fail_exhausted(self, now: datetime) -> None:
+        """lease 가 만료됐지만 재시도 횟수를 모두 쓴 작업은 실패 처리"""
+        exhausted_ids = list(
+            ScrapeJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                status=ScrapeJob.Status.RUNNING,
+                lease_expires_at__lt=now,
+                attempts__gte=self.max_attempts,
+            )
+            .values_list("id", flat=True)
+        )
+        if not exhausted_ids:
+            return
+
+        ScrapeJob.objects.filter(id__in=exhausted_ids).update(
+            status=ScrapeJob.Status.FAILED,
+            lease_expires_at=None,
+            finished_at=now,
+            last_error="lease expired",
+            updated_at=now,
+        )
+        logger.warning(
+            f"Marked {len(exhausted_ids)} scrape jobs as failed "
+            f"after {self.max_attempts} expired leases"
+        )
+
+    def renew(self, job: ScrapeJob) -> bool:
+        """작업 처리 중 lease 연장, 다른 워커가 이미 가져간 경우 False"""
+        now = get_local_now()
+        renewed = ScrapeJob.objects.filter(
+            id=job.id,
+            status=ScrapeJob.Status.RUNNING,
+            lease_owner=self.worker_id,
+        ).update(
+            lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+            updated_at=now,
+        )
+        return bool(renewed)
+
+    def complete(self, job: ScrapeJob) -> None:
+        now = get_local_now()
+        ScrapeJob.objects.filter(id=job.id, lease_owner=self.worker_id).update(
+            status=ScrapeJob.Status.DONE,
+            lease_expires_at=None,
+            finished_at=now,
+            last_error="",
+            updated_at=now,
+        )
+
+    def fail(self, job: ScrapeJob, error: str) -> None:
+        """작업 실패 처리, 재시도 횟수가 남았으면 다시 대기 상태로 되돌림"""
+        now = get_local_now()
+        retryable = job.attempts < self.max_attempts
+        ScrapeJob.objects.filter(id=job.id, lease_owner=self.worker_id).update(
+            status=(
+                ScrapeJob.Status.PENDING
+                if retryable
+                else ScrapeJob.Status.FAILED
+            ),
+            lease_expires_at=None,
+            finished_at=None if retryable else now,
+            last_error=error,
+            updated_at=now,
+        )
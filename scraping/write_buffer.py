@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Collection
+
+import sentry_sdk
+
+logger = logging.getLogger("scraping")
+
+# (게시글 UUID 별 (조회수, 좋아요 수), 완료된 사용자 ID) 를 한 트랜잭션으로 기록하는 함수
+StatisticsWriter = Callable[
+    [dict[str, tuple[int, int]], Collection[int]], Awaitable[int]
+]
+
+
+class DailyStatisticsBuffer:
+    """
+    여러 사용자의 게시글 통계 쓰기를 모아 한 번의 트랜잭션으로 기록하는 write-behind 버퍼
+    max_rows 개 이상 쌓이거나 max_interval 초가 지나면 flush 하고, 종료 시 남은 쓰기를 flush
+    사용자의 DONE 체크포인트는 해당 사용자의 통계와 같은 트랜잭션으로 기록되므로,
+    flush 전에 배치가 중단되면 --resume 시 그 사용자는 다시 처리됨
+    """
+
+    def __init__(
+        self,
+        writer: StatisticsWriter,
+        max_rows: int = 5000,
+        max_interval: float = 30.0,
+    ) -> None:
+        self.writer = writer
+        self.max_rows = max(1, max_rows)
+        self.max_interval = max_interval
+        self._pending: dict[int, dict[str, tuple[int, int]]] = {}
+        self._completed: set[int] = set()
+        self._lock = asyncio.Lock()
+        self._last_flushed_at = time.monotonic()
+        self.flush_count = 0
+        self.failed_user_ids: set[int] = set()
+
+    @property
+    def pending_rows(self) -> int:
+        return sum(len(counts) for counts in self._pending.values())
+
+    async def add(
+        self, user_id: int, counts_by_post_uuid: dict[str, tuple[int, int]]
+    ) -> None:
+        """사용자의 게시글 통계를 버퍼에 추가, 임계치를 넘으면 flush"""
+        self._pending.setdefault(user_id, {}).update(counts_by_post_uuid)
+        await self._flush_if_needed()
+
+    async def mark_completed(self, user_id: int) -> None:
+        """사용자 처리 완료, 다음 flush 때 통계와 함께 DONE 체크포인트 기록"""
+        self._pending.setdefault(user_id, {})
+        self._completed.add(user_id)
+        await self._flush_if_needed()
+
+    async def _flush_if_needed(self) -> None:
+        if (
+            self.pending_rows >= self.max_rows
+            or time.monotonic() - self._last_flushed_at >= self.max_interval
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """쌓인 쓰기를 한 트랜잭션으로 기록, 실패하면 사용자 단위로 나눠서 다시 기록"""
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            completed, self._completed = self._completed, set()
+            self._last_flushed_at = time.monotonic()
+            if not pending:
+                return
+
+            merged_counts: dict[str, tuple[int, int]] = {}
+            for counts in pending.values():
+                merged_counts.update(counts)
+
+            try:
+                upserted = await self.writer(merged_counts, completed)
+                self.flush_count += 1
+                logger.info(
+                    f"Flushed {upserted} daily statistics rows "
+                    f"for {len(pending)} users"
+                )
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Failed to flush daily statistics for {len(pending)} users, "
+                    f"retrying per user: {e}"
+                )
+
+            # 한 사용자의 잘못된 데이터가 다른 사용자의 쓰기까지 실패시키지 않도록 격리
+            for user_id, counts in pending.items():
+                try:
+                    await self.writer(
+                        counts, [user_id] if user_id in completed else []
+                    )
+                except Exception as e:
+                    self.failed_user_ids.add(user_id)
+                    logger.error(
+                        f"Failed to flush daily statistics: {e} "
+                        f"(user id: {user_id})"
+                    )
+                    sentry_sdk.capture_exception(e)
+            self.flush_count += 1
@@ -1,13 +1,13 @@
 import logging
 
-from asgiref.sync import async_to_sync
 from django.contrib import admin, messages
 from django.db.models import Count, Prefetch, QuerySet
 from django.http import HttpRequest
 from django.urls import reverse
 from django.utils.html import format_html
 
-from scraping.main import ScraperTargetUser
+from scraping.models import ScrapeJob
+from scraping.work_queue import ScrapeJobQueue
 from users.models import QRLoginToken, User
 
 logger = logging.getLogger(__name__)
@@ -96,34 +96,41 @@ class UserAdmin(admin.ModelAdmin):
         )
 
     @admin.action(
-        description="선택된 사용자 실시간 통계 업데이트 (1명 정도만 진행, 이상 timeout 발생 위험)"
+        description="선택된 사용자 통계 업데이트 (백그라운드 작업 큐로 처리)"
     )
     def update_stats(self, request: HttpRequest, queryset: QuerySet[User]):
         user_pk_list = list(queryset.values_list("pk", flat=True))
         logger.info(
-            f"{request.user} 가 {user_pk_list} 사용자를 실시간 업데이트 시도 했습니다."
+            f"{request.user} 가 {user_pk_list} 사용자를 통계 업데이트 요청 했습니다."
         )
 
-        if len(user_pk_list) >= 3:
-            return self.message_user(
-                request,
-                f"3명 이상의 유저를 선택하지 말아주세요 >> {user_pk_list}",
-                messages.ERROR,
-            )
-
+        # 요청 안에서 바로 스크래핑하지 않고 작업 큐에 등록, 10분마다 실행되는 aggregate_worker
+        # (run-scrape-worker.yaml) 가 처리
         try:
-            # 비동기 함수를 동기적으로 실행
-            async_to_sync(ScraperTargetUser(user_pk_list).run)()
+            run_id = ScrapeJobQueue.enqueue_users(user_pk_list)
         except Exception as e:
             return self.message_user(
                 request,
-                f"실시간 통계 업데이트를 실패했습니다 >> {e}, {e.__class__}",
+                f"통계 업데이트 작업 등록을 실패했습니다 >> {e}, {e.__class__}",
                 messages.ERROR,
             )
 
+        enqueued_count = ScrapeJob.objects.filter(run_id=run_id).count()
+        skipped_count = len(user_pk_list) - enqueued_count
+        url = (
+            reverse("admin:scraping_scrapejob_changelist")
+            + f"?run_id={run_id}"
+        )
         return self.message_user(
             request,
-            f"{len(user_pk_list)} 명의 사용자 통계를 실시간 업데이트 성공했습니다.",
+            format_html(
+                "{} 명의 사용자 통계 업데이트 작업을 등록했습니다. "
+                "(이미 대기 또는 진행 중: {} 명) "
+                '<a href="{}">작업 진행 상황 보기</a>',
+                enqueued_count,
+                skipped_count,
+                url,
+            ),
             messages.SUCCESS,
         )
 
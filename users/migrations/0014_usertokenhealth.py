@@ -0,0 +1,94 @@
+# Generated by Django 5.1.6 on 2026-10-17 04:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0013_user_thumbnail"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserTokenHealth",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="생성 일시"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="수정 일시"
+                    ),
+                ),
+                (
+                    "last_success_at",
+                    models.DateTimeField(
+                        blank=True,
+                        null=True,
+                        verbose_name="마지막 토큰 검증 성공 일시",
+                    ),
+                ),
+                (
+                    "last_failure_at",
+                    models.DateTimeField(
+                        blank=True,
+                        null=True,
+                        verbose_name="마지막 토큰 검증 실패 일시",
+                    ),
+                ),
+                (
+                    "consecutive_failures",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="연속 실패 횟수"
+                    ),
+                ),
+                (
+                    "next_retry_at",
+                    models.DateTimeField(
+                        blank=True,
+                        db_index=True,
+                        help_text="이 시간 전까지는 스크래핑 배치에서 제외됩니다.",
+                        null=True,
+                        verbose_name="다음 재시도 일시",
+                    ),
+                ),
+                (
+                    "failed_token_digest",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="실패한 access token(암호화된 값)의 md5, 토큰이 바뀌면 backoff 를 해제하기 위한 값입니다.",
+                        max_length=32,
+                        verbose_name="실패한 토큰 digest",
+                    ),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="token_health",
+                        to="users.user",
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "사용자 토큰 상태",
+                "verbose_name_plural": "사용자 토큰 상태 목록",
+            },
+        ),
+    ]
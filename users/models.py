@@ -1,5 +1,9 @@
+import hashlib
+from datetime import timedelta
+
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import MD5
 from django.utils import timezone
 from django.utils.timezone import now
 
@@ -114,3 +118,75 @@ class QRLoginToken(models.Model):  # type: ignore
     def is_valid(self) -> bool:
         """QR 코드가 유효한지 확인"""
         return not self.is_used and self.expires_at > now()
+
+
+class UserTokenHealth(TimeStampedModel):
+    """
+    스크래핑 배치가 기록하는 사용자 velog 토큰 상태
+    토큰 검증에 연속으로 실패하면 next_retry_at 까지 스크래핑 대상에서 제외(backoff)
+    사용자가 다시 로그인해 토큰이 바뀌면 backoff 는 바로 해제됨
+    """
+
+    # 연속 실패 횟수에 따라 12시간, 1일, 2일, ... 최대 7일까지 대기
+    BACKOFF_BASE = timedelta(hours=12)
+    BACKOFF_MAX = timedelta(days=7)
+
+    user = models.OneToOneField(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="token_health",
+        verbose_name="사용자",
+    )
+    last_success_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="마지막 토큰 검증 성공 일시"
+    )
+    last_failure_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="마지막 토큰 검증 실패 일시"
+    )
+    consecutive_failures = models.PositiveIntegerField(
+        default=0, verbose_name="연속 실패 횟수"
+    )
+    next_retry_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="이 시간 전까지는 스크래핑 배치에서 제외됩니다.",
+        verbose_name="다음 재시도 일시",
+    )
+    failed_token_digest = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        help_text="실패한 access token(암호화된 값)의 md5, 토큰이 바뀌면 backoff 를 해제하기 위한 값입니다.",
+        verbose_name="실패한 토큰 digest",
+    )
+
+    class Meta:
+        verbose_name = "사용자 토큰 상태"
+        verbose_name_plural = "사용자 토큰 상태 목록"
+
+    def __str__(self) -> str:
+        return f"{self.user_id} (failures: {self.consecutive_failures})"
+
+    @classmethod
+    def backoff_delay(cls, consecutive_failures: int) -> timedelta:
+        delay: timedelta = cls.BACKOFF_BASE * 2 ** max(
+            consecutive_failures - 1, 0
+        )
+        return min(delay, cls.BACKOFF_MAX)
+
+    @staticmethod
+    def token_digest(access_token: str) -> str:
+        """DB 의 MD5(access_token) 과 같은 값"""
+        return hashlib.md5(access_token.encode()).hexdigest()
+
+    @staticmethod
+    def in_backoff_q() -> models.Q:
+        """
+        backoff 중인 사용자 조건, User queryset 의 exclude 에 사용
+        실패했던 토큰이 지금 저장된 토큰과 같을 때만 backoff 로 판단
+        """
+        return models.Q(
+            token_health__next_retry_at__gt=now(),
+            token_health__failed_token_digest=MD5("access_token"),
+        )
@@ -1,8 +1,10 @@
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from scraping.models import ScrapeJob
+from scraping.work_queue import ScrapeJobQueue
 from users.models import User
 
 
@@ -63,37 +65,29 @@ class TestUserAdmin:
         # 로깅 확인
         mock_logger.assert_called_once()
 
-    @patch("users.admin.ScraperTargetUser")
     def test_update_stats_success(
-        self, mock_scraper, user_admin, user, request_with_messages
+        self, user_admin, user, request_with_messages
     ):
-        mock_scraper_instance = MagicMock()
-        mock_scraper.return_value = mock_scraper_instance
-        mock_scraper_instance.run = AsyncMock()
-
         queryset = User.objects.filter(pk=user.pk)
         user_admin.update_stats(request_with_messages, queryset)
 
-        # Scraper 호출 확인
-        mock_scraper.assert_called_once_with([user.pk])
-        mock_scraper_instance.run.assert_called_once()
+        # 작업 큐 등록 확인
+        job = ScrapeJob.objects.get(user=user)
+        assert job.status == ScrapeJob.Status.PENDING
 
-        # 메시지 확인
+        # 메시지 확인 (작업 상태 페이지 링크 포함)
         messages_list = [m.message for m in request_with_messages._messages]
-        assert (
-            "1 명의 사용자 통계를 실시간 업데이트 성공했습니다."
-            in messages_list
+        assert any(
+            "1 명의 사용자 통계 업데이트 작업을 등록했습니다." in msg
+            and f"?run_id={job.run_id}" in msg
+            for msg in messages_list
         )
 
-    @patch("users.admin.ScraperTargetUser")
+    @patch("users.admin.ScrapeJobQueue.enqueue_users")
     def test_update_stats_failure(
-        self, mock_scraper, user_admin, user, request_with_messages
+        self, mock_enqueue, user_admin, user, request_with_messages
     ):
-        mock_scraper_instance = MagicMock()
-        mock_scraper.return_value = mock_scraper_instance
-        mock_scraper_instance.run = AsyncMock(
-            side_effect=Exception("Test error")
-        )
+        mock_enqueue.side_effect = Exception("Test error")
 
         queryset = User.objects.filter(pk=user.pk)
         user_admin.update_stats(request_with_messages, queryset)
@@ -101,13 +95,12 @@ class TestUserAdmin:
         # 메시지 확인 (에러 발생 시)
         messages_list = [m.message for m in request_with_messages._messages]
         assert any(
-            "실시간 통계 업데이트를 실패했습니다" in msg
+            "통계 업데이트 작업 등록을 실패했습니다" in msg
             for msg in messages_list
         )
 
-    @patch("users.admin.ScraperTargetUser")
-    def test_update_stats_more_than_three_users(
-        self, mock_scraper, user_admin, request_with_messages
+    def test_update_stats_many_users(
+        self, user_admin, user, request_with_messages
     ):
         users = [
             User.objects.create(
@@ -118,18 +111,21 @@ class TestUserAdmin:
                 email=f"user{i}@example.com",
                 is_active=True,
             )
-            for i in range(3)
+            for i in range(5)
         ]
+        # 이미 대기 중인 사용자는 다시 등록하지 않음
+        ScrapeJobQueue.enqueue_users([user.pk])
 
-        queryset = User.objects.filter(pk__in=[user.pk for user in users])
+        queryset = User.objects.filter(
+            pk__in=[user.pk] + [u.pk for u in users]
+        )
         user_admin.update_stats(request_with_messages, queryset)
 
-        # Scraper가 호출되지 않았는지 확인
-        mock_scraper.assert_not_called()
+        assert ScrapeJob.objects.count() == 6
 
-        # 메시지 확인 (3명 초과 선택 시 오류)
         messages_list = [m.message for m in request_with_messages._messages]
         assert any(
-            "3명 이상의 유저를 선택하지 말아주세요" in msg
+            "5 명의 사용자 통계 업데이트 작업을 등록했습니다." in msg
+            and "이미 대기 또는 진행 중: 1 명" in msg
             for msg in messages_list
         )
@@ -0,0 +1,68 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.utils.timezone import now
+
+from users.models import User, UserTokenHealth
+
+
+@pytest.mark.django_db
+class TestUserTokenHealth:
+    def test_backoff_delay(self):
+        """연속 실패 횟수에 따라 대기 시간이 늘어나고 최대 7일인지 테스트"""
+        assert UserTokenHealth.backoff_delay(1) == timedelta(hours=12)
+        assert UserTokenHealth.backoff_delay(2) == timedelta(days=1)
+        assert UserTokenHealth.backoff_delay(3) == timedelta(days=2)
+        assert UserTokenHealth.backoff_delay(10) == timedelta(days=7)
+
+    def test_in_backoff_q(self, user):
+        """backoff 중인 사용자만 SQL 에서 제외되는지 테스트"""
+        other_user = User.objects.create(
+            velog_uuid=uuid.uuid4(),
+            access_token="other-access-token",
+            refresh_token="other-refresh-token",
+            group_id=1,
+        )
+        UserTokenHealth.objects.create(
+            user=user,
+            consecutive_failures=1,
+            next_retry_at=now() + timedelta(hours=12),
+            failed_token_digest=UserTokenHealth.token_digest(
+                user.access_token
+            ),
+        )
+        # backoff 시간이 지난 사용자는 다시 대상
+        UserTokenHealth.objects.create(
+            user=other_user,
+            consecutive_failures=1,
+            next_retry_at=now() - timedelta(minutes=1),
+            failed_token_digest=UserTokenHealth.token_digest(
+                other_user.access_token
+            ),
+        )
+
+        users = User.objects.filter(id__in=[user.id, other_user.id]).exclude(
+            UserTokenHealth.in_backoff_q()
+        )
+
+        assert list(users) == [other_user]
+
+    def test_in_backoff_q_released_by_new_token(self, user):
+        """다시 로그인해 토큰이 바뀌면 backoff 가 해제되는지 테스트"""
+        UserTokenHealth.objects.create(
+            user=user,
+            consecutive_failures=3,
+            next_retry_at=now() + timedelta(days=2),
+            failed_token_digest=UserTokenHealth.token_digest(
+                user.access_token
+            ),
+        )
+        user.access_token = "new-access-token"
+        user.save()
+
+        users = User.objects.filter(id=user.id).exclude(
+            UserTokenHealth.in_backoff_q()
+        )
+
+        assert list(users) == [user]
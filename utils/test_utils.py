@@ -0,0 +1,21 @@
+from utils.utils import split_weighted
+
+
+class TestSplitWeighted:
+    def test_balances_weights(self):
+        """가중치 합이 균등하게 나뉘는지 테스트"""
+        items = ["a", "b", "c", "d", "e", "f"]
+        weights = [1000, 10, 400, 300, 250, 40]
+
+        bins = split_weighted(items, weights, 2)
+
+        weight_of = dict(zip(items, weights))
+        totals = sorted(sum(weight_of[item] for item in b) for b in bins)
+        assert totals == [1000, 1000]
+        assert sorted(item for b in bins for item in b) == items
+
+    def test_more_splits_than_items(self):
+        """항목보다 분할 수가 많으면 빈 서브 리스트가 생기는지 테스트"""
+        bins = split_weighted([1, 2], [5, 3], 3)
+
+        assert bins == [[1], [2], []]
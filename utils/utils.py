@@ -1,3 +1,4 @@
+import heapq
 import json
 import random
 import re
@@ -70,6 +71,24 @@ def split_list(lst: list[int], n_splits: int) -> list[list[int]]:
     ]
 
 
+def split_weighted(
+    items: list[T], weights: list[float], n_splits: int
+) -> list[list[T]]:
+    """
+    가중치 합이 대략 균등하도록 items 를 n_splits 개의 서브 리스트로 나눕니다.
+    가중치가 큰 항목부터 합이 가장 작은 서브 리스트에 넣는 LPT 방식입니다.
+    """
+    bins: list[list[T]] = [[] for _ in range(n_splits)]
+    heap = [(0.0, i) for i in range(n_splits)]
+    for weight, item in sorted(
+        zip(weights, items), key=lambda pair: pair[0], reverse=True
+    ):
+        total, index = heapq.heappop(heap)
+        bins[index].append(item)
+        heapq.heappush(heap, (total + weight, index))
+    return bins
+
+
 @no_type_check
 def to_dict(obj: Any) -> Any:
     """재귀적으로 dataclass를 dict로 변환"""